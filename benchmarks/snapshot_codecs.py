@@ -0,0 +1,127 @@
+"""Compare catalog snapshot codecs on a synthetic catalog.
+
+Reports encode time, decode time and encoded size for every snapshot codec,
+with the legacy ``indent=4`` JSON cache as baseline.
+
+Usage:
+    PYTHONPATH=src python benchmarks/snapshot_codecs.py --cards 5000
+"""
+
+import json
+import random
+import timeit
+import argparse
+import datetime
+
+from hazbin_tracker.core.card import Card, catalog_digest, compute_content_hash
+from hazbin_tracker.core.snapshot_codec import SNAPSHOT_CODECS, decode
+from hazbin_tracker.core.storage import CatalogSnapshot
+
+CHARACTERS = ("Alastor", "Angel Dust", "Charlie", "Vaggie", "Husk", "Niffty", "Lucifer")
+RARITIES = ("Common", "Uncommon", "Rare", "Holo", "Secret Rare")
+
+
+def make_catalog(count: int, seed: int = 0) -> list[dict]:
+    """Build card dictionaries shaped like the cached shop products.
+
+    Args:
+        count (int): number of cards
+        seed (int, optional): random seed. Defaults to 0.
+
+    Returns:
+        list[dict]: card dictionaries, newest first
+    """
+    rng = random.Random(seed)
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    products = []
+    for index in range(count):
+        character = rng.choice(CHARACTERS)
+        rarity = rng.choice(RARITIES)
+        published_at = start + datetime.timedelta(hours=index * 3)
+        product = {
+            "id": 8_000_000_000_000 + index,
+            "handle": f"{character.lower().replace(' ', '-')}-{rarity.lower()}-{index}",
+            "title": f"{character} - {rarity} Trading Card #{index}",
+            "published_at": published_at.isoformat(),
+            "updated_at": published_at.isoformat(),
+            "images": [
+                {"src": f"https://cdn.shopify.com/s/files/1/0000/{index}/card.png"}
+            ],
+            "variants": [
+                {
+                    "id": 40_000_000_000_000 + index * 2 + variant,
+                    "available": rng.random() > 0.3,
+                    "price": f"{rng.choice((4.99, 9.99, 24.99)):.2f}",
+                }
+                for variant in range(rng.choice((1, 1, 2)))
+            ],
+        }
+        product["content_hash"] = compute_content_hash(product)
+        products.append(product)
+    cards = [Card.from_dict(product) for product in reversed(products)]
+    return [card.to_dict() for card in cards]
+
+
+def measure(function, repeat: int) -> float:
+    """Get the best wall time of a function.
+
+    Args:
+        function (Callable): function to time
+        repeat (int): number of runs
+
+    Returns:
+        float: best run time in milliseconds
+    """
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=3000, help="catalog size")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    cards = make_catalog(args.cards)
+    snapshot = CatalogSnapshot(
+        last_check_time=datetime.datetime.now(datetime.UTC),
+        cards=[Card.from_dict(card) for card in cards],
+    )
+    snapshot.digest = catalog_digest(snapshot.cards)
+    header = snapshot.summary_header()
+
+    legacy = {"last_check_time": header["last_check_time"], "cards": cards}
+    legacy_data = json.dumps(legacy, indent=4).encode()
+    rows = [
+        (
+            "legacy indent=4",
+            measure(lambda: json.dumps(legacy, indent=4).encode(), args.repeat),
+            measure(lambda: json.loads(legacy_data), args.repeat),
+            len(legacy_data),
+        )
+    ]
+    for name, codec in SNAPSHOT_CODECS.items():
+        data = codec.encode(header, cards)
+        assert decode(data)[1] == cards, f"{name} round trip failed"
+        rows.append(
+            (
+                name,
+                measure(lambda codec=codec: codec.encode(header, cards), args.repeat),
+                measure(lambda data=data: decode(data), args.repeat),
+                len(data),
+            )
+        )
+
+    print(f"{args.cards} cards, best of {args.repeat} runs")
+    print(
+        f"{'codec':<16} {'encode ms':>10} {'decode ms':>10} {'size KB':>10} {'ratio':>7}"
+    )
+    for name, encode_time, decode_time, size in rows:
+        print(
+            f"{name:<16} {encode_time:>10.1f} {decode_time:>10.1f}"
+            f" {size / 1024:>10.1f} {size / len(legacy_data):>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+import sys
+import json
+import bisect
+import hashlib
+import datetime
+
+from .constants import PRODUCT_VARIANT_PROJECTION_FIELDS
+
+_VARIANT_FIELDS = frozenset(PRODUCT_VARIANT_PROJECTION_FIELDS)
+CARD_SUMMARY_FIELDS = ("id", "title", "published_at")
+
+
+def _intern(value):
+    """Intern string values, pass anything else through.
+
+    Args:
+        value (Any): value to intern
+
+    Returns:
+        Any: interned string or the original value
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def compute_content_hash(product: dict) -> str:
+    """Compute a stable hash over the content of a product dictionary.
+
+    Args:
+        product (dict): product dictionary as returned by the scrapper
+
+    Returns:
+        str: hex digest
+    """
+    encoded = json.dumps(product, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def catalog_digest(cards: list["Card"]) -> str | None:
+    """Compute a digest of a whole catalog from its cards' content hashes.
+
+    Args:
+        cards (list[Card]): catalog
+
+    Returns:
+        str | None: hex digest, None if any card has no content hash.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for card_id, content_hash in sorted((card.id, card.content_hash) for card in cards):
+        if content_hash is None:
+            return None
+        hasher.update(f"{card_id}:{content_hash};".encode())
+    return hasher.hexdigest()
+
+
+def _is_projected_images(images) -> bool:
+    """Check whether images are in the projected ``[{"src": url}]`` form.
+
+    Args:
+        images (Any): images value of a product dictionary
+
+    Returns:
+        bool: True if the images can be represented by a single URL
+    """
+    if not isinstance(images, list) or len(images) > 1:
+        return False
+    return all(
+        image.keys() == {"src"} and isinstance(image["src"], str) for image in images
+    )
+
+
+def _is_projected_variants(variants) -> bool:
+    """Check whether variants only carry the projected fields.
+
+    Args:
+        variants (Any): variants value of a product dictionary
+
+    Returns:
+        bool: True if the variants can be stored as plain tuples
+    """
+    return isinstance(variants, list) and all(
+        variant.keys() == _VARIANT_FIELDS for variant in variants
+    )
+
+
+class Card:
+    """Compact trading card record built once from a product dictionary.
+
+    Timestamps are parsed once on creation and repeated strings are interned.
+    Fields outside of the product projection are kept in ``extra`` so a card
+    converts back to the exact cache dictionary it was created from.
+    """
+
+    __slots__ = (
+        "id",
+        "handle",
+        "title",
+        "published_at",
+        "updated_at",
+        "image_url",
+        "variants",
+        "content_hash",
+        "extra",
+    )
+
+    def __init__(
+        self,
+        id: int = None,
+        handle: str = None,
+        title: str = None,
+        published_at: datetime.datetime = None,
+        updated_at: str = None,
+        image_url: str = None,
+        variants: tuple[tuple] = (),
+        content_hash: str = None,
+        extra: dict = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            id (int, optional): product id
+            handle (str, optional): product handle
+            title (str, optional): normalized card title
+            published_at (datetime.datetime, optional): publish time
+            updated_at (str, optional): last update time as ISO string
+            image_url (str, optional): first image URL
+            variants (tuple[tuple], optional): (id, available, price) per variant
+            content_hash (str, optional): hash of the scraped product content
+            extra (dict, optional): fields outside of the projection
+        """
+        self.id = id
+        self.handle = _intern(handle)
+        self.title = _intern(title)
+        self.published_at = published_at
+        self.updated_at = updated_at
+        self.image_url = image_url
+        self.variants = variants
+        self.content_hash = content_hash
+        self.extra = extra
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<Card id={self.id}, title={self.title!r},"
+            f" published_at={self.published_at}>"
+        )
+
+    def __eq__(self, other):
+        """Compare cards field by field.
+
+        Args:
+            other (Any): object to compare with
+
+        Returns:
+            bool: True if all fields are equal
+        """
+        if not isinstance(other, Card):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self.__slots__
+        )
+
+    __hash__ = None
+
+    @property
+    def available(self) -> bool:
+        """Get whether any variant of the card is available.
+
+        Returns:
+            bool: availability
+        """
+        return any(variant[1] for variant in self.variants)
+
+    @property
+    def price(self) -> str | None:
+        """Get the price of the first variant.
+
+        Returns:
+            str | None: price string
+        """
+        return self.variants[0][2] if self.variants else None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Card":
+        """Create a card from a product or cache dictionary.
+
+        Args:
+            data (dict): product dictionary
+
+        Returns:
+            Card: card record
+        """
+        extra = {key: value for key, value in data.items() if key not in cls.__slots__}
+        extra.pop("images", None)
+        extra.pop("variants", None)
+
+        images = data.get("images") or []
+        if not _is_projected_images(images):
+            extra["images"] = images
+        image_url = images[0].get("src") if images else None
+
+        variants = data.get("variants") or []
+        if not _is_projected_variants(variants):
+            extra["variants"] = variants
+
+        published_at = data.get("published_at")
+        return cls(
+            id=data.get("id"),
+            handle=data.get("handle"),
+            title=data.get("title"),
+            published_at=(
+                datetime.datetime.fromisoformat(published_at) if published_at else None
+            ),
+            updated_at=data.get("updated_at"),
+            image_url=image_url,
+            variants=tuple(
+                (
+                    variant.get("id"),
+                    variant.get("available"),
+                    _intern(variant.get("price")),
+                )
+                for variant in variants
+            ),
+            content_hash=data.get("content_hash"),
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert the card back to its cache dictionary.
+
+        Returns:
+            dict: product dictionary
+        """
+        data = {
+            "id": self.id,
+            "handle": self.handle,
+            "title": self.title,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "updated_at": self.updated_at,
+            "images": [{"src": self.image_url}] if self.image_url else [],
+            "variants": [
+                dict(zip(PRODUCT_VARIANT_PROJECTION_FIELDS, variant))
+                for variant in self.variants
+            ],
+        }
+        if self.content_hash is not None:
+            data["content_hash"] = self.content_hash
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_summary(self) -> dict:
+        """Convert the card to the summary stored in check history records.
+
+        Returns:
+            dict: card id, title and publish time
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+        }
+
+
+class PublishTimeIndex:
+    """Sorted publish-time index over a list of cards.
+
+    The index is built once per catalog and answers latest-time and time range
+    queries with bisection instead of scanning every card.
+    """
+
+    def __init__(self, cards: list[Card]):
+        """Instance constructor.
+
+        Args:
+            cards (list[Card]): indexed catalog
+        """
+        self.cards = cards
+        ordered = sorted(
+            (card for card in cards if card.published_at is not None),
+            key=lambda card: card.published_at,
+        )
+        self._timestamps = [card.published_at.timestamp() for card in ordered]
+        self._ordered_cards = ordered
+        self._cards_by_id = {card.id: card for card in cards}
+
+    @property
+    def cards_by_id(self) -> dict[int, Card]:
+        """Get indexed cards by product id.
+
+        Returns:
+            dict[int, Card]: cards by id
+        """
+        return self._cards_by_id
+
+    def __len__(self) -> int:
+        """Get number of indexed cards.
+
+        Returns:
+            int: number of cards
+        """
+        return len(self._ordered_cards)
+
+    @property
+    def latest_time(self) -> datetime.datetime | None:
+        """Get the latest publish time.
+
+        Returns:
+            datetime.datetime | None: latest publish time, None if empty
+        """
+        if not self._ordered_cards:
+            return None
+        return self._ordered_cards[-1].published_at
+
+    def latest_cards(self) -> list[Card]:
+        """Get cards published at the latest publish time.
+
+        Returns:
+            list[Card]: latest cards
+        """
+        if not self._timestamps:
+            return []
+        start = bisect.bisect_left(self._timestamps, self._timestamps[-1])
+        return self._ordered_cards[start:]
+
+    def published_between(
+        self,
+        start: datetime.datetime = None,
+        end: datetime.datetime = None,
+    ) -> list[Card]:
+        """Get cards published within a time range, oldest first.
+
+        Args:
+            start (datetime.datetime, optional): inclusive range start.
+                Defaults to None, which means unbounded.
+            end (datetime.datetime, optional): exclusive range end.
+                Defaults to None, which means unbounded.
+
+        Returns:
+            list[Card]: cards published in the range
+        """
+        low = (
+            0
+            if start is None
+            else bisect.bisect_left(self._timestamps, start.timestamp())
+        )
+        high = (
+            len(self._timestamps)
+            if end is None
+            else bisect.bisect_left(self._timestamps, end.timestamp())
+        )
+        return self._ordered_cards[low:high]
+
+    def get(self, card_id: int) -> Card | None:
+        """Get a card by product id.
+
+        Args:
+            card_id (int): product id
+
+        Returns:
+            Card | None: card, None if not in the catalog
+        """
+        return self._cards_by_id.get(card_id)
@@ -1,15 +1,30 @@
 import typing
 import datetime
-import pathlib
-import json
 import requests
 import logging
 
 from PySide6 import QtCore
+from PySide6 import QtNetwork
 from PySide6 import QtWidgets
 
-from .scrapper import get_all_cards
-from .constants import APP_DATA_DIR, CHECK_HISTORY_FILE_PATH
+from .card import Card, PublishTimeIndex, catalog_digest
+from .diff import CheckResult, diff_cards
+from .check_scheduler import CheckScheduler, ScheduledCheck
+from .crawl import CancellationToken, CrawlDeadline, CrawlProgress
+from .check_worker import CheckHandle, CheckOptions, CheckOutcome, CheckWorker
+from .qt_scrapper import QtCardsFetcher
+from .settings import HazbinSettings
+from .storage import CatalogNotFoundError, CatalogSnapshot, create_storage
+from .snapshot_archive import SnapshotArchive
+from .snapshot_codec import get_codec
+from .scrapper import (
+    get_all_cards,
+    get_latest_product,
+    get_new_cards,
+    merge_cards,
+)
+from .http_client import get_http_client
+from .constants import NICE_TIME_FORMAT
 
 if typing.TYPE_CHECKING:
     from ..ui.application import HazbinTrackerApplication
@@ -20,13 +35,15 @@ LOGGER = logging.getLogger(__name__)
 class CardsTracker(QtCore.QObject):
     """Tracker class to monitor Hazbin cards for new releases."""
 
-    TRACK_FILE_NAME = "track_data.json"
-    NICE_TIME_FORMAT = "%d-%m-%Y at %H:%M:%S"
+    NICE_TIME_FORMAT = NICE_TIME_FORMAT
 
     cards_updated = QtCore.Signal()
     check_time_updated = QtCore.Signal()
-    new_cards_found = QtCore.Signal(list)
-    check_completed = QtCore.Signal(list)
+    new_cards_found = QtCore.Signal(object)
+    cards_removed = QtCore.Signal(list)
+    cards_republished = QtCore.Signal(list)
+    cards_modified = QtCore.Signal(list)
+    check_completed = QtCore.Signal(object)
 
     def __repr__(self):
         """Repr override.
@@ -36,8 +53,7 @@ class CardsTracker(QtCore.QObject):
         """
         return (
             f"<CardsTracker last_check_time={self.nice_last_checked_time},"
-            " cards_count="
-            f"{len(self._cards_data) if self._cards_data else 0},"
+            f" cards_count={self.card_count},"
             f" frequency={self.application.settings.tracker_check_minute_frequency} min>"
         )
 
@@ -46,10 +62,36 @@ class CardsTracker(QtCore.QObject):
         super().__init__()
         self._last_check_time = None
         self._cards_data = None
+        self._cached_snapshot: CatalogSnapshot | None = None
+        self._full_cache_write_due = False
+        self._publish_index = None
+        self._catalog_digest = None
+        self._checks_since_full_crawl = 0
+        self._resume_page = None
+        self.unchanged_check_count = 0
+        self.reused_card_count = 0
+        self.probe_count = 0
+        self.probe_escalation_count = 0
 
         # Timer
         self._check_timer = QtCore.QTimer(self)
 
+        # Background checks
+        self._thread_pool = QtCore.QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._check_handles: list[CheckHandle] = []
+        self._network_manager = None
+        self.check_scheduler = CheckScheduler(self.run_check_async, parent=self)
+
+        # Storage
+        self.storage = create_storage(
+            self.application.settings.storage_backend,
+            self.application.settings.snapshot_codec,
+        )
+        self.archive = SnapshotArchive(
+            codec=get_codec(self.application.settings.snapshot_codec)
+        )
+
         # Initial data
         self.populate_cards_data()
         self._create_signals()
@@ -57,24 +99,77 @@ class CardsTracker(QtCore.QObject):
 
     def _create_signals(self):
         """Create signals and connect them."""
-        self._check_timer.timeout.connect(self.run_check)
+        self._check_timer.timeout.connect(self.check_scheduler.request_timer_check)
         self.new_cards_found.connect(self.on_new_cards_found)
         self.application.settings.tracker_frequency_changed.connect(
             self.start_periodic_check_timer
         )
         self.check_completed.connect(self.record_check_result)
+        self.cards_updated.connect(self.invalidate_publish_index)
         LOGGER.info(f"Started tracker: {self}")
 
     @property
     def cards_data(self):
-        """Get cards data."""
+        """Get cards data, parsing cached cards on first access."""
+        self.load_cached_cards()
         return self._cards_data
 
     @cards_data.setter
     def cards_data(self, value):
         self._cards_data = value
+        self._cached_snapshot = None
         self.cards_updated.emit()
 
+    @property
+    def card_count(self) -> int:
+        """Get the number of tracked cards without loading cached cards.
+
+        Returns:
+            int: number of cards
+        """
+        if self._cards_data is None and self._cached_snapshot is not None:
+            return self._cached_snapshot.card_count
+        return len(self._cards_data) if self._cards_data else 0
+
+    def load_cached_cards(self):
+        """Parse cached cards if only their summary was loaded at startup.
+
+        Corrupt cached cards are dropped: the tracker continues with an empty
+        catalog, the next cache write replaces the whole catalog, and a full
+        check revalidates it in the background.
+        """
+        if self._cards_data is None and self._cached_snapshot is not None:
+            try:
+                self._cards_data = self._cached_snapshot.load_cards()
+            except CatalogNotFoundError:
+                LOGGER.exception("Cached cards are corrupt, revalidating the catalog.")
+                self._cards_data = []
+                self._catalog_digest = None
+                self._resume_page = None
+                self._full_cache_write_due = True
+                QtCore.QTimer.singleShot(0, self.revalidate_cards_data)
+            self._cached_snapshot = None
+            LOGGER.debug(f"Loaded {len(self._cards_data)} cached cards")
+
+    def cached_latest_cards(self) -> list[Card] | None:
+        """Get the newest cards from the summary of not yet loaded cached cards.
+
+        Returns:
+            list[Card] | None: cards published at the latest time, None if
+                cards are loaded or the summary may not hold all of them.
+        """
+        if self._cards_data is not None or self._cached_snapshot is None:
+            return None
+        summary = self._cached_snapshot.latest_cards
+        if not summary:
+            return [] if not self._cached_snapshot.card_count else None
+        latest = [
+            card for card in summary if card.published_at == summary[0].published_at
+        ]
+        if len(latest) == len(summary) < self._cached_snapshot.card_count:
+            return None
+        return latest
+
     @property
     def last_check_time(self):
         """Get last check time.
@@ -100,15 +195,6 @@ class CardsTracker(QtCore.QObject):
             return "Never"
         return self.last_check_time.strftime(self.NICE_TIME_FORMAT)
 
-    @property
-    def track_file_path(self) -> pathlib.Path:
-        """Get the path to the track file.
-
-        Returns:
-            pathlib.Path: path to the track file
-        """
-        return APP_DATA_DIR / self.TRACK_FILE_NAME
-
     @property
     def application(self):
         """Get the main application instance.
@@ -126,13 +212,12 @@ class CardsTracker(QtCore.QObject):
         Returns:
             datetime.datetime: latest published card time
         """
+        cached_latest = self.cached_latest_cards()
+        if cached_latest is not None:
+            return cached_latest[0].published_at if cached_latest else None
         if not self.cards_data:
             return None
-        latest_time = max(
-            datetime.datetime.fromisoformat(card["published_at"])
-            for card in self.cards_data
-        )
-        return latest_time
+        return self.publish_index.latest_time
 
     @property
     def nice_latest_publish_time(self) -> str:
@@ -147,26 +232,64 @@ class CardsTracker(QtCore.QObject):
         return latest_time.strftime(self.NICE_TIME_FORMAT)
 
     @property
-    def latest_published_cards(self) -> list[dict]:
+    def latest_published_cards(self) -> list[Card]:
         """Get cards with the latest published time.
 
         Returns:
-            list[dict]: list of cards published at the latest time
+            list[Card]: list of cards published at the latest time
         """
+        cached_latest = self.cached_latest_cards()
+        if cached_latest is not None:
+            return cached_latest
         if not self.cards_data:
             return []
+        return self.publish_index.latest_cards()
 
-        latest_time = self.latest_publish_time
-        if not latest_time:
-            return []
+    @property
+    def publish_index(self) -> PublishTimeIndex:
+        """Get the publish time index of the current cards data.
 
-        latest_cards = [
-            card
-            for card in self.cards_data
-            if datetime.datetime.fromisoformat(card["published_at"]) == latest_time
-        ]
+        The index is built on first access and rebuilt once cards data changes.
+
+        Returns:
+            PublishTimeIndex: publish time index
+        """
+        cards = self.cards_data
+        if self._publish_index is None or self._publish_index.cards is not cards:
+            self._publish_index = PublishTimeIndex(cards or [])
+        return self._publish_index
+
+    def find_card(self, card_id: int) -> Card | None:
+        """Find a card of the current catalog by product id.
+
+        Args:
+            card_id (int): product id
+
+        Returns:
+            Card | None: card, None if not in the catalog
+        """
+        return self.publish_index.get(card_id)
+
+    @QtCore.Slot()
+    def invalidate_publish_index(self):
+        """Drop the publish time index so it's rebuilt on next access."""
+        self._publish_index = None
+
+    def cards_published_between(
+        self,
+        start: datetime.datetime = None,
+        end: datetime.datetime = None,
+    ) -> list[Card]:
+        """Get cards published within a time range, oldest first.
+
+        Args:
+            start (datetime.datetime, optional): inclusive range start.
+            end (datetime.datetime, optional): exclusive range end.
 
-        return latest_cards
+        Returns:
+            list[Card]: cards published in the range
+        """
+        return self.publish_index.published_between(start, end)
 
     def start_periodic_check_timer(self):
         """Start the periodic check timer."""
@@ -179,68 +302,588 @@ class CardsTracker(QtCore.QObject):
         self._check_timer.start()
         LOGGER.debug(f"Check Timer: {self._check_timer.interval()}ms")
 
-    def run_check(self) -> list[dict]:
+    def check_options(self) -> CheckOptions:
+        """Get a snapshot of the settings used by checks.
+
+        Returns:
+            CheckOptions: check options
+        """
+        return CheckOptions.from_settings(self.application.settings)
+
+    def request_check(self, manual: bool = False) -> ScheduledCheck:
+        """Request a background check through the check scheduler.
+
+        Overlapping requests are coalesced so only one check is in flight.
+
+        Args:
+            manual (bool, optional): whether the user requested the check.
+                Defaults to False.
+
+        Returns:
+            ScheduledCheck: check serving the request
+        """
+        return self.check_scheduler.request_check(manual=manual)
+
+    @QtCore.Slot()
+    def cancel_check(self):
+        """Cancel the running check, leaving cards data and cache untouched."""
+        self.check_scheduler.cancel()
+
+    def run_check(self) -> CheckResult:
         """Run a check for new cards.
 
+        Blocks until the check is done, see run_check_async for the
+        non-blocking variant.
+
         Returns:
-            list[dict]: list of new cards found
+            CheckResult: added, removed, re-published and modified cards
         """
         LOGGER.info("Running cards check...")
-        source_cards = get_all_cards()
+        self.prepare_check()
+        outcome = self.collect_check(self.check_options())
+        return self.apply_check(outcome)
+
+    def prepare_check(self):
+        """Load the state a check reads before it's collected.
+
+        Cached cards are parsed and the publish index is built here, on the
+        main thread, so collect_check only reads tracker state.
+        """
+        self.load_cached_cards()
+        LOGGER.debug(f"Prepared check of {len(self.publish_index)} indexed cards")
+
+    @property
+    def network_manager(self) -> QtNetwork.QNetworkAccessManager:
+        """Get the network access manager used by the Qt scraper backend.
+
+        The manager is shared by all checks so connections are reused.
+
+        Returns:
+            QtNetwork.QNetworkAccessManager: network access manager
+        """
+        if self._network_manager is None:
+            self._network_manager = QtNetwork.QNetworkAccessManager(self)
+        return self._network_manager
+
+    def run_check_async(self) -> CheckHandle:
+        """Run a check for new cards without blocking the main thread.
+
+        Doesn't guard against overlapping checks, use request_check instead.
+
+        With the requests backend crawling and diffing run on a worker thread;
+        with the Qt backend pages are fetched on the event loop. Either way the
+        outcome is applied and signals are emitted on the main thread.
+
+        Returns:
+            CheckHandle: handle emitting finished or failed
+        """
+        LOGGER.info("Running cards check in background...")
+        options = self.check_options()
+        self.prepare_check()
+        handle = CheckHandle(self.apply_check)
+        handle.finished.connect(lambda _: self._release_check_handle(handle))
+        handle.failed.connect(lambda _: self._release_check_handle(handle))
+        self._check_handles.append(handle)
+
+        if options.scraper_backend == HazbinSettings.SCRAPER_BACKEND_QT:
+            self.start_qt_check(options, handle)
+        else:
+            worker = CheckWorker(self.collect_check, options, handle.cancel_token)
+            handle.attach(worker)
+            self._thread_pool.start(worker)
+        return handle
+
+    def start_qt_check(self, options: CheckOptions, handle: CheckHandle):
+        """Crawl the full catalog on the Qt event loop.
+
+        Head probes and incremental crawls are only available with the
+        requests backend, so every Qt backend check is a full crawl.
+
+        Args:
+            options (CheckOptions): check options
+            handle (CheckHandle): handle receiving the outcome
+        """
+        start_page = self._resume_page or 1
+        deadline = self.create_deadline(options)
+        fetcher = QtCardsFetcher(
+            self.network_manager,
+            concurrency=options.scrape_concurrency,
+            project=options.project_products,
+            known_cards=self.publish_index.cards_by_id,
+            cancel_token=handle.cancel_token,
+            start_page=start_page,
+            deadline=deadline,
+            parent=self,
+        )
+        fetcher.progress.connect(handle.progress)
+        fetcher.finished.connect(
+            lambda cards: self._finish_qt_check(handle, cards, start_page, deadline)
+        )
+        fetcher.failed.connect(handle.on_worker_failed)
+        handle.cancelled.connect(fetcher.cancel)
+        handle.finished.connect(fetcher.deleteLater)
+        handle.failed.connect(fetcher.deleteLater)
+        fetcher.start()
+
+    def _finish_qt_check(
+        self,
+        handle: CheckHandle,
+        source_cards: list[Card],
+        start_page: int,
+        deadline: CrawlDeadline | None,
+    ):
+        """Diff the cards crawled by the Qt backend and hand them to the handle.
+
+        Args:
+            handle (CheckHandle): handle receiving the outcome
+            source_cards (list[Card]): crawled cards
+            start_page (int): first crawled page
+            deadline (CrawlDeadline | None): deadline the crawl ran with
+        """
+        try:
+            outcome = self.finish_crawl(source_cards, start_page, deadline)
+        except Exception as err:
+            LOGGER.exception("Cards check failed.")
+            handle.on_worker_failed(err)
+            return
+        handle.on_worker_finished(outcome)
+
+    def _release_check_handle(self, handle: CheckHandle):
+        """Stop tracking a finished check handle.
+
+        Args:
+            handle (CheckHandle): finished handle
+        """
+        if handle in self._check_handles:
+            self._check_handles.remove(handle)
+
+    def collect_check(
+        self,
+        options: CheckOptions,
+        cancel_token: CancellationToken = None,
+        progress_callback: typing.Callable[[CrawlProgress], None] = None,
+    ) -> CheckOutcome:
+        """Fetch the catalog and diff it against the current one.
+
+        Only reads tracker state, so it's safe to run on a worker thread once
+        prepare_check ran. Probe statistics are returned in the outcome and
+        counted by apply_check.
+
+        Args:
+            options (CheckOptions): check options
+            cancel_token (CancellationToken, optional): token checked between
+                crawled pages.
+            progress_callback (Callable, optional): called with the crawl
+                progress after every page of a full crawl.
+
+        Returns:
+            CheckOutcome: collected check
+
+        Raises:
+            CrawlCancelled: if the token was cancelled
+        """
+        source_cards = None
+        probe_unchanged = None
+        # Pages past a crawl's deadline are only fetched by resuming the crawl
+        if self._resume_page is None and not self.is_full_resync_due(options):
+            probe_unchanged = self.probe_detects_no_change(options, cancel_token)
+            if probe_unchanged:
+                source_cards = self.cards_data
+            else:
+                source_cards = self.fetch_incremental_cards(options, cancel_token)
+
+        if source_cards is not None:
+            outcome = self.compare_cards(source_cards, full_crawl=False)
+            outcome.probe_unchanged = probe_unchanged
+            return outcome
+
+        start_page = self._resume_page or 1
+        deadline = self.create_deadline(options)
+        source_cards = get_all_cards(
+            concurrency=options.scrape_concurrency,
+            project=options.project_products,
+            known_cards=self.publish_index.cards_by_id,
+            progress_callback=progress_callback,
+            cancel_token=cancel_token,
+            start_page=start_page,
+            deadline=deadline,
+        )
+        outcome = self.finish_crawl(source_cards, start_page, deadline)
+        outcome.probe_unchanged = probe_unchanged
+        return outcome
+
+    def create_deadline(self, options: CheckOptions) -> CrawlDeadline | None:
+        """Create the time budget of a crawl.
+
+        Args:
+            options (CheckOptions): check options
+
+        Returns:
+            CrawlDeadline | None: crawl deadline, None if checks have no deadline
+        """
+        if not options.check_deadline:
+            return None
+        return CrawlDeadline(options.check_deadline)
+
+    def finish_crawl(
+        self,
+        source_cards: list[Card],
+        start_page: int,
+        deadline: CrawlDeadline | None,
+    ) -> CheckOutcome:
+        """Diff a crawled catalog which may be missing some pages.
+
+        A crawl that resumed past the first page or ran out of its deadline
+        only covers part of the catalog, so it's merged into the current cards
+        instead of replacing them and no card is reported as removed.
+
+        Args:
+            source_cards (list[Card]): crawled cards
+            start_page (int): first crawled page
+            deadline (CrawlDeadline | None): deadline the crawl ran with
+
+        Returns:
+            CheckOutcome: collected check
+        """
+        partial = deadline is not None and deadline.exceeded
+        complete = not partial and start_page == 1
+        if not complete:
+            source_cards = merge_cards(self.cards_data or [], source_cards)
+
+        outcome = self.compare_cards(source_cards, full_crawl=complete)
+        outcome.partial = partial
+        outcome.resume_page = deadline.resume_page if partial else None
+        outcome.crawled = True
+        if outcome.result is not None:
+            outcome.result.partial = partial
+        return outcome
+
+    def compare_cards(self, source_cards: list[Card], full_crawl: bool) -> CheckOutcome:
+        """Diff a fetched catalog against the current one.
 
-        new_cards = []
-        for card in source_cards:
-            cards_published_at = datetime.datetime.fromisoformat(card["published_at"])
-            if cards_published_at > self._last_check_time:
-                new_cards.append(card)
+        Args:
+            source_cards (list[Card]): fetched catalog
+            full_crawl (bool): whether the catalog comes from a full crawl
+
+        Returns:
+            CheckOutcome: collected check
+        """
+        digest = catalog_digest(source_cards)
+        if source_cards is self.cards_data or (
+            digest is not None and digest == self._catalog_digest
+        ):
+            return CheckOutcome(
+                cards=self.cards_data,
+                digest=self._catalog_digest,
+                result=None,
+                full_crawl=full_crawl,
+            )
+
+        result = diff_cards(
+            self.cards_data or None, source_cards, since=self._last_check_time
+        )
+        return CheckOutcome(
+            cards=source_cards, digest=digest, result=result, full_crawl=full_crawl
+        )
+
+    def apply_check(self, outcome: CheckOutcome) -> CheckResult:
+        """Apply a collected check to the tracker and emit its signals.
+
+        Args:
+            outcome (CheckOutcome): collected check
+
+        Returns:
+            CheckResult: check result
+        """
+        if outcome.full_crawl:
+            self._checks_since_full_crawl = 0
+        else:
+            self._checks_since_full_crawl += 1
+        if outcome.probe_unchanged is not None:
+            self.probe_count += 1
+            if not outcome.probe_unchanged:
+                self.probe_escalation_count += 1
+            LOGGER.debug(
+                f"Head probe: unchanged={outcome.probe_unchanged}, escalations="
+                f"{self.probe_escalation_count}/{self.probe_count}"
+            )
+
+        resume_page = outcome.resume_page if outcome.crawled else self._resume_page
+        resume_changed = resume_page != self._resume_page
+        self._resume_page = resume_page
+        if outcome.partial:
+            LOGGER.warning(
+                f"Check deadline exceeded, resuming from page {self._resume_page}"
+                " on the next check."
+            )
+
+        if outcome.unchanged:
+            result = self.complete_unchanged_check(partial=outcome.partial)
+            if resume_changed:
+                self.create_cache(CheckResult())
+            return result
+
+        result = outcome.result
+        self.count_reused_cards(outcome.cards)
+        LOGGER.info(
+            f"Found {len(result.new_cards)} new cards"
+            f" ({len(result.removed)} removed, {len(result.modified)} modified)."
+        )
+        LOGGER.debug(f"HTTP stats: {get_http_client().stats}")
+        LOGGER.debug(f"Scheduler stats: {self.check_scheduler}")
+        self.cards_data = outcome.cards
+        self._catalog_digest = outcome.digest
+        self.record_time()
+        self.create_cache(result)
+        self.emit_check_result(result)
+        return result
 
-        LOGGER.info(f"Found {len(new_cards)} new cards.")
-        self.cards_data = source_cards
+    def complete_unchanged_check(self, partial: bool = False) -> CheckResult:
+        """Complete a check whose catalog digest matches the current one.
+
+        Cards data, publish index and cache are left untouched.
+
+        Args:
+            partial (bool, optional): whether the check ran out of its deadline.
+                Defaults to False.
+
+        Returns:
+            CheckResult: empty check result
+        """
+        self.unchanged_check_count += 1
+        LOGGER.info(
+            "Catalog unchanged, skipping diff and cache write"
+            f" ({self.unchanged_check_count} unchanged checks)."
+        )
+        result = CheckResult(partial=partial)
         self.record_time()
-        self.create_cache()
-        self.check_completed.emit(new_cards)
-        if new_cards:
-            self.new_cards_found.emit(new_cards)
-        return new_cards
+        self.emit_check_result(result)
+        return result
+
+    def count_reused_cards(self, cards: list[Card]) -> int:
+        """Count cards reused from the current catalog without being rebuilt.
+
+        Args:
+            cards (list[Card]): freshly fetched catalog
+
+        Returns:
+            int: number of reused cards in this catalog
+        """
+        known_cards = self.publish_index.cards_by_id
+        reused = sum(1 for card in cards if known_cards.get(card.id) is card)
+        self.reused_card_count += reused
+        LOGGER.debug(f"Reused {reused}/{len(cards)} unchanged cards")
+        return reused
+
+    def emit_check_result(self, result: CheckResult):
+        """Emit the signals describing a check result.
+
+        Args:
+            result (CheckResult): check result
+        """
+        self.check_completed.emit(result)
+        if result.new_cards:
+            self.new_cards_found.emit(result)
+        if result.removed:
+            self.cards_removed.emit(result.removed)
+        if result.republished:
+            self.cards_republished.emit(result.republished)
+        if result.modified:
+            self.cards_modified.emit(result.modified)
+
+    def is_full_resync_due(self, options: CheckOptions) -> bool:
+        """Get whether the next check has to crawl the full catalog.
+
+        Args:
+            options (CheckOptions): check options
+
+        Returns:
+            bool: True if a full crawl is due
+        """
+        if not self.cards_data:
+            return True
+        return self._checks_since_full_crawl >= options.full_resync_interval
+
+    @property
+    def probe_escalation_rate(self) -> float:
+        """Get the share of head probes that escalated to a crawl.
+
+        Returns:
+            float: escalation rate between 0 and 1
+        """
+        if not self.probe_count:
+            return 0.0
+        return self.probe_escalation_count / self.probe_count
+
+    def probe_detects_no_change(
+        self, options: CheckOptions, cancel_token: CancellationToken = None
+    ) -> bool | None:
+        """Probe the newest product to decide whether a crawl can be skipped.
+
+        The probe sees the newest created product, so a product created before
+        it but published later goes unnoticed until the next full resync.
+
+        Args:
+            options (CheckOptions): check options
+            cancel_token (CancellationToken, optional): token interrupting the
+                probe's retries.
+
+        Returns:
+            bool | None: True if the newest product is the newest known card,
+                False if the catalog has to be crawled, None if probes are off
+        """
+        if not options.head_probe:
+            return None
+
+        try:
+            latest_product = get_latest_product(cancel_token=cancel_token)
+        except requests.RequestException:
+            LOGGER.warning("Head probe failed, escalating to crawl.")
+            latest_product = None
+
+        return latest_product is not None and self.is_latest_known_card(
+            Card.from_dict(latest_product)
+        )
+
+    def is_latest_known_card(self, card: Card) -> bool:
+        """Check whether a card is one of the newest cards of the current catalog.
+
+        An older known card means the shop returned products in another order,
+        or the newest cards were removed, so the catalog has to be crawled.
+
+        Args:
+            card (Card): card to look up
+
+        Returns:
+            bool: True if the card is known and published at the latest time
+        """
+        latest_time = self.latest_publish_time
+        if latest_time is None or card.published_at != latest_time:
+            return False
+        return self.publish_index.get(card.id) is not None
+
+    def fetch_incremental_cards(
+        self, options: CheckOptions, cancel_token: CancellationToken = None
+    ) -> list[Card] | None:
+        """Fetch cards published since the last check and merge them into cache.
+
+        Args:
+            options (CheckOptions): check options
+            cancel_token (CancellationToken, optional): token checked between
+                pages and interrupting retries.
+
+        Returns:
+            list[Card] | None: merged catalog, None if a full crawl is needed.
+        """
+        if not options.incremental_crawl:
+            return None
+        if not self.cards_data or not self._last_check_time:
+            return None
+
+        fresh_cards = get_new_cards(
+            since=self._last_check_time,
+            project=options.project_products,
+            known_cards=self.publish_index.cards_by_id,
+            cancel_token=cancel_token,
+        )
+        if fresh_cards is None:
+            LOGGER.info("Incremental crawl unavailable, running full crawl...")
+            return None
+        LOGGER.debug(f"Incremental crawl fetched {len(fresh_cards)} cards")
+        return merge_cards(self.cards_data, fresh_cards)
 
     def populate_cards_data(self):
-        """Populate cards data from cache or source."""
+        """Populate cards data from cache and revalidate it in the background.
+
+        Startup never waits for the network: without a usable cache the tracker
+        starts empty and the first background check seeds the catalog and the
+        last check time without reporting any card as new.
+        """
         LOGGER.debug("Populating tracker cards data")
         try:
             self.fetch_cards_data_from_cache()
-        except (FileNotFoundError, json.JSONDecodeError):
-            LOGGER.debug("Failed to load cards from cache")
-            self.fetch_cards_data_from_source()
-            self.create_cache()
+        except CatalogNotFoundError:
+            LOGGER.info("No cached cards, fetching them in the background.")
+        if self.is_cache_stale():
+            QtCore.QTimer.singleShot(0, self.revalidate_cards_data)
+
+    def is_cache_stale(self) -> bool:
+        """Get whether cached cards are older than the check frequency.
+
+        Returns:
+            bool: True if there are no cards or they're due for a check
+        """
+        if not self.card_count or self._last_check_time is None:
+            return True
+        age = datetime.datetime.now(datetime.UTC) - self._last_check_time
+        return age >= datetime.timedelta(
+            minutes=self.application.settings.tracker_check_minute_frequency
+        )
+
+    @QtCore.Slot()
+    def revalidate_cards_data(self):
+        """Request a background check refreshing the cached cards."""
+        LOGGER.debug("Revalidating cached cards")
+        self.request_check()
 
     def fetch_cards_data_from_cache(self):
-        """Fetch cards data from cache file."""
+        """Fetch cards data from the storage.
+
+        Raises:
+            CatalogNotFoundError: if the storage holds no catalog
+        """
         LOGGER.debug("Loading cards from cache")
-        with self.track_file_path.open() as cache_file:
-            cache_data = json.load(cache_file)
-        self._cards_data = cache_data.get("cards", [])
-        self.record_time(
-            time_override=datetime.datetime.fromisoformat(
-                cache_data.get("last_check_time")
-            )
-        )
-        LOGGER.debug(f"Loaded {len(self._cards_data)} cards from {self.track_file_path}")
+        snapshot = self.storage.load_catalog()
+        self._cards_data = snapshot.cards
+        self._cached_snapshot = None if snapshot.is_loaded else snapshot
+        self._catalog_digest = snapshot.digest
+        if snapshot.digest is None and snapshot.is_loaded:
+            self._catalog_digest = catalog_digest(snapshot.cards)
+        self._resume_page = snapshot.resume_page
+        self.record_time(time_override=snapshot.last_check_time)
+        LOGGER.debug(f"Loaded summary of {self.card_count} cards from {self.storage}")
 
-    def fetch_cards_data_from_source(self):
-        """Fetch cards data from source."""
-        LOGGER.debug("Fetching cards data from source")
-        self._cards_data = get_all_cards()
-        self.record_time()
+    def create_cache(self, changes: CheckResult = None):
+        """Store current cards data and last check time, and archive them.
+
+        The whole catalog is stored after corrupt cached cards were dropped.
 
-    def create_cache(self):
-        """Create cache file with current cards data and last check time."""
+        Args:
+            changes (CheckResult, optional): changes since the stored catalog,
+                letting the storage write only the changed cards.
+                Defaults to None, which stores the whole catalog.
+        """
         LOGGER.debug("Creating cache")
-        cache_content = {
-            "last_check_time": self.last_check_time.isoformat(),
-            "cards": self.cards_data,
-        }
-        with self.track_file_path.open("w") as cache_file:
-            json.dump(cache_content, cache_file, indent=4)
+        if self._full_cache_write_due:
+            changes = None
+            self._full_cache_write_due = False
+        self.storage.save_catalog(
+            CatalogSnapshot(
+                last_check_time=self.last_check_time,
+                cards=self.cards_data,
+                resume_page=self._resume_page,
+                digest=self._catalog_digest,
+            ),
+            changes=changes,
+        )
+        try:
+            self.archive.record(self.last_check_time, self.cards_data, changes)
+        except OSError:
+            LOGGER.exception(f"Failed to archive catalog to {self.archive}")
+
+    def cards_at(self, time: datetime.datetime) -> list[Card]:
+        """Get the catalog as it was at a point in time.
+
+        Args:
+            time (datetime.datetime): point in time
+
+        Returns:
+            list[Card]: cards sorted by publish time, newest first
+
+        Raises:
+            ArchiveNotFoundError: if nothing was archived at or before the time
+        """
+        return self.archive.rebuild(time)
 
     def record_time(self, time_override: datetime.datetime = None):
         """Record the current time as last check time.
@@ -256,38 +899,38 @@ class CardsTracker(QtCore.QObject):
         self.last_check_time = new_time
         LOGGER.debug(f"Recorded time: {self.last_check_time}")
 
-    def generate_new_cards_message(self, new_cards: list[dict]) -> str:
+    def generate_new_cards_message(self, new_cards: list[Card]) -> str:
         """Generate a message for new cards found.
 
         Args:
-            new_cards (list[dict]): list of new cards found
+            new_cards (list[Card]): list of new cards found
         Returns:
             str: generated message
         """
         LOGGER.debug("Generating new cards message...")
         message = f"Found {len(new_cards)} new Hazbin cards:"
         for card in new_cards:
-            message += f"\n- {card.get('title')}"
+            message += f"\n- {card.title}"
         return message
 
-    def on_new_cards_found(self, new_cards: list):
+    def on_new_cards_found(self, result: CheckResult):
         """Handle new cards found event.
 
         Args:
-            new_cards (list): list of new cards found
+            result (CheckResult): result of the check which found new cards
         """
         if not self.application.settings.pushover_enabled:
             LOGGER.debug("Push notifications are disabled, skipping...")
             return
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 "https://api.pushover.net/1/messages.json",
                 data={
                     "token": self.application.settings.pushover_app_key,
                     "user": self.application.settings.pushover_user_key,
                     "title": "HazbinTracker - New Cards available!",
-                    "message": self.generate_new_cards_message(new_cards),
+                    "message": self.generate_new_cards_message(result.new_cards),
                 },
                 timeout=10,
             )
@@ -301,28 +944,22 @@ class CardsTracker(QtCore.QObject):
                 "Failed to send Pushover notification due to unhandled error."
             )
 
-    def record_check_result(self, new_cards: list[dict]):
+    def record_check_result(self, result: CheckResult):
         """Record the result of a check.
 
+        The timestamp is stored as an ISO UTC time. New cards are stored as id,
+        title and publish time summaries, their details are resolved from the
+        catalog with find_card.
+
         Args:
-            new_cards (list[dict]): list of new cards found
+            result (CheckResult): check result
         """
         record = {
-            "timestamp": self.nice_last_checked_time,
-            "new_cards": new_cards,
+            "timestamp": self.last_check_time.isoformat(),
+            "new_cards": [card.to_summary() for card in result.new_cards],
+            "removed_count": len(result.removed),
+            "modified_count": len(result.modified),
+            "deadline_exceeded": result.partial,
         }
-        if CHECK_HISTORY_FILE_PATH.exists():
-            try:
-                history = json.loads(CHECK_HISTORY_FILE_PATH.read_text())
-            except Exception:
-                LOGGER.warning("Failed to read check history file, starting fresh.")
-                history = []
-        else:
-            history = []
-
-        history.insert(0, record)
-
-        # Trim history if it exceeds the maximum size
-        history = history[: self.application.settings.check_history_size]
-        CHECK_HISTORY_FILE_PATH.write_text(json.dumps(history, indent=4))
-        LOGGER.debug(f"Recorded check result to history: {CHECK_HISTORY_FILE_PATH}")
+        self.storage.append_check(record, self.application.settings.check_history_size)
+        LOGGER.debug(f"Recorded check result to history: {self.storage}")
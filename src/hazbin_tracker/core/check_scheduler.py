@@ -0,0 +1,211 @@
+import typing
+import logging
+
+from PySide6 import QtCore
+
+from .check_worker import CheckHandle
+from .crawl import CrawlCancelled
+from .diff import CheckResult
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ScheduledCheck(QtCore.QObject):
+    """Check run shared by every request coalesced into it."""
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+
+    def __init__(self, manual: bool, parent: QtCore.QObject = None):
+        """Instance constructor.
+
+        Args:
+            manual (bool): whether the check was requested by the user
+            parent (QtCore.QObject, optional): parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.manual = manual
+        self.request_count = 1
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return f"<ScheduledCheck manual={self.manual}, requests={self.request_count}>"
+
+
+class CheckScheduler(QtCore.QObject):
+    """Scheduler allowing a single check in flight.
+
+    Requests arriving while a check runs are merged into at most one follow-up
+    check. A timer request is dropped when a follow-up is already queued, while
+    a manual request is merged into it and gives it manual priority.
+    """
+
+    running_changed = QtCore.Signal(bool)
+    progress = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        start_fn: typing.Callable[[], CheckHandle],
+        parent: QtCore.QObject = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            start_fn (Callable): function starting a check and returning its handle
+            parent (QtCore.QObject, optional): parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._start_fn = start_fn
+        self._running: ScheduledCheck | None = None
+        self._pending: ScheduledCheck | None = None
+        self._running_handle: CheckHandle | None = None
+        self.requested_count = 0
+        self.started_count = 0
+        self.coalesced_count = 0
+        self.dropped_count = 0
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<CheckScheduler requested={self.requested_count},"
+            f" started={self.started_count}, coalesced={self.coalesced_count},"
+            f" dropped={self.dropped_count}>"
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Get whether a check is in flight.
+
+        Returns:
+            bool: True if a check is running
+        """
+        return self._running is not None
+
+    @property
+    def pending_check(self) -> ScheduledCheck | None:
+        """Get the queued follow-up check.
+
+        Returns:
+            ScheduledCheck | None: follow-up check, None if nothing is queued
+        """
+        return self._pending
+
+    def request_check(self, manual: bool = False) -> ScheduledCheck:
+        """Request a check, starting it now or merging it into the follow-up.
+
+        Args:
+            manual (bool, optional): whether the user requested the check.
+                Defaults to False.
+
+        Returns:
+            ScheduledCheck: check which serves the request
+        """
+        self.requested_count += 1
+        if self._running is None:
+            scheduled = ScheduledCheck(manual, parent=self)
+            self.running_changed.emit(True)
+            self._start(scheduled)
+            return scheduled
+
+        if self._pending is None:
+            LOGGER.debug(f"Check in flight, queueing follow-up (manual={manual})")
+            self._pending = ScheduledCheck(manual, parent=self)
+            return self._pending
+
+        if manual:
+            self.coalesced_count += 1
+            self._pending.manual = True
+            self._pending.request_count += 1
+            LOGGER.debug(f"Merged manual request into follow-up: {self}")
+        else:
+            self.dropped_count += 1
+            LOGGER.debug(f"Dropped timer request: {self}")
+        return self._pending
+
+    @QtCore.Slot()
+    def request_timer_check(self):
+        """Request a check on behalf of the periodic timer."""
+        self.request_check(manual=False)
+
+    @QtCore.Slot()
+    def cancel(self):
+        """Cancel the running check and drop the queued follow-up."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.failed.emit(CrawlCancelled())
+            pending.deleteLater()
+        if self._running_handle is not None:
+            self._running_handle.cancel()
+
+    def _start(self, scheduled: ScheduledCheck):
+        """Start a scheduled check.
+
+        Args:
+            scheduled (ScheduledCheck): check to start
+        """
+        self._running = scheduled
+        self.started_count += 1
+        LOGGER.debug(f"Starting {scheduled}")
+        try:
+            handle = self._start_fn()
+        except Exception as err:
+            LOGGER.exception("Failed to start cards check.")
+            self._on_check_failed(scheduled, err)
+            return
+        self._running_handle = handle
+        handle.progress.connect(self.progress)
+        handle.finished.connect(
+            lambda result: self._on_check_finished(scheduled, result)
+        )
+        handle.failed.connect(lambda error: self._on_check_failed(scheduled, error))
+
+    def _on_check_finished(self, scheduled: ScheduledCheck, result: CheckResult):
+        """Publish a finished check and start the follow-up.
+
+        Args:
+            scheduled (ScheduledCheck): finished check
+            result (CheckResult): check result
+        """
+        self._complete(scheduled)
+        scheduled.finished.emit(result)
+        self._start_pending()
+
+    def _on_check_failed(self, scheduled: ScheduledCheck, error: Exception):
+        """Publish a failed check and start the follow-up.
+
+        Args:
+            scheduled (ScheduledCheck): failed check
+            error (Exception): raised error
+        """
+        self._complete(scheduled)
+        scheduled.failed.emit(error)
+        self._start_pending()
+
+    def _complete(self, scheduled: ScheduledCheck):
+        """Mark a check as no longer in flight.
+
+        Args:
+            scheduled (ScheduledCheck): completed check
+        """
+        if self._running is scheduled:
+            self._running = None
+            self._running_handle = None
+        scheduled.deleteLater()
+
+    def _start_pending(self):
+        """Start the queued follow-up check, or report the scheduler as idle."""
+        if self._running is not None:
+            return
+        if self._pending is None:
+            self.running_changed.emit(False)
+            return
+        scheduled, self._pending = self._pending, None
+        self._start(scheduled)
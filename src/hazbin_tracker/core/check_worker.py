@@ -0,0 +1,224 @@
+import typing
+import logging
+import dataclasses
+
+from PySide6 import QtCore
+
+from .card import Card
+from .crawl import CancellationToken, CrawlCancelled
+from .diff import CheckResult
+
+if typing.TYPE_CHECKING:
+    from .settings import HazbinSettings
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class CheckOptions:
+    """Snapshot of the settings a check runs with.
+
+    Settings are read once on the main thread so the check itself never touches
+    QSettings from a worker thread.
+    """
+
+    scrape_concurrency: int
+    project_products: bool
+    incremental_crawl: bool
+    head_probe: bool
+    full_resync_interval: int
+    scraper_backend: str
+    check_deadline: int
+
+    @classmethod
+    def from_settings(cls, settings: "HazbinSettings") -> "CheckOptions":
+        """Create options from the application settings.
+
+        Args:
+            settings (HazbinSettings): application settings
+
+        Returns:
+            CheckOptions: options snapshot
+        """
+        return cls(
+            scrape_concurrency=settings.scrape_concurrency,
+            project_products=settings.project_products,
+            incremental_crawl=settings.incremental_crawl,
+            head_probe=settings.head_probe,
+            full_resync_interval=settings.full_resync_interval,
+            scraper_backend=settings.scraper_backend,
+            check_deadline=settings.check_deadline,
+        )
+
+
+@dataclasses.dataclass
+class CheckOutcome:
+    """Collected catalog and its diff, ready to be applied to the tracker.
+
+    ``probe_unchanged`` holds the head probe verdict, None if no probe ran.
+    ``crawled`` tells whether the catalog comes from a crawl, the only kind of
+    check whose ``resume_page`` replaces the pending one.
+    """
+
+    cards: list[Card]
+    digest: str | None
+    result: CheckResult | None
+    full_crawl: bool
+    partial: bool = False
+    resume_page: int | None = None
+    probe_unchanged: bool | None = None
+    crawled: bool = False
+
+    @property
+    def unchanged(self) -> bool:
+        """Get whether the collected catalog matches the current one.
+
+        Returns:
+            bool: True if nothing changed
+        """
+        return self.result is None
+
+
+class CheckWorkerSignals(QtCore.QObject):
+    """Signals emitted by CheckWorker."""
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+    progress = QtCore.Signal(object)
+
+
+class CheckWorker(QtCore.QRunnable):
+    """Runnable collecting a check on a QThreadPool thread."""
+
+    def __init__(self, fn: typing.Callable, *args):
+        """Instance constructor.
+
+        Args:
+            fn (Callable): function collecting the check, it receives a
+                ``progress_callback`` keyword argument emitting crawl progress.
+            *args: arguments passed to the function
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = CheckWorkerSignals()
+
+    def run(self):
+        """Run the function and report its outcome through signals."""
+        try:
+            outcome = self.fn(*self.args, progress_callback=self.signals.progress.emit)
+        except CrawlCancelled as err:
+            LOGGER.info("Cards check cancelled.")
+            self.signals.failed.emit(err)
+            return
+        except Exception as err:
+            LOGGER.exception("Cards check failed.")
+            self.signals.failed.emit(err)
+            return
+        self.signals.finished.emit(outcome)
+
+
+class CheckHandle(QtCore.QObject):
+    """Handle of a check running in the background.
+
+    The handle lives on the main thread, so the worker's outcome is delivered
+    to it through a queued connection and applied on the main thread.
+    ``cancelled`` is emitted when cancellation is requested, so checks running
+    on the event loop can stop without waiting for their next page.
+    """
+
+    finished = QtCore.Signal(object)
+    failed = QtCore.Signal(object)
+    progress = QtCore.Signal(object)
+    cancelled = QtCore.Signal()
+
+    def __init__(
+        self,
+        apply_fn: typing.Callable[[CheckOutcome], CheckResult],
+        parent: QtCore.QObject = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            apply_fn (Callable): function applying the outcome on the main thread
+            parent (QtCore.QObject, optional): parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._apply_fn = apply_fn
+        self._result = None
+        self._error = None
+        self._done = False
+        self._worker_signals = None
+        self.cancel_token = CancellationToken()
+
+    def attach(self, worker: CheckWorker):
+        """Receive the outcome of the given worker.
+
+        Args:
+            worker (CheckWorker): worker collecting the check
+        """
+        self._worker_signals = worker.signals
+        worker.signals.finished.connect(self.on_worker_finished)
+        worker.signals.failed.connect(self.on_worker_failed)
+        worker.signals.progress.connect(self.progress)
+
+    def cancel(self):
+        """Request the check to stop before its next page."""
+        LOGGER.info("Cancelling cards check...")
+        self.cancel_token.cancel()
+        self.cancelled.emit()
+
+    def is_done(self) -> bool:
+        """Get whether the check has finished or failed.
+
+        Returns:
+            bool: True if done
+        """
+        return self._done
+
+    def result(self) -> CheckResult | None:
+        """Get the check result.
+
+        Returns:
+            CheckResult | None: result, None until the check finished
+        """
+        return self._result
+
+    def error(self) -> Exception | None:
+        """Get the error the check failed with.
+
+        Returns:
+            Exception | None: error, None unless the check failed
+        """
+        return self._error
+
+    @QtCore.Slot(object)
+    def on_worker_finished(self, outcome: CheckOutcome):
+        """Apply the collected outcome and publish the result.
+
+        Args:
+            outcome (CheckOutcome): collected check
+        """
+        if self.cancel_token.is_cancelled:
+            LOGGER.info("Cards check cancelled, discarding its outcome.")
+            self.on_worker_failed(CrawlCancelled())
+            return
+        try:
+            self._result = self._apply_fn(outcome)
+        except Exception as err:
+            LOGGER.exception("Failed to apply cards check.")
+            self.on_worker_failed(err)
+            return
+        self._done = True
+        self.finished.emit(self._result)
+
+    @QtCore.Slot(object)
+    def on_worker_failed(self, error: Exception):
+        """Publish the error the check failed with.
+
+        Args:
+            error (Exception): raised error
+        """
+        self._error = error
+        self._done = True
+        self.failed.emit(error)
@@ -11,14 +11,24 @@ RELEASE_YEAR = 2025
 APPLICATION_TITLE = "HazbinTracker"
 ORGANIZATION_NAME = "Sowwic"
 DEBUG = int(os.getenv("HAZBIN_DEBUG", 0))
+NICE_TIME_FORMAT = "%d-%m-%Y at %H:%M:%S"
 
 # Scrapping
 HAZBIN_WEBSITE_URL = "https://hazbinhotel.com/collections/trading-cards"
 HAZBIN_CARDS_PRODUCTS_JSON_URL = (
     "https://hazbinhotel.com/collections/trading-cards/products.json"
 )
+HAZBIN_PRODUCT_JSON_URL = "https://hazbinhotel.com/products/{handle}.json"
 PRODUCTS_REQUEST_LIMIT = 250
+PRODUCTS_REQUEST_TIMEOUT = 10
+PRODUCTS_REQUEST_CONCURRENCY = 4
 DEFAULT_SORT_KEY = "published_at"
+# Shopify has no publish-time sort, so newest first means newest created. A product
+# created before the newest known one but published later sorts below it, which
+# incremental crawls and head probes can't see until the next full resync.
+PRODUCTS_SORT_NEWEST_FIRST = "created-descending"
+PRODUCT_PROJECTION_FIELDS = ("id", "handle", "title", "published_at", "updated_at")
+PRODUCT_VARIANT_PROJECTION_FIELDS = ("id", "available", "price")
 
 APP_DATA_DIR = pathlib.Path(
     platformdirs.user_data_dir(
@@ -30,4 +40,9 @@ APP_DATA_DIR = pathlib.Path(
 )
 
 SETTINGS_FILE_PATH = APP_DATA_DIR / "settings.ini"
+TRACK_FILE_PATH = APP_DATA_DIR / "track_data.json"
 CHECK_HISTORY_FILE_PATH = APP_DATA_DIR / "check_history.json"
+CHECK_HISTORY_DIR = APP_DATA_DIR / "check_history"
+CATALOG_DB_PATH = APP_DATA_DIR / "catalog.sqlite3"
+SNAPSHOT_ARCHIVE_DIR = APP_DATA_DIR / "archive"
+HTTP_CACHE_DIR = APP_DATA_DIR / "http_cache"
@@ -0,0 +1,123 @@
+import time
+import threading
+import dataclasses
+
+
+class CrawlCancelled(Exception):
+    """Raised when a crawl is stopped through its cancellation token."""
+
+
+class CancellationToken:
+    """Thread-safe flag used to stop a crawl between pages."""
+
+    def __init__(self):
+        """Instance constructor."""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request the crawl to stop."""
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Get whether cancellation was requested.
+
+        Returns:
+            bool: True if cancelled
+        """
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until cancellation is requested or the timeout passes.
+
+        Args:
+            timeout (float): maximum wait in seconds
+
+        Returns:
+            bool: True if cancelled
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """Raise CrawlCancelled if cancellation was requested.
+
+        Raises:
+            CrawlCancelled: if cancelled
+        """
+        if self.is_cancelled:
+            raise CrawlCancelled()
+
+
+class CrawlDeadline:
+    """Overall time budget of a crawl.
+
+    A crawl running out of its budget stops early and records the first page it
+    didn't consume, so the snapshot it returns is known to be partial.
+    """
+
+    def __init__(self, seconds: float):
+        """Instance constructor.
+
+        Args:
+            seconds (float): time budget in seconds
+        """
+        self.seconds = seconds
+        self._end_time = time.monotonic() + seconds
+        self.resume_page: int | None = None
+
+    @property
+    def remaining(self) -> float:
+        """Get the remaining time budget.
+
+        Returns:
+            float: remaining seconds, 0 once expired
+        """
+        return max(0.0, self._end_time - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Get whether the time budget ran out.
+
+        Returns:
+            bool: True if expired
+        """
+        return self.remaining <= 0
+
+    @property
+    def exceeded(self) -> bool:
+        """Get whether a crawl stopped early because of this deadline.
+
+        Returns:
+            bool: True if the crawl result is partial
+        """
+        return self.resume_page is not None
+
+    def stop_at(self, page: int):
+        """Record the first page a crawl didn't consume.
+
+        Args:
+            page (int): page to resume from
+        """
+        self.resume_page = page
+
+
+@dataclasses.dataclass(frozen=True)
+class CrawlProgress:
+    """Progress of a crawl, reported after every consumed page."""
+
+    pages: int = 0
+    products: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def summary(self) -> str:
+        """Get a short human readable description of the progress.
+
+        Returns:
+            str: progress summary
+        """
+        return (
+            f"{self.pages} pages, {self.products} products,"
+            f" {self.bytes / 1024:.0f} KB in {self.elapsed:.1f}s"
+        )
@@ -0,0 +1,107 @@
+import datetime
+import dataclasses
+
+from .card import Card
+
+# Fields compared when a card has no content hash, present with and without
+# product projection
+CARD_CONTENT_FIELDS = (
+    "handle",
+    "title",
+    "published_at",
+    "updated_at",
+    "image_url",
+    "variants",
+)
+
+
+@dataclasses.dataclass
+class CheckResult:
+    """Structured result of comparing two catalog snapshots.
+
+    A partial result comes from a crawl which ran out of its deadline.
+    """
+
+    added: list[Card] = dataclasses.field(default_factory=list)
+    removed: list[Card] = dataclasses.field(default_factory=list)
+    republished: list[Card] = dataclasses.field(default_factory=list)
+    modified: list[Card] = dataclasses.field(default_factory=list)
+    partial: bool = False
+
+    @property
+    def new_cards(self) -> list[Card]:
+        """Get cards which should be announced as new.
+
+        Returns:
+            list[Card]: added and re-published cards
+        """
+        return self.added + self.republished
+
+    @property
+    def has_changes(self) -> bool:
+        """Get whether the catalog changed at all.
+
+        Returns:
+            bool: True if any card was added, removed, re-published or modified
+        """
+        return bool(self.added or self.removed or self.republished or self.modified)
+
+
+def diff_cards(
+    previous: list[Card] | None,
+    current: list[Card],
+    since: datetime.datetime = None,
+) -> CheckResult:
+    """Classify catalog changes by product id in a single pass.
+
+    Without a previous snapshot every card is unknown, so only cards published
+    after ``since`` are reported as added. Cards are compared by content hash,
+    or by CARD_CONTENT_FIELDS when either card has none, such as cards loaded
+    from a cache written before hashes were stored.
+
+    Args:
+        previous (list[Card] | None): previous catalog snapshot
+        current (list[Card]): current catalog snapshot
+        since (datetime.datetime, optional): watermark used when there's no
+            previous snapshot. Defaults to None, which reports nothing.
+
+    Returns:
+        CheckResult: classified changes
+    """
+    result = CheckResult()
+    if previous is None:
+        if since is not None:
+            result.added = [
+                card
+                for card in current
+                if card.published_at is not None and card.published_at > since
+            ]
+        return result
+
+    previous_by_id = {card.id: card for card in previous}
+    for card in current:
+        previous_card = previous_by_id.pop(card.id, None)
+        if previous_card is None:
+            result.added.append(card)
+        elif card is previous_card:
+            continue
+        elif (
+            card.published_at is not None
+            and card.published_at != previous_card.published_at
+            and (
+                previous_card.published_at is None
+                or card.published_at > previous_card.published_at
+            )
+        ):
+            result.republished.append(card)
+        elif card.content_hash is not None and previous_card.content_hash is not None:
+            if card.content_hash != previous_card.content_hash:
+                result.modified.append(card)
+        elif any(
+            getattr(card, field) != getattr(previous_card, field)
+            for field in CARD_CONTENT_FIELDS
+        ):
+            result.modified.append(card)
+
+    result.removed = list(previous_by_id.values())
+    return result
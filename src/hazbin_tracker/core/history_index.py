@@ -0,0 +1,177 @@
+import bisect
+import logging
+import datetime
+
+from .constants import NICE_TIME_FORMAT
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_record_time(record: dict) -> datetime.datetime | None:
+    """Parse the timestamp of a check record.
+
+    Records store ISO UTC timestamps; records written before that store
+    NICE_TIME_FORMAT strings of UTC times.
+
+    Args:
+        record (dict): check record
+
+    Returns:
+        datetime.datetime | None: check time, None if missing or malformed
+    """
+    value = record.get("timestamp")
+    if not value:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        time = datetime.datetime.strptime(value, NICE_TIME_FORMAT)
+    except ValueError:
+        return None
+    return time.replace(tzinfo=datetime.UTC)
+
+
+def format_record_time(record: dict) -> str:
+    """Format the timestamp of a check record for display.
+
+    Args:
+        record (dict): check record
+
+    Returns:
+        str: time in NICE_TIME_FORMAT, the raw value if it can't be parsed
+    """
+    time = parse_record_time(record)
+    if time is None:
+        return record.get("timestamp", "")
+    return time.strftime(NICE_TIME_FORMAT)
+
+
+def record_has_changes(record: dict) -> bool:
+    """Get whether a check found any change.
+
+    Args:
+        record (dict): check record
+
+    Returns:
+        bool: True if cards were added, removed or modified
+    """
+    return bool(
+        record.get("new_cards")
+        or record.get("removed_count")
+        or record.get("modified_count")
+    )
+
+
+class CheckHistoryIndex:
+    """Sorted time index over check history records.
+
+    Time range queries bisect the sorted check times instead of parsing and
+    scanning every record. Records without a parseable timestamp aren't
+    indexed.
+    """
+
+    def __init__(self, records: list[dict]):
+        """Instance constructor.
+
+        Args:
+            records (list[dict]): check records in any order
+        """
+        timed = []
+        for record in records:
+            time = parse_record_time(record)
+            if time is None:
+                LOGGER.debug(f"Skipping check record without time: {record}")
+                continue
+            timed.append((time.timestamp(), record))
+        timed.sort(key=lambda item: item[0])
+        self._times = [time for time, _ in timed]
+        self._records = [record for _, record in timed]
+        self._change_times = [
+            time for time, record in timed if record_has_changes(record)
+        ]
+        self._change_records = [
+            record for _, record in timed if record_has_changes(record)
+        ]
+
+    def __len__(self) -> int:
+        """Get number of indexed records.
+
+        Returns:
+            int: number of records
+        """
+        return len(self._records)
+
+    @staticmethod
+    def _time_range(
+        times: list[float],
+        start: datetime.datetime = None,
+        end: datetime.datetime = None,
+    ) -> slice:
+        """Bisect the positions of a time range in sorted times.
+
+        Args:
+            times (list[float]): sorted timestamps
+            start (datetime.datetime, optional): range start, open if None
+            end (datetime.datetime, optional): range end, open if None
+
+        Returns:
+            slice: positions within the range
+        """
+        low = 0 if start is None else bisect.bisect_left(times, start.timestamp())
+        high = len(times) if end is None else bisect.bisect_right(times, end.timestamp())
+        return slice(low, high)
+
+    def between(
+        self,
+        start: datetime.datetime = None,
+        end: datetime.datetime = None,
+    ) -> list[dict]:
+        """Get checks made within a time range, bounds included.
+
+        Args:
+            start (datetime.datetime, optional): range start.
+                Defaults to None, which starts at the oldest check.
+            end (datetime.datetime, optional): range end.
+                Defaults to None, which ends at the newest check.
+
+        Returns:
+            list[dict]: check records, oldest first
+        """
+        return self._records[self._time_range(self._times, start, end)]
+
+    def changes_between(
+        self,
+        start: datetime.datetime = None,
+        end: datetime.datetime = None,
+    ) -> list[dict]:
+        """Get checks which found any change within a time range, bounds included.
+
+        Args:
+            start (datetime.datetime, optional): range start.
+                Defaults to None, which starts at the oldest check.
+            end (datetime.datetime, optional): range end.
+                Defaults to None, which ends at the newest check.
+
+        Returns:
+            list[dict]: check records, oldest first
+        """
+        return self._change_records[self._time_range(self._change_times, start, end)]
+
+    def last_with_changes(self, before: datetime.datetime = None) -> dict | None:
+        """Get the newest check which found any change.
+
+        Args:
+            before (datetime.datetime, optional): only consider checks made at
+                or before this time. Defaults to None, which considers all.
+
+        Returns:
+            dict | None: check record, None if no check found a change
+        """
+        position = (
+            len(self._change_times)
+            if before is None
+            else bisect.bisect_right(self._change_times, before.timestamp())
+        )
+        return self._change_records[position - 1] if position else None
@@ -0,0 +1,251 @@
+import json
+import logging
+import pathlib
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HistoryJournal:
+    """Append-only JSON-lines journal of check records.
+
+    Records are appended to the newest segment file, which is rotated once it
+    reaches ``segment_max_records`` records or ``segment_max_bytes`` bytes.
+    Segments holding only records past the retention are deleted by a
+    background compaction after each rotation, so appending never rewrites
+    existing records.
+    """
+
+    SEGMENT_PREFIX = "history-"
+    SEGMENT_SUFFIX = ".jsonl"
+    SEGMENT_MAX_RECORDS = 100
+    SEGMENT_MAX_BYTES = 1024 * 1024
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        segment_max_records: int = SEGMENT_MAX_RECORDS,
+        segment_max_bytes: int = SEGMENT_MAX_BYTES,
+    ):
+        """Instance constructor.
+
+        Args:
+            directory (pathlib.Path): directory holding the segment files
+            segment_max_records (int, optional): records per segment before
+                rotation. Defaults to SEGMENT_MAX_RECORDS.
+            segment_max_bytes (int, optional): segment size before rotation.
+                Defaults to SEGMENT_MAX_BYTES.
+        """
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_records = segment_max_records
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+        self._compaction_thread: threading.Thread | None = None
+        self._record_counts: dict[int, int] = {}
+
+        self._segments = self._scan_segments()
+        if not self._segments:
+            self._segments = [1]
+        self._repair_active_segment()
+        self._active_count = self.count_records(self._segments[-1])
+        self._active_bytes = self._size(self._segments[-1])
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return f"<HistoryJournal {self.directory}, segments={len(self._segments)}>"
+
+    def _scan_segments(self) -> list[int]:
+        """Get the sequence numbers of existing segments.
+
+        Returns:
+            list[int]: sorted segment sequence numbers
+        """
+        segments = []
+        for path in self.directory.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}"):
+            sequence = path.name[len(self.SEGMENT_PREFIX) : -len(self.SEGMENT_SUFFIX)]
+            if sequence.isdigit():
+                segments.append(int(sequence))
+        return sorted(segments)
+
+    def segment_path(self, sequence: int) -> pathlib.Path:
+        """Get the file of a segment.
+
+        Args:
+            sequence (int): segment sequence number
+
+        Returns:
+            pathlib.Path: segment file path
+        """
+        return (
+            self.directory / f"{self.SEGMENT_PREFIX}{sequence:06d}{self.SEGMENT_SUFFIX}"
+        )
+
+    def _repair_active_segment(self):
+        """Terminate a record left half-written by an interrupted append."""
+        path = self.segment_path(self._segments[-1])
+        if not self._size(self._segments[-1]):
+            return
+        with path.open("rb+") as segment_file:
+            segment_file.seek(-1, 2)
+            if segment_file.read(1) != b"\n":
+                segment_file.write(b"\n")
+                LOGGER.warning(f"Terminated incomplete history record in {path}")
+
+    def _size(self, sequence: int) -> int:
+        """Get the size of a segment file.
+
+        Args:
+            sequence (int): segment sequence number
+
+        Returns:
+            int: size in bytes, 0 if the segment doesn't exist
+        """
+        try:
+            return self.segment_path(sequence).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def count_records(self, sequence: int) -> int:
+        """Count the records of a segment without parsing them.
+
+        Args:
+            sequence (int): segment sequence number
+
+        Returns:
+            int: number of records
+        """
+        try:
+            return self.segment_path(sequence).read_bytes().count(b"\n")
+        except FileNotFoundError:
+            return 0
+
+    @property
+    def is_empty(self) -> bool:
+        """Get whether the journal holds no records.
+
+        Returns:
+            bool: True if empty
+        """
+        with self._lock:
+            return len(self._segments) == 1 and not self._active_count
+
+    def append(self, record: dict, retention: int = None):
+        """Append a record, rotating the active segment when it's full.
+
+        Args:
+            record (dict): check record
+            retention (int, optional): number of newest records to keep.
+                Defaults to None, which keeps all records.
+        """
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        with self._lock:
+            with self.segment_path(self._segments[-1]).open("ab") as segment_file:
+                segment_file.write(line)
+            self._active_count += 1
+            self._active_bytes += len(line)
+            rotated = (
+                self._active_count >= self.segment_max_records
+                or self._active_bytes >= self.segment_max_bytes
+            )
+            if rotated:
+                self._record_counts[self._segments[-1]] = self._active_count
+                self._segments.append(self._segments[-1] + 1)
+                self._active_count = 0
+                self._active_bytes = 0
+                LOGGER.debug(f"Rotated history journal to segment {self._segments[-1]}")
+        if rotated and retention is not None:
+            self.compact_in_background(retention)
+
+    def extend(self, records: list[dict], retention: int = None):
+        """Append records in order.
+
+        Args:
+            records (list[dict]): check records, oldest first
+            retention (int, optional): number of newest records to keep.
+        """
+        for record in records:
+            self.append(record)
+        if retention is not None:
+            self.compact(retention)
+
+    def tail(self, count: int = None) -> list[dict]:
+        """Read the newest records, newest first.
+
+        Only the segments covering the requested records are read, and only
+        the lines returned are parsed.
+
+        Args:
+            count (int, optional): number of records.
+                Defaults to None, which reads all records.
+
+        Returns:
+            list[dict]: check records
+        """
+        with self._lock:
+            segments = list(self._segments)
+        records = []
+        for sequence in reversed(segments):
+            if count is not None and len(records) >= count:
+                break
+            try:
+                lines = self.segment_path(sequence).read_bytes().splitlines()
+            except FileNotFoundError:
+                continue
+            for line in reversed(lines):
+                if count is not None and len(records) >= count:
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    LOGGER.warning(f"Skipping corrupt history record in {sequence}")
+        return records
+
+    def compact(self, retention: int):
+        """Delete segments holding only records past the retention.
+
+        Args:
+            retention (int): number of newest records to keep
+        """
+        with self._lock:
+            segments = list(self._segments)
+            kept = self._active_count
+        expired = []
+        for sequence in reversed(segments[:-1]):
+            if kept >= retention:
+                expired.append(sequence)
+                continue
+            if sequence not in self._record_counts:
+                self._record_counts[sequence] = self.count_records(sequence)
+            kept += self._record_counts[sequence]
+        if not expired:
+            return
+
+        with self._lock:
+            self._segments = [seq for seq in self._segments if seq not in expired]
+        for sequence in expired:
+            self.segment_path(sequence).unlink(missing_ok=True)
+            self._record_counts.pop(sequence, None)
+        LOGGER.debug(f"Compacted history journal, removed {len(expired)} segments")
+
+    def compact_in_background(self, retention: int):
+        """Run compaction on a worker thread unless one is already running.
+
+        Args:
+            retention (int): number of newest records to keep
+        """
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(
+            target=self.compact, args=(retention,), daemon=True
+        )
+        self._compaction_thread.start()
+
+    def wait_for_compaction(self):
+        """Block until a running background compaction finishes."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
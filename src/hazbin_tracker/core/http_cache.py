@@ -0,0 +1,254 @@
+import json
+import hashlib
+import logging
+import pathlib
+import threading
+import typing
+
+import requests
+
+from .constants import HTTP_CACHE_DIR
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """On-disk cache of validated JSON responses keyed by request URL.
+
+    Each entry keeps the response validators (ETag / Last-Modified) next to the
+    decoded body, so an unchanged resource can be revalidated with a conditional
+    request and served from cache on ``304 Not Modified``. Entries are also kept
+    in memory, so revalidating an unchanged page reads and parses nothing.
+    Decoded bodies are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, cache_dir: pathlib.Path = HTTP_CACHE_DIR):
+        """Instance constructor.
+
+        Args:
+            cache_dir (pathlib.Path, optional): directory holding cache entries.
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._memory: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<HttpCache dir={self.cache_dir}, hits={self.hits}, misses={self.misses}>"
+        )
+
+    @staticmethod
+    def request_url(url: str, params: dict = None) -> str:
+        """Get the full URL used as cache key for a request.
+
+        Args:
+            url (str): request URL
+            params (dict, optional): query parameters
+
+        Returns:
+            str: URL including the encoded query
+        """
+        return requests.Request("GET", url, params=params).prepare().url
+
+    def entry_path(self, url: str) -> pathlib.Path:
+        """Get path of the cache entry file for the given URL.
+
+        Args:
+            url (str): full request URL
+
+        Returns:
+            pathlib.Path: entry file path
+        """
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, url: str) -> dict | None:
+        """Get the cache entry for the given URL.
+
+        Args:
+            url (str): full request URL
+
+        Returns:
+            dict | None: entry with "etag", "last_modified" and "body" keys.
+        """
+        with self._lock:
+            entry = self._memory.get(url)
+        if entry is not None:
+            return entry
+
+        try:
+            entry = json.loads(self.entry_path(url).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if entry.get("url") != url:
+            return None
+
+        with self._lock:
+            self._memory[url] = entry
+        return entry
+
+    def conditional_headers(self, url: str) -> dict:
+        """Get revalidation headers for the cached entry of the given URL.
+
+        Args:
+            url (str): full request URL
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, empty if not cached.
+        """
+        entry = self.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, url: str) -> dict | None:
+        """Get the cache entry of a URL the server answered ``304`` for.
+
+        Args:
+            url (str): full request URL
+
+        Returns:
+            dict | None: cache entry, None if it vanished since it was validated
+        """
+        entry = self.get(url)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+        return entry
+
+    def store(self, url: str, response: requests.Response, body: typing.Any):
+        """Store a validated response body.
+
+        Args:
+            url (str): full request URL
+            response (requests.Response): response the body was decoded from
+            body (Any): JSON-serializable decoded body
+        """
+        self.store_body(url, response.headers, body)
+
+    def store_body(self, url: str, headers: typing.Mapping[str, str], body: typing.Any):
+        """Store a downloaded response body with its validators.
+
+        Responses without validators or marked as ``no-store`` are not cached.
+
+        Args:
+            url (str): full request URL
+            headers (Mapping[str, str]): case-insensitive response headers
+            body (Any): JSON-serializable decoded body
+        """
+        with self._lock:
+            self.misses += 1
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        path = self.entry_path(url)
+        temp_path = path.with_suffix(".tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(entry, separators=(",", ":")))
+            temp_path.replace(path)
+        except OSError:
+            LOGGER.warning(f"Failed to write HTTP cache entry: {path}")
+            return
+        with self._lock:
+            self._memory[url] = entry
+
+    def get_json(
+        self,
+        client,
+        url: str,
+        params: dict = None,
+        **kwargs,
+    ) -> typing.Any:
+        """Get decoded JSON body of a URL, revalidating the cached copy.
+
+        Args:
+            client (HttpClient): client used to send the request
+            url (str): request URL
+            params (dict, optional): query parameters
+            **kwargs: keyword arguments forwarded to the client
+
+        Returns:
+            Any: decoded JSON body
+        """
+        return self.fetch_json(client, url, params=params, **kwargs)[0]
+
+    def fetch_json(
+        self,
+        client,
+        url: str,
+        params: dict = None,
+        **kwargs,
+    ) -> tuple[typing.Any, int]:
+        """Get decoded JSON body of a URL and the number of downloaded bytes.
+
+        Args:
+            client (HttpClient): client used to send the request
+            url (str): request URL
+            params (dict, optional): query parameters
+            **kwargs: keyword arguments forwarded to the client
+
+        Returns:
+            tuple[Any, int]: decoded JSON body and body size, 0 if served from cache
+        """
+        full_url = self.request_url(url, params)
+        headers = {**kwargs.pop("headers", {}), **self.conditional_headers(full_url)}
+        response = client.get(full_url, headers=headers, **kwargs)
+
+        if response.status_code == requests.codes.not_modified:
+            entry = self.revalidated(full_url)
+            if entry is not None:
+                return entry["body"], 0
+            # Validators were sent but the entry vanished, fetch without them
+            response = client.get(full_url, **kwargs)
+
+        response.raise_for_status()
+        body = response.json()
+        self.store(full_url, response, body)
+        return body, len(response.content)
+
+    def clear(self):
+        """Remove all cache entries."""
+        with self._lock:
+            self._memory.clear()
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+
+_HTTP_CACHE: HttpCache = None
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Get the process-wide HTTP response cache.
+
+    Returns:
+        HttpCache: shared cache instance
+    """
+    global _HTTP_CACHE
+    with _HTTP_CACHE_LOCK:
+        if _HTTP_CACHE is None:
+            _HTTP_CACHE = HttpCache()
+        return _HTTP_CACHE
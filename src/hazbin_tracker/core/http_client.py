@@ -0,0 +1,428 @@
+import time
+import logging
+import threading
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import connection, connectionpool
+from urllib3.util.retry import Retry
+
+from .crawl import CancellationToken, CrawlCancelled
+from .rate_limit import CircuitBreaker, TokenBucket, backoff_delay, parse_retry_after
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HttpStats:
+    """Thread-safe counters describing connection usage of a client."""
+
+    def __init__(self):
+        """Instance constructor."""
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.handshake_time = 0.0
+        self.retries = 0
+        self.throttle_time = 0.0
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<HttpStats requests={self.requests},"
+            f" new_connections={self.new_connections},"
+            f" reused_connections={self.reused_connections},"
+            f" handshake_time={self.handshake_time:.3f}s,"
+            f" retries={self.retries}, throttle_time={self.throttle_time:.3f}s>"
+        )
+
+    @property
+    def reused_connections(self) -> int:
+        """Get number of requests served over an already open connection.
+
+        Returns:
+            int: number of reused connections
+        """
+        return max(0, self.requests - self.new_connections)
+
+    def record_request(self):
+        """Record a request sent through the client."""
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self):
+        """Record a retried request."""
+        with self._lock:
+            self.retries += 1
+
+    def record_throttle(self, duration: float):
+        """Record time spent waiting for the rate limiter.
+
+        Args:
+            duration (float): wait duration in seconds.
+        """
+        with self._lock:
+            self.throttle_time += duration
+
+    def record_handshake(self, duration: float):
+        """Record a new connection and the time spent establishing it.
+
+        Args:
+            duration (float): connect (TCP + TLS) duration in seconds.
+        """
+        with self._lock:
+            self.new_connections += 1
+            self.handshake_time += duration
+
+
+def _instrumented_pool_classes(stats: HttpStats) -> dict[str, type]:
+    """Create urllib3 pool classes which report connects to the given stats.
+
+    Args:
+        stats (HttpStats): stats receiving the handshake records.
+
+    Returns:
+        dict[str, type]: pool classes by URL scheme.
+    """
+
+    def timed_connect(base: type):
+        def connect(self):
+            start = time.perf_counter()
+            base.connect(self)
+            stats.record_handshake(time.perf_counter() - start)
+
+        return connect
+
+    http_connection = type(
+        "InstrumentedHTTPConnection",
+        (connection.HTTPConnection,),
+        {"connect": timed_connect(connection.HTTPConnection)},
+    )
+    https_connection = type(
+        "InstrumentedHTTPSConnection",
+        (connection.HTTPSConnection,),
+        {"connect": timed_connect(connection.HTTPSConnection)},
+    )
+    return {
+        "http": type(
+            "InstrumentedHTTPConnectionPool",
+            (connectionpool.HTTPConnectionPool,),
+            {"ConnectionCls": http_connection},
+        ),
+        "https": type(
+            "InstrumentedHTTPSConnectionPool",
+            (connectionpool.HTTPSConnectionPool,),
+            {"ConnectionCls": https_connection},
+        ),
+    }
+
+
+class InstrumentedAdapter(HTTPAdapter):
+    """Transport adapter whose connection pools report to HttpStats."""
+
+    def __init__(self, stats: HttpStats, **kwargs):
+        """Instance constructor.
+
+        Args:
+            stats (HttpStats): stats receiving the connection records.
+            **kwargs: HTTPAdapter keyword arguments.
+        """
+        self._pool_classes = _instrumented_pool_classes(stats)
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialize the pool manager with instrumented pool classes."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+
+class HttpClient:
+    """Long-lived HTTP client holding one pooled keep-alive session per host.
+
+    Retry and timeout policy for every outgoing request lives here, so the
+    scrapper and the notifier share connections for the whole process. Each
+    host gets a token bucket rate limit and a circuit breaker; idempotent
+    requests are retried with jittered exponential backoff, honouring the
+    Retry-After header.
+    """
+
+    TIMEOUT = 10
+    POOL_MAXSIZE = 16
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_BACKOFF_MAX = 30
+    RETRY_AFTER_MAX = 60
+    RETRY_STATUSES = (429, 502, 503, 504)
+    RETRY_METHODS = frozenset({"GET", "HEAD"})
+    RATE_LIMIT = 4.0
+    RATE_LIMIT_BURST = 8
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 60
+
+    def __init__(self, timeout: float = TIMEOUT, pool_maxsize: int = POOL_MAXSIZE):
+        """Instance constructor.
+
+        Args:
+            timeout (float, optional): default request timeout in seconds.
+            pool_maxsize (int, optional): connections kept alive per host.
+        """
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.stats = HttpStats()
+        self._sessions: dict[str, requests.Session] = {}
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._sleep = time.sleep
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return f"<HttpClient hosts={list(self._sessions)}, stats={self.stats}>"
+
+    def create_retry(self) -> Retry:
+        """Create the transport retry policy used by the sessions.
+
+        Retries are sent by HttpClient.request, so the transport doesn't retry.
+
+        Returns:
+            Retry: urllib3 retry policy
+        """
+        return Retry(0, read=False)
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Get the key identifying the host of the given URL.
+
+        Args:
+            url (str): request URL
+
+        Returns:
+            str: scheme and network location of the URL
+        """
+        parsed = urllib.parse.urlsplit(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def rate_limiter_for(self, url: str) -> TokenBucket:
+        """Get the rate limiter for the host of the given URL.
+
+        Args:
+            url (str): request URL
+
+        Returns:
+            TokenBucket: host rate limiter
+        """
+        host_key = self.host_key(url)
+        with self._lock:
+            if host_key not in self._rate_limiters:
+                self._rate_limiters[host_key] = TokenBucket(
+                    self.RATE_LIMIT, self.RATE_LIMIT_BURST
+                )
+            return self._rate_limiters[host_key]
+
+    def circuit_breaker_for(self, url: str) -> CircuitBreaker:
+        """Get the circuit breaker for the host of the given URL.
+
+        Args:
+            url (str): request URL
+
+        Returns:
+            CircuitBreaker: host circuit breaker
+        """
+        host_key = self.host_key(url)
+        with self._lock:
+            if host_key not in self._circuit_breakers:
+                self._circuit_breakers[host_key] = CircuitBreaker(
+                    self.CIRCUIT_FAILURE_THRESHOLD, self.CIRCUIT_RESET_TIMEOUT
+                )
+            return self._circuit_breakers[host_key]
+
+    def retry_delay(self, attempt: int, retry_after: str = None) -> float:
+        """Get the delay before retrying a request.
+
+        Args:
+            attempt (int): 0-based retry attempt
+            retry_after (str, optional): Retry-After header of the retried
+                response, which takes precedence over the backoff.
+
+        Returns:
+            float: delay in seconds
+        """
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            return min(retry_after, self.RETRY_AFTER_MAX)
+        return backoff_delay(attempt, self.RETRY_BACKOFF_FACTOR, self.RETRY_BACKOFF_MAX)
+
+    def session_for(self, url: str) -> requests.Session:
+        """Get the pooled session for the host of the given URL.
+
+        Args:
+            url (str): request URL
+
+        Returns:
+            requests.Session: session bound to the URL's host
+        """
+        host_key = self.host_key(url)
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                LOGGER.debug(f"Opening HTTP session for {host_key}")
+                session = requests.Session()
+                adapter = InstrumentedAdapter(
+                    self.stats,
+                    pool_connections=1,
+                    pool_maxsize=self.pool_maxsize,
+                    max_retries=self.create_retry(),
+                )
+                session.mount(f"{host_key}/", adapter)
+                self._sessions[host_key] = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session of the URL's host.
+
+        Args:
+            method (str): HTTP method
+            url (str): request URL
+            **kwargs: keyword arguments forwarded to requests.Session.request,
+                except ``cancel_token``, a CancellationToken checked before
+                every attempt and interrupting retry waits.
+
+        Returns:
+            requests.Response: response, the last one if retries ran out
+
+        Raises:
+            CircuitOpenError: if requests to the host are paused
+            CrawlCancelled: if the token was cancelled
+            requests.RequestException: if the request failed after all retries
+        """
+        cancel_token = kwargs.pop("cancel_token", None)
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.session_for(url)
+        rate_limiter = self.rate_limiter_for(url)
+        circuit_breaker = self.circuit_breaker_for(url)
+        host_key = self.host_key(url)
+        retryable = method.upper() in self.RETRY_METHODS
+
+        attempt = 0
+        trial = False
+        try:
+            while True:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                if not attempt:
+                    trial = circuit_breaker.before_request(host_key)
+                self.stats.record_throttle(rate_limiter.acquire())
+                self.stats.record_request()
+                try:
+                    response = session.request(method, url, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as err:
+                    circuit_breaker.record_failure()
+                    trial = False
+                    if not retryable or attempt >= self.RETRY_TOTAL:
+                        raise
+                    delay = self.retry_delay(attempt)
+                    reason = type(err).__name__
+                else:
+                    if response.status_code not in self.RETRY_STATUSES:
+                        circuit_breaker.record_success()
+                        trial = False
+                        return response
+                    # Throttling means the host is up, only server errors count
+                    if response.status_code != requests.codes.too_many_requests:
+                        circuit_breaker.record_failure()
+                        trial = False
+                    if not retryable or attempt >= self.RETRY_TOTAL:
+                        return response
+                    delay = self.retry_delay(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    reason = f"HTTP {response.status_code}"
+                    response.close()
+
+                # A throttled trial proves nothing, let the retry be the trial
+                if trial:
+                    circuit_breaker.release_trial()
+                # Fail fast instead of waiting when the failure opened the circuit
+                trial = circuit_breaker.before_request(host_key)
+                self.stats.record_retry()
+                LOGGER.warning(
+                    f"{method} {url} failed ({reason}), retrying in {delay:.1f}s"
+                    f" ({attempt + 1}/{self.RETRY_TOTAL})"
+                )
+                self._wait(delay, cancel_token)
+                attempt += 1
+        finally:
+            # Errors and throttled responses end the trial without a verdict
+            if trial:
+                circuit_breaker.release_trial()
+
+    def _wait(self, delay: float, cancel_token: CancellationToken = None):
+        """Wait before a retry, waking up as soon as the token is cancelled.
+
+        Args:
+            delay (float): delay in seconds
+            cancel_token (CancellationToken, optional): token ending the wait.
+
+        Raises:
+            CrawlCancelled: if the token was cancelled
+        """
+        if cancel_token is None:
+            self._sleep(delay)
+        elif cancel_token.wait(delay):
+            raise CrawlCancelled()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request.
+
+        Args:
+            url (str): request URL
+            **kwargs: keyword arguments forwarded to requests.Session.request
+
+        Returns:
+            requests.Response: response
+        """
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request.
+
+        Args:
+            url (str): request URL
+            **kwargs: keyword arguments forwarded to requests.Session.request
+
+        Returns:
+            requests.Response: response
+        """
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        """Close all sessions and their pooled connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_HTTP_CLIENT: HttpClient = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client.
+
+    Returns:
+        HttpClient: shared client instance
+    """
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = HttpClient()
+        return _HTTP_CLIENT
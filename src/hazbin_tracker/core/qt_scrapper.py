@@ -0,0 +1,482 @@
+import json
+import time
+import typing
+import logging
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from PySide6 import QtCore, QtNetwork
+
+from .card import Card
+from .crawl import CancellationToken, CrawlCancelled, CrawlDeadline, CrawlProgress
+from .scrapper import build_cards
+from .http_cache import HttpCache, get_http_cache
+from .http_client import HttpClient, get_http_client
+from .rate_limit import CircuitOpenError
+from .constants import (
+    HAZBIN_CARDS_PRODUCTS_JSON_URL,
+    PRODUCTS_REQUEST_LIMIT,
+    PRODUCTS_REQUEST_TIMEOUT,
+    PRODUCTS_REQUEST_CONCURRENCY,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def reply_headers(reply: QtNetwork.QNetworkReply) -> CaseInsensitiveDict:
+    """Get the headers of a network reply.
+
+    Args:
+        reply (QtNetwork.QNetworkReply): network reply
+
+    Returns:
+        CaseInsensitiveDict: response headers
+    """
+    return CaseInsensitiveDict(
+        (bytes(name.data()).decode(), bytes(value.data()).decode())
+        for name, value in reply.rawHeaderPairs()
+    )
+
+
+class QtProductsFetcher(QtCore.QObject):
+    """Fetch all collection products with QNetworkAccessManager.
+
+    Pages are requested in a sliding window of ``concurrency`` requests on the
+    Qt event loop, multiplexed over HTTP/2 when the server supports it, and
+    collected in page order until the first empty page.
+
+    Requests follow the same policy as HttpClient.request: they share the
+    host's token bucket and circuit breaker, throttled and failed pages are
+    retried after a jittered backoff or the Retry-After delay, and pages are
+    revalidated against the HttpCache. Waits are timers, never blocking calls.
+    """
+
+    finished = QtCore.Signal(list)
+    failed = QtCore.Signal(object)
+    progress = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        manager: QtNetwork.QNetworkAccessManager,
+        concurrency: int = PRODUCTS_REQUEST_CONCURRENCY,
+        url: str = HAZBIN_CARDS_PRODUCTS_JSON_URL,
+        cancel_token: CancellationToken = None,
+        start_page: int = 1,
+        deadline: CrawlDeadline = None,
+        client: HttpClient = None,
+        cache: HttpCache = None,
+        parent: QtCore.QObject = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            manager (QtNetwork.QNetworkAccessManager): manager sending requests
+            concurrency (int, optional): maximum number of pages requested at once.
+                Defaults to PRODUCTS_REQUEST_CONCURRENCY.
+            url (str, optional): products.json URL.
+                Defaults to HAZBIN_CARDS_PRODUCTS_JSON_URL.
+            cancel_token (CancellationToken, optional): token checked between pages.
+            start_page (int, optional): first page to fetch. Defaults to 1.
+            deadline (CrawlDeadline, optional): overall time budget. Products
+                fetched before it ran out are published as they are.
+            client (HttpClient, optional): client whose rate limiter, circuit
+                breaker, retry policy and stats apply. Defaults to the shared one.
+            cache (HttpCache, optional): cache revalidating pages.
+                Defaults to the shared one.
+            parent (QtCore.QObject, optional): parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.manager = manager
+        self.concurrency = max(1, concurrency)
+        self.url = url
+        self.cancel_token = cancel_token
+        self.client = client or get_http_client()
+        self.cache = cache or get_http_cache()
+        self._host_key = self.client.host_key(url)
+        self._rate_limiter = self.client.rate_limiter_for(url)
+        self._circuit_breaker = self.client.circuit_breaker_for(url)
+        self._replies: dict[int, QtNetwork.QNetworkReply] = {}
+        self._waiting: set[int] = set()
+        self._trials: set[int] = set()
+        self._pages: dict[int, tuple[list[dict], int]] = {}
+        self._products: list[dict] = []
+        self._start_page = start_page
+        self._next_page = start_page
+        self._page = start_page
+        self._done = False
+        self._bytes = 0
+        self._start_time = None
+        self.deadline = deadline
+        self._deadline_timer = QtCore.QTimer(self)
+        self._deadline_timer.setSingleShot(True)
+        self._deadline_timer.timeout.connect(self._on_deadline_exceeded)
+
+    def page_url(self, page: int) -> str:
+        """Get the full URL of a products page, as keyed in the HttpCache.
+
+        Args:
+            page (int): 1-based page number
+
+        Returns:
+            str: page URL
+        """
+        return self.cache.request_url(
+            self.url, {"limit": PRODUCTS_REQUEST_LIMIT, "page": page}
+        )
+
+    def create_request(
+        self, page: int, revalidate: bool = True
+    ) -> QtNetwork.QNetworkRequest:
+        """Create the request for a products page.
+
+        Args:
+            page (int): 1-based page number
+            revalidate (bool, optional): send the validators of the cached page.
+                Defaults to True.
+
+        Returns:
+            QtNetwork.QNetworkRequest: page request
+        """
+        page_url = self.page_url(page)
+        request = QtNetwork.QNetworkRequest(QtCore.QUrl(page_url))
+        request.setAttribute(QtNetwork.QNetworkRequest.Http2AllowedAttribute, True)
+        request.setTransferTimeout(PRODUCTS_REQUEST_TIMEOUT * 1000)
+        if revalidate:
+            for name, value in self.cache.conditional_headers(page_url).items():
+                request.setRawHeader(name.encode(), value.encode())
+        return request
+
+    def start(self):
+        """Start fetching pages."""
+        LOGGER.debug(f"Fetching products with Qt backend ({self.concurrency} at once)")
+        self._start_time = time.perf_counter()
+        if self.deadline is not None:
+            self._deadline_timer.start(int(self.deadline.remaining * 1000))
+        self._fill_window()
+
+    def _fill_window(self):
+        """Keep ``concurrency`` page requests in flight or waiting to be sent."""
+        while (
+            not self._done and len(self._replies) + len(self._waiting) < self.concurrency
+        ):
+            page = self._next_page
+            self._next_page += 1
+            try:
+                if self._circuit_breaker.before_request(self._host_key):
+                    self._trials.add(page)
+            except CircuitOpenError as err:
+                self._fail(err)
+                return
+            self._send(page)
+
+    @QtCore.Slot()
+    def cancel(self):
+        """Stop fetching at once, aborting requests in flight and retry waits."""
+        if not self._done:
+            self._fail(CrawlCancelled())
+
+    def _send(self, page: int, attempt: int = 0, revalidate: bool = True):
+        """Send a page request once the host's rate limiter allows it.
+
+        Args:
+            page (int): 1-based page number
+            attempt (int, optional): 0-based retry attempt. Defaults to 0.
+            revalidate (bool, optional): send the validators of the cached page.
+                Defaults to True.
+        """
+        self._waiting.discard(page)
+        if self._done:
+            return
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            self._end_trial(page)
+            self._fail(CrawlCancelled())
+            return
+        wait_time = self._rate_limiter.try_acquire()
+        if wait_time:
+            self.client.stats.record_throttle(wait_time)
+            self._send_later(page, wait_time, attempt, revalidate)
+            return
+
+        self.client.stats.record_request()
+        reply = self.manager.get(self.create_request(page, revalidate))
+        reply.finished.connect(
+            lambda page=page, attempt=attempt: self._on_reply_finished(page, attempt)
+        )
+        self._replies[page] = reply
+
+    def _send_later(
+        self, page: int, delay: float, attempt: int = 0, revalidate: bool = True
+    ):
+        """Send a page request after a delay.
+
+        Args:
+            page (int): 1-based page number
+            delay (float): delay in seconds
+            attempt (int, optional): 0-based retry attempt. Defaults to 0.
+            revalidate (bool, optional): send the validators of the cached page.
+                Defaults to True.
+        """
+        self._waiting.add(page)
+        QtCore.QTimer.singleShot(
+            int(delay * 1000), self, lambda: self._send(page, attempt, revalidate)
+        )
+
+    def _end_trial(self, page: int, success: bool = None):
+        """Report the outcome of a page request to the circuit breaker.
+
+        Args:
+            page (int): 1-based page number
+            success (bool, optional): whether the host answered properly.
+                Defaults to None, which records no verdict.
+        """
+        if success is True:
+            self._circuit_breaker.record_success()
+        elif success is False:
+            self._circuit_breaker.record_failure()
+        elif page in self._trials:
+            self._circuit_breaker.release_trial()
+        self._trials.discard(page)
+
+    def _retry(self, page: int, attempt: int, reason: str, retry_after: str = None):
+        """Retry a page request after the backoff delay.
+
+        Args:
+            page (int): 1-based page number
+            attempt (int): 0-based attempt which failed
+            reason (str): failure description
+            retry_after (str, optional): Retry-After header of the response.
+        """
+        # A throttled trial proves nothing, let the retry be the trial
+        self._end_trial(page)
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            self._fail(CrawlCancelled())
+            return
+        try:
+            # Fail fast instead of waiting when the failure opened the circuit
+            if self._circuit_breaker.before_request(self._host_key):
+                self._trials.add(page)
+        except CircuitOpenError as err:
+            self._fail(err)
+            return
+        delay = self.client.retry_delay(attempt, retry_after)
+        self.client.stats.record_retry()
+        LOGGER.warning(
+            f"GET {self.page_url(page)} failed ({reason}), retrying in {delay:.1f}s"
+            f" ({attempt + 1}/{self.client.RETRY_TOTAL})"
+        )
+        self._send_later(page, delay, attempt + 1)
+
+    def _on_reply_finished(self, page: int, attempt: int = 0):
+        """Collect a finished page and consume pages that are ready in order.
+
+        Args:
+            page (int): finished page number
+            attempt (int, optional): 0-based attempt of the request.
+        """
+        reply = self._replies.pop(page, None)
+        if reply is None or self._done:
+            return
+        reply.deleteLater()
+
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            self._end_trial(page)
+            self._fail(CrawlCancelled())
+            return
+        status = reply.attribute(QtNetwork.QNetworkRequest.HttpStatusCodeAttribute)
+        retries_left = attempt < self.client.RETRY_TOTAL
+        if status is None:
+            self._end_trial(page, success=False)
+            if retries_left:
+                self._retry(page, attempt, reply.errorString())
+            else:
+                self._fail(ConnectionError(reply.errorString()))
+            return
+        if status in self.client.RETRY_STATUSES:
+            # Throttling means the host is up, only server errors count
+            if status != requests.codes.too_many_requests:
+                self._end_trial(page, success=False)
+            if retries_left:
+                retry_after = reply_headers(reply).get("Retry-After")
+                self._retry(page, attempt, f"HTTP {status}", retry_after)
+                return
+            self._end_trial(page)
+        else:
+            self._end_trial(page, success=True)
+
+        page_url = self.page_url(page)
+        if status == requests.codes.not_modified:
+            entry = self.cache.revalidated(page_url)
+            if entry is None:
+                # Validators were sent but the entry vanished, fetch without them
+                self._send(page, attempt, revalidate=False)
+                return
+            self._pages[page] = (entry["body"].get("products") or [], 0)
+            self._consume_pages()
+            return
+        if status >= 400:
+            self._fail(requests.HTTPError(f"HTTP {status} for url: {page_url}"))
+            return
+        body = bytes(reply.readAll().data())
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as err:
+            self._fail(err)
+            return
+        self.cache.store_body(page_url, reply_headers(reply), data)
+        self._pages[page] = (data.get("products") or [], len(body))
+        self._consume_pages()
+
+    def _consume_pages(self):
+        """Consume the pages that are ready in page order."""
+        while self._page in self._pages:
+            products, size = self._pages.pop(self._page)
+            if not products:
+                self._finish()
+                return
+            self._products.extend(products)
+            self._bytes += size
+            self.progress.emit(self.crawl_progress())
+            self._page += 1
+        self._fill_window()
+
+    def crawl_progress(self) -> CrawlProgress:
+        """Get the progress of the pages consumed so far.
+
+        Returns:
+            CrawlProgress: crawl progress
+        """
+        return CrawlProgress(
+            pages=self._page - self._start_page + 1,
+            products=len(self._products),
+            bytes=self._bytes,
+            elapsed=time.perf_counter() - self._start_time,
+        )
+
+    @QtCore.Slot()
+    def _on_deadline_exceeded(self):
+        """Stop fetching and publish the products fetched so far."""
+        if self._done:
+            return
+        LOGGER.warning(f"Crawl deadline exceeded, stopping at page {self._page}")
+        self.deadline.stop_at(self._page)
+        self._finish()
+
+    def _abort_pending(self):
+        """Abort requests still in flight."""
+        self._done = True
+        self._deadline_timer.stop()
+        # Aborted requests end their trial without a verdict
+        for page in list(self._trials):
+            self._end_trial(page)
+        self._waiting.clear()
+        # Aborting emits finished synchronously, so detach replies first
+        replies, self._replies = self._replies, {}
+        for reply in replies.values():
+            reply.abort()
+            reply.deleteLater()
+
+    def _finish(self):
+        """Finish fetching and publish products in page order."""
+        self._abort_pending()
+        LOGGER.debug(
+            f"Fetched {len(self._products)} products"
+            f" from {self._page - self._start_page} pages"
+        )
+        self.finished.emit(self._products)
+
+    def _fail(self, error: Exception):
+        """Stop fetching and publish the error.
+
+        Args:
+            error (Exception): error the fetch failed with
+        """
+        self._abort_pending()
+        if isinstance(error, CrawlCancelled):
+            LOGGER.info("Crawl cancelled.")
+        else:
+            LOGGER.error(f"Failed to fetch products: {error}")
+        self.failed.emit(error)
+
+
+class QtCardsFetcher(QtCore.QObject):
+    """Fetch all trading cards with the Qt network backend.
+
+    Produces the same sorted cards as scrapper.get_all_cards.
+    """
+
+    finished = QtCore.Signal(list)
+    failed = QtCore.Signal(object)
+    progress = QtCore.Signal(object)
+
+    def __init__(
+        self,
+        manager: QtNetwork.QNetworkAccessManager,
+        concurrency: int = PRODUCTS_REQUEST_CONCURRENCY,
+        project: bool = True,
+        known_cards: typing.Mapping[int, Card] = None,
+        url: str = HAZBIN_CARDS_PRODUCTS_JSON_URL,
+        cancel_token: CancellationToken = None,
+        start_page: int = 1,
+        deadline: CrawlDeadline = None,
+        client: HttpClient = None,
+        cache: HttpCache = None,
+        parent: QtCore.QObject = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            manager (QtNetwork.QNetworkAccessManager): manager sending requests
+            concurrency (int, optional): maximum number of pages requested at once.
+            project (bool, optional): keep only the projected product fields.
+            known_cards (Mapping[int, Card], optional): previously built cards by id.
+            url (str, optional): products.json URL.
+            cancel_token (CancellationToken, optional): token checked between pages.
+            start_page (int, optional): first page to fetch. Defaults to 1.
+            deadline (CrawlDeadline, optional): overall time budget of the crawl.
+            client (HttpClient, optional): client whose request policy applies.
+            cache (HttpCache, optional): cache revalidating pages.
+            parent (QtCore.QObject, optional): parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.project = project
+        self.known_cards = known_cards
+        self._products_fetcher = QtProductsFetcher(
+            manager,
+            concurrency=concurrency,
+            url=url,
+            cancel_token=cancel_token,
+            start_page=start_page,
+            deadline=deadline,
+            client=client,
+            cache=cache,
+            parent=self,
+        )
+        self._products_fetcher.progress.connect(self.progress)
+        self._products_fetcher.finished.connect(self._on_products_fetched)
+        self._products_fetcher.failed.connect(self.failed)
+
+    def start(self):
+        """Start fetching cards."""
+        self._products_fetcher.start()
+
+    @QtCore.Slot()
+    def cancel(self):
+        """Stop fetching at once."""
+        self._products_fetcher.cancel()
+
+    @QtCore.Slot(list)
+    def _on_products_fetched(self, products: list[dict]):
+        """Build cards from fetched products.
+
+        Args:
+            products (list[dict]): fetched products
+        """
+        try:
+            cards = build_cards(
+                products, project=self.project, known_cards=self.known_cards
+            )
+        except Exception as err:
+            LOGGER.exception("Failed to build cards.")
+            self.failed.emit(err)
+            return
+        self.finished.emit(cards)
@@ -0,0 +1,254 @@
+import time
+import random
+import typing
+import logging
+import datetime
+import threading
+import email.utils
+
+import requests
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised when requests to a host are paused by its circuit breaker."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate to a single host."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+        sleep: typing.Callable[[float], None] = time.sleep,
+    ):
+        """Instance constructor.
+
+        Args:
+            rate (float): tokens added per second
+            capacity (float): maximum number of tokens, i.e. the allowed burst
+            clock (Callable, optional): monotonic clock. Defaults to time.monotonic.
+            sleep (Callable, optional): sleep function. Defaults to time.sleep.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens accumulated since the last update."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available.
+
+        Returns:
+            float: seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait_time = self.try_acquire()
+            if not wait_time:
+                return waited
+            self._sleep(wait_time)
+            waited += wait_time
+
+
+class CircuitBreaker:
+    """Circuit breaker pausing requests to a host that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail fast for ``reset_timeout`` seconds. Then a single trial
+    request is let through; its success closes the circuit again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        """Instance constructor.
+
+        Args:
+            failure_threshold (int): consecutive failures opening the circuit
+            reset_timeout (float): seconds the circuit stays open
+            clock (Callable, optional): monotonic clock. Defaults to time.monotonic.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.open_count = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<CircuitBreaker state={self.state}, failures={self._failures},"
+            f" opened={self.open_count}>"
+        )
+
+    @property
+    def state(self) -> str:
+        """Get the current circuit state.
+
+        Returns:
+            str: CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        """Get the circuit state, moving to half-open once the timeout passed.
+
+        Returns:
+            str: circuit state
+        """
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def before_request(self, host: str = "") -> bool:
+        """Check whether a request may be sent.
+
+        A trial request must end with record_success, record_failure or
+        release_trial, otherwise no further request is let through.
+
+        Args:
+            host (str, optional): host name used in the error message.
+
+        Returns:
+            bool: True if the request is the half-open trial request
+
+        Raises:
+            CircuitOpenError: if the circuit is open
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return False
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            remaining = self.reset_timeout - (self._clock() - self._opened_at)
+        raise CircuitOpenError(
+            f"Requests to {host or 'host'} paused for {max(0.0, remaining):.0f}s"
+            " after repeated failures."
+        )
+
+    def release_trial(self):
+        """End a trial request which neither succeeded nor failed.
+
+        The circuit stays half-open and the next request becomes the trial.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != self.OPEN:
+                    self.open_count += 1
+                    LOGGER.warning(
+                        f"Opening circuit after {self._failures} failures,"
+                        f" pausing requests for {self.reset_timeout}s"
+                    )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    rng: typing.Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Get a jittered exponential backoff delay.
+
+    Uses "full jitter": a random delay between 0 and the exponential backoff.
+
+    Args:
+        attempt (int): 0-based retry attempt
+        base (float): backoff of the first retry in seconds
+        cap (float): maximum backoff in seconds
+        rng (Callable, optional): random number generator.
+            Defaults to random.uniform.
+
+    Returns:
+        float: delay in seconds
+    """
+    return rng(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value (str | None): header value, either delay seconds or an HTTP date
+
+    Returns:
+        float | None: delay in seconds, None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_time = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_time.tzinfo is None:
+        retry_time = retry_time.replace(tzinfo=datetime.UTC)
+    delay = (retry_time - datetime.datetime.now(datetime.UTC)).total_seconds()
+    return max(0.0, delay)
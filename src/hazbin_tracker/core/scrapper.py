@@ -1,54 +1,501 @@
+import time
+import typing
+import datetime
 import requests
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from .card import Card, compute_content_hash
+from .crawl import CancellationToken, CrawlCancelled, CrawlDeadline, CrawlProgress
+from .http_client import get_http_client
+from .http_cache import get_http_cache
 from .constants import (
     HAZBIN_CARDS_PRODUCTS_JSON_URL,
+    HAZBIN_PRODUCT_JSON_URL,
     PRODUCTS_REQUEST_LIMIT,
+    PRODUCTS_REQUEST_TIMEOUT,
+    PRODUCTS_REQUEST_CONCURRENCY,
     DEFAULT_SORT_KEY,
+    PRODUCTS_SORT_NEWEST_FIRST,
+    PRODUCT_PROJECTION_FIELDS,
+    PRODUCT_VARIANT_PROJECTION_FIELDS,
 )
 
 LOGGER = logging.getLogger(__name__)
 
 PRODUCT_TITLE_PREFIX = "Hazbin Hotel Trading Cards"
+UNPUBLISHED_SORT_TIME = datetime.datetime.min.replace(tzinfo=datetime.UTC)
 
 
-def get_all_products() -> list[dict]:
+def get_products_page(
+    page: int,
+    sort_by: str = None,
+    limit: int = PRODUCTS_REQUEST_LIMIT,
+    cancel_token: CancellationToken = None,
+) -> list[dict]:
+    """Get a single page of products from the trading cards collection.
+
+    Pages are revalidated against the HTTP cache, so an unchanged page is
+    served from the cached body without being downloaded or parsed again.
+
+    Args:
+        page (int): 1-based page number.
+        sort_by (str, optional): collection sort order. Defaults to None, which
+            uses the collection's default order.
+        limit (int, optional): page size. Defaults to PRODUCTS_REQUEST_LIMIT.
+        cancel_token (CancellationToken, optional): token interrupting retries.
+
+    Returns:
+        list[dict]: products on the page, empty once past the last page.
+    """
+    return fetch_products_page(
+        page, sort_by=sort_by, limit=limit, cancel_token=cancel_token
+    )[0]
+
+
+def fetch_products_page(
+    page: int,
+    sort_by: str = None,
+    limit: int = PRODUCTS_REQUEST_LIMIT,
+    cancel_token: CancellationToken = None,
+) -> tuple[list[dict], int]:
+    """Get a single page of products and the number of downloaded bytes.
+
+    Args:
+        page (int): 1-based page number.
+        sort_by (str, optional): collection sort order. Defaults to None.
+        limit (int, optional): page size. Defaults to PRODUCTS_REQUEST_LIMIT.
+        cancel_token (CancellationToken, optional): token interrupting retries.
+
+    Returns:
+        tuple[list[dict], int]: products on the page and downloaded body size.
+    """
+    params = {"limit": limit, "page": page}
+    if sort_by:
+        params["sort_by"] = sort_by
+    data, size = get_http_cache().fetch_json(
+        get_http_client(),
+        HAZBIN_CARDS_PRODUCTS_JSON_URL,
+        params=params,
+        timeout=PRODUCTS_REQUEST_TIMEOUT,
+        cancel_token=cancel_token,
+    )
+    return data.get("products") or [], size
+
+
+def get_product(handle: str) -> dict:
+    """Get the full product payload for the given product handle.
+
+    Args:
+        handle (str): product handle
+
+    Returns:
+        dict: full product dictionary
+    """
+    data = get_http_cache().get_json(
+        get_http_client(),
+        HAZBIN_PRODUCT_JSON_URL.format(handle=handle),
+        timeout=PRODUCTS_REQUEST_TIMEOUT,
+    )
+    return data.get("product") or {}
+
+
+def iter_products_pages(
+    concurrency: int = PRODUCTS_REQUEST_CONCURRENCY,
+    cancel_token: CancellationToken = None,
+    start_page: int = 1,
+    deadline: CrawlDeadline = None,
+) -> typing.Iterator[tuple[list[dict], CrawlProgress]]:
+    """Iterate over the pages of the trading cards collection.
+
+    Pages are fetched ahead in a sliding window of ``concurrency`` requests and
+    yielded in page order until the first empty page. Once the deadline runs
+    out, iteration stops and the deadline records the page to resume from.
+
+    Args:
+        concurrency (int, optional): maximum number of pages requested at once.
+            Defaults to PRODUCTS_REQUEST_CONCURRENCY.
+        cancel_token (CancellationToken, optional): token checked between pages
+            and interrupting retries.
+        start_page (int, optional): first page to fetch. Defaults to 1.
+        deadline (CrawlDeadline, optional): overall time budget of the crawl.
+
+    Yields:
+        tuple[list[dict], CrawlProgress]: page products and crawl progress so far
+
+    Raises:
+        CrawlCancelled: if the token was cancelled
+        requests.exceptions.ConnectionError: if a page can't be fetched, so a
+            cut-off crawl is never mistaken for the whole catalog
+    """
+    concurrency = max(1, concurrency)
+    pending: dict[int, Future] = {}
+    next_page = start_page
+    page = start_page
+    products_count = 0
+    bytes_count = 0
+    start_time = time.perf_counter()
+
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="products-page"
+    )
+    try:
+        while True:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+
+            # Keep the window full
+            while len(pending) < concurrency:
+                pending[next_page] = executor.submit(
+                    fetch_products_page, next_page, cancel_token=cancel_token
+                )
+                next_page += 1
+
+            try:
+                data, size = pending.pop(page).result(
+                    timeout=deadline.remaining if deadline is not None else None
+                )
+            except TimeoutError:
+                LOGGER.warning(f"Crawl deadline exceeded, stopping at page {page}")
+                deadline.stop_at(page)
+                break
+            except requests.exceptions.ConnectionError:
+                LOGGER.error(f"No network connection, crawl failed at page {page}.")
+                raise
+            if not data:
+                break
+
+            products_count += len(data)
+            bytes_count += size
+            yield (
+                data,
+                CrawlProgress(
+                    pages=page - start_page + 1,
+                    products=products_count,
+                    bytes=bytes_count,
+                    elapsed=time.perf_counter() - start_time,
+                ),
+            )
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_all_products(
+    concurrency: int = PRODUCTS_REQUEST_CONCURRENCY,
+    progress_callback: typing.Callable[[CrawlProgress], None] = None,
+    cancel_token: CancellationToken = None,
+    start_page: int = 1,
+    deadline: CrawlDeadline = None,
+) -> list[dict]:
     """Get all products from the Hazbin Hotel trading cards collection.
 
+    Args:
+        concurrency (int, optional): maximum number of pages requested at once.
+            Defaults to PRODUCTS_REQUEST_CONCURRENCY.
+        progress_callback (Callable, optional): called with the crawl progress
+            after every page.
+        cancel_token (CancellationToken, optional): token checked between pages.
+        start_page (int, optional): first page to fetch. Defaults to 1.
+        deadline (CrawlDeadline, optional): overall time budget. Products fetched
+            before it ran out are returned and ``deadline.exceeded`` is set.
+
     Returns:
         list: A list of all product dictionaries.
+
+    Raises:
+        CrawlCancelled: if the token was cancelled
+        requests.exceptions.ConnectionError: if a page can't be fetched
     """
     all_products = []
+    progress = CrawlProgress()
+    try:
+        for data, progress in iter_products_pages(
+            concurrency, cancel_token, start_page=start_page, deadline=deadline
+        ):
+            all_products.extend(data)
+            if progress_callback is not None:
+                progress_callback(progress)
+    except CrawlCancelled:
+        LOGGER.info(f"Crawl cancelled after {progress.summary}")
+        raise
+
+    LOGGER.debug(f"Fetched {progress.summary}")
+    return all_products
+
+
+def get_latest_product(cancel_token: CancellationToken = None) -> dict | None:
+    """Get the most recently published product with a single small request.
+
+    Two products are requested so the newest-first ordering can be confirmed.
+
+    Args:
+        cancel_token (CancellationToken, optional): token interrupting retries.
+
+    Returns:
+        dict | None: newest product. None if the collection is empty or the
+            shop didn't honour the requested ordering.
+    """
+    data = get_products_page(
+        1, sort_by=PRODUCTS_SORT_NEWEST_FIRST, limit=2, cancel_token=cancel_token
+    )
+    if not data:
+        return None
+    published_times = [product.get(DEFAULT_SORT_KEY) for product in data]
+    if None in published_times or (
+        len(published_times) > 1
+        and datetime.datetime.fromisoformat(published_times[0])
+        < datetime.datetime.fromisoformat(published_times[1])
+    ):
+        LOGGER.warning("Products are not sorted newest first.")
+        return None
+    return data[0]
+
+
+def get_new_products(
+    since: datetime.datetime,
+    cancel_token: CancellationToken = None,
+) -> list[dict] | None:
+    """Get products published after the given time, newest first.
+
+    The collection is requested in newest-created-first order and paging stops
+    at the first page whose oldest product was published before ``since``.
+    A product created earlier but published after ``since`` on a page past the
+    stop page is missed, it's picked up by the next full crawl. Unpublished
+    products are skipped.
+
+    Args:
+        since (datetime.datetime): watermark, usually the last check time.
+        cancel_token (CancellationToken, optional): token checked between pages
+            and interrupting retries.
+
+    Returns:
+        list[dict] | None: products published after ``since``. None if the shop
+            didn't honour the requested ordering and a full crawl is needed.
+
+    Raises:
+        CrawlCancelled: if the token was cancelled
+        requests.exceptions.ConnectionError: if a page can't be fetched
+    """
+    new_products = []
     page = 1
+    previous_time = None
     while True:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
         try:
-            resp = requests.get(
-                HAZBIN_CARDS_PRODUCTS_JSON_URL,
-                params={"limit": PRODUCTS_REQUEST_LIMIT, "page": page},
-                timeout=10,
+            data = get_products_page(
+                page, sort_by=PRODUCTS_SORT_NEWEST_FIRST, cancel_token=cancel_token
             )
         except requests.exceptions.ConnectionError:
-            LOGGER.error("No network connection.")
-            break
-        resp.raise_for_status()
-        data = resp.json().get("products")
+            LOGGER.error(f"No network connection, crawl failed at page {page}.")
+            raise
         if not data:
             break
-        all_products.extend(data)
+
+        for product in data:
+            if product.get(DEFAULT_SORT_KEY) is None:
+                continue
+            published_at = datetime.datetime.fromisoformat(product[DEFAULT_SORT_KEY])
+            if previous_time is not None and published_at > previous_time:
+                LOGGER.warning("Products are not sorted newest first.")
+                return None
+            previous_time = published_at
+            if published_at > since:
+                new_products.append(product)
+
+        if previous_time is not None and previous_time <= since:
+            break
         page += 1
-    return all_products
+
+    LOGGER.debug(f"Fetched {len(new_products)} new products from {page} pages")
+    return new_products
 
 
-def get_all_cards() -> list[dict]:
-    """Get all trading card sorted by the default sort key.
+def project_product(
+    product: dict,
+    fields: tuple[str] = PRODUCT_PROJECTION_FIELDS,
+) -> dict:
+    """Create a lightweight copy of a product with only the fields in use.
+
+    Only the first image URL is kept, and variants are reduced to their
+    availability and price. Use get_product for the full payload.
+
+    Args:
+        product (dict): full product dictionary
+        fields (tuple[str], optional): top level fields to keep.
+            Defaults to PRODUCT_PROJECTION_FIELDS.
 
     Returns:
-        list[dict]: A list of sorted cards dictionaries.
+        dict: projected product dictionary
     """
-    products = get_all_products()
+    projected = {field: product.get(field) for field in fields}
+    images = product.get("images")
+    projected["images"] = [{"src": images[0].get("src")}] if images else []
+    projected["variants"] = [
+        {field: variant.get(field) for field in PRODUCT_VARIANT_PROJECTION_FIELDS}
+        for variant in product.get("variants") or []
+    ]
+    return projected
+
+
+def normalize_card_titles(products: list[dict]) -> list[dict]:
+    """Strip the collection prefix from product titles.
+
+    Products may be cached response bodies shared between checks, so they're
+    never modified; products whose title changes are copied.
+
+    Args:
+        products (list[dict]): products to normalize
+
+    Returns:
+        list[dict]: normalized products
+    """
+    normalized = []
     for product in products:
         title = product.get("title")
         if isinstance(title, str) and title.startswith(PRODUCT_TITLE_PREFIX):
-            product["title"] = title.split(PRODUCT_TITLE_PREFIX, maxsplit=1)[-1].strip()
+            title = title.split(PRODUCT_TITLE_PREFIX, maxsplit=1)[-1].strip()
+            product = {**product, "title": title}
+        normalized.append(product)
+    return normalized
+
+
+def build_cards(
+    products: list[dict],
+    project: bool = True,
+    known_cards: typing.Mapping[int, Card] = None,
+) -> list[Card]:
+    """Turn raw products into sorted cards.
+
+    Every card carries a content hash of its scraped product. Known cards with
+    an unchanged hash are reused as they are instead of being rebuilt.
+
+    Args:
+        products (list[dict]): products as returned by the shop
+        project (bool, optional): keep only the projected fields.
+            Defaults to True.
+        known_cards (Mapping[int, Card], optional): previously built cards by id.
+
+    Returns:
+        list[Card]: sorted cards
+    """
+    known_cards = known_cards or {}
+    cards = []
+    for product in products:
+        if project:
+            product = project_product(product)
+        content_hash = compute_content_hash(product)
+        known_card = known_cards.get(product.get("id"))
+        if known_card is not None and known_card.content_hash == content_hash:
+            cards.append(known_card)
+            continue
+        (product,) = normalize_card_titles([product])
+        card = Card.from_dict(product)
+        card.content_hash = content_hash
+        cards.append(card)
+    return sort_cards(cards)
+
 
-    return sorted(products, key=lambda x: x[DEFAULT_SORT_KEY], reverse=True)
+def sort_cards(cards: typing.Iterable[Card]) -> list[Card]:
+    """Sort cards by publish time, newest first.
+
+    Unpublished cards without a publish time are sorted last.
+
+    Args:
+        cards (Iterable[Card]): cards to sort
+
+    Returns:
+        list[Card]: sorted cards
+    """
+    return sorted(
+        cards,
+        key=lambda card: (
+            card.published_at is not None,
+            card.published_at or UNPUBLISHED_SORT_TIME,
+        ),
+        reverse=True,
+    )
+
+
+def merge_cards(cards: list[Card], fresh_cards: list[Card]) -> list[Card]:
+    """Merge freshly fetched cards into an existing catalog.
+
+    Args:
+        cards (list[Card]): existing catalog
+        fresh_cards (list[Card]): cards replacing or extending the catalog
+
+    Returns:
+        list[Card]: merged catalog sorted by publish time
+    """
+    if not fresh_cards:
+        return list(cards)
+    merged = {card.id: card for card in cards}
+    merged.update((card.id, card) for card in fresh_cards)
+    return sort_cards(merged.values())
+
+
+def get_all_cards(
+    concurrency: int = PRODUCTS_REQUEST_CONCURRENCY,
+    project: bool = True,
+    known_cards: typing.Mapping[int, Card] = None,
+    progress_callback: typing.Callable[[CrawlProgress], None] = None,
+    cancel_token: CancellationToken = None,
+    start_page: int = 1,
+    deadline: CrawlDeadline = None,
+) -> list[Card]:
+    """Get all trading card sorted by publish time.
+
+    Args:
+        concurrency (int, optional): maximum number of pages requested at once.
+            Defaults to PRODUCTS_REQUEST_CONCURRENCY.
+        project (bool, optional): keep only the projected product fields.
+            Defaults to True.
+        known_cards (Mapping[int, Card], optional): previously built cards by id,
+            reused when their content is unchanged.
+        progress_callback (Callable, optional): called with the crawl progress
+            after every page.
+        cancel_token (CancellationToken, optional): token checked between pages.
+        start_page (int, optional): first page to fetch. Defaults to 1.
+        deadline (CrawlDeadline, optional): overall time budget of the crawl.
+
+    Returns:
+        list[Card]: A list of sorted cards.
+
+    Raises:
+        CrawlCancelled: if the token was cancelled
+    """
+    products = get_all_products(
+        concurrency=concurrency,
+        progress_callback=progress_callback,
+        cancel_token=cancel_token,
+        start_page=start_page,
+        deadline=deadline,
+    )
+    return build_cards(products, project=project, known_cards=known_cards)
+
+
+def get_new_cards(
+    since: datetime.datetime,
+    project: bool = True,
+    known_cards: typing.Mapping[int, Card] = None,
+    cancel_token: CancellationToken = None,
+) -> list[Card] | None:
+    """Get trading cards published after the given time.
+
+    Args:
+        since (datetime.datetime): watermark, usually the last check time.
+        project (bool, optional): keep only the projected product fields.
+            Defaults to True.
+        known_cards (Mapping[int, Card], optional): previously built cards by id,
+            reused when their content is unchanged.
+        cancel_token (CancellationToken, optional): token checked between pages
+            and interrupting retries.
+
+    Returns:
+        list[Card] | None: sorted new cards, None if a full crawl is needed.
+    """
+    products = get_new_products(since, cancel_token=cancel_token)
+    if products is None:
+        return None
+    return build_cards(products, project=project, known_cards=known_cards)
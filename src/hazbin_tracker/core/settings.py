@@ -1,5 +1,20 @@
 import logging
-from hazbin_tracker.core.constants import SETTINGS_FILE_PATH
+from hazbin_tracker.core.constants import (
+    SETTINGS_FILE_PATH,
+    PRODUCTS_REQUEST_CONCURRENCY,
+)
+from hazbin_tracker.core.snapshot_codec import (
+    SNAPSHOT_CODEC_BINARY,
+    SNAPSHOT_CODEC_GZIP,
+    SNAPSHOT_CODEC_JSON,
+    SNAPSHOT_CODEC_LZMA,
+    SNAPSHOT_CODECS,
+)
+from hazbin_tracker.core.storage import (
+    STORAGE_BACKEND_JSON,
+    STORAGE_BACKEND_SQLITE,
+    STORAGE_BACKENDS,
+)
 from PySide6 import QtCore
 
 LOGGER = logging.getLogger(__name__)
@@ -12,6 +27,27 @@ class HazbinSettings(QtCore.QObject):
     TRACKER_CHECK_FREQUENCY_DEFAULT = 60
     CHECK_HISTORY_SIZE_DEFAULT = 50
     CHECK_HISTORY_SIZE_MINIMUM = 10
+    SCRAPE_CONCURRENCY_DEFAULT = PRODUCTS_REQUEST_CONCURRENCY
+    SCRAPE_CONCURRENCY_MINIMUM = 1
+    SCRAPE_CONCURRENCY_MAXIMUM = 16
+    # Head probes and incremental crawls see products in creation order, so a
+    # product created earlier but published later is only found by a full crawl
+    # and can go unnoticed for up to this many checks.
+    FULL_RESYNC_INTERVAL_DEFAULT = 12
+    FULL_RESYNC_INTERVAL_MINIMUM = 1
+    CHECK_DEADLINE_DEFAULT = 0
+    CHECK_DEADLINE_MINIMUM = 0
+    SCRAPER_BACKEND_REQUESTS = "requests"
+    SCRAPER_BACKEND_QT = "qt"
+    SCRAPER_BACKENDS = (SCRAPER_BACKEND_REQUESTS, SCRAPER_BACKEND_QT)
+    STORAGE_BACKEND_JSON = STORAGE_BACKEND_JSON
+    STORAGE_BACKEND_SQLITE = STORAGE_BACKEND_SQLITE
+    STORAGE_BACKENDS = STORAGE_BACKENDS
+    SNAPSHOT_CODEC_JSON = SNAPSHOT_CODEC_JSON
+    SNAPSHOT_CODEC_GZIP = SNAPSHOT_CODEC_GZIP
+    SNAPSHOT_CODEC_LZMA = SNAPSHOT_CODEC_LZMA
+    SNAPSHOT_CODEC_BINARY = SNAPSHOT_CODEC_BINARY
+    SNAPSHOT_CODECS = tuple(SNAPSHOT_CODECS)
 
     tracker_frequency_changed = QtCore.Signal(int)
 
@@ -106,3 +142,186 @@ class HazbinSettings(QtCore.QObject):
             value = self.CHECK_HISTORY_SIZE_MINIMUM
         self._settings.setValue("tracker/check_history_size", value)
         LOGGER.info(f"Check history size set to: {value}")
+
+    @property
+    def scrape_concurrency(self) -> int:
+        """Get the maximum number of product pages requested at once.
+
+        Returns:
+            int: number of concurrent page requests
+        """
+        return self._settings.value(
+            "tracker/scrape_concurrency",
+            defaultValue=self.SCRAPE_CONCURRENCY_DEFAULT,
+            type=int,
+        )
+
+    @scrape_concurrency.setter
+    def scrape_concurrency(self, value: int):
+        value = max(
+            self.SCRAPE_CONCURRENCY_MINIMUM,
+            min(value, self.SCRAPE_CONCURRENCY_MAXIMUM),
+        )
+        self._settings.setValue("tracker/scrape_concurrency", value)
+        LOGGER.info(f"Scrape concurrency set to: {value}")
+
+    @property
+    def incremental_crawl(self) -> bool:
+        """Get whether checks only crawl products newer than the last check.
+
+        Off by default: pages are sorted by creation time, so products created
+        earlier but published later are only found by the next full resync.
+
+        Returns:
+            bool: incremental crawl state
+        """
+        return self._settings.value(
+            "tracker/incremental_crawl", defaultValue=False, type=bool
+        )
+
+    @incremental_crawl.setter
+    def incremental_crawl(self, state: bool):
+        self._settings.setValue("tracker/incremental_crawl", state)
+        LOGGER.info(f"Incremental crawl set to: {state}")
+
+    @property
+    def head_probe(self) -> bool:
+        """Get whether checks probe the newest product before crawling.
+
+        Returns:
+            bool: head probe state
+        """
+        return self._settings.value("tracker/head_probe", defaultValue=False, type=bool)
+
+    @head_probe.setter
+    def head_probe(self, state: bool):
+        self._settings.setValue("tracker/head_probe", state)
+        LOGGER.info(f"Head probe set to: {state}")
+
+    @property
+    def full_resync_interval(self) -> int:
+        """Get the number of checks between forced full crawls.
+
+        Returns:
+            int: number of checks
+        """
+        return self._settings.value(
+            "tracker/full_resync_interval",
+            defaultValue=self.FULL_RESYNC_INTERVAL_DEFAULT,
+            type=int,
+        )
+
+    @full_resync_interval.setter
+    def full_resync_interval(self, value: int):
+        value = max(self.FULL_RESYNC_INTERVAL_MINIMUM, value)
+        self._settings.setValue("tracker/full_resync_interval", value)
+        LOGGER.info(f"Full resync interval set to: {value} checks")
+
+    @property
+    def project_products(self) -> bool:
+        """Get whether only the used product fields are kept.
+
+        Returns:
+            bool: product projection state
+        """
+        return self._settings.value(
+            "tracker/project_products", defaultValue=True, type=bool
+        )
+
+    @project_products.setter
+    def project_products(self, state: bool):
+        self._settings.setValue("tracker/project_products", state)
+        LOGGER.info(f"Product projection set to: {state}")
+
+    @property
+    def scraper_backend(self) -> str:
+        """Get the backend used to fetch product pages.
+
+        Returns:
+            str: scraper backend, one of SCRAPER_BACKENDS
+        """
+        backend = self._settings.value(
+            "tracker/scraper_backend",
+            defaultValue=self.SCRAPER_BACKEND_REQUESTS,
+            type=str,
+        )
+        if backend not in self.SCRAPER_BACKENDS:
+            return self.SCRAPER_BACKEND_REQUESTS
+        return backend
+
+    @scraper_backend.setter
+    def scraper_backend(self, backend: str):
+        if backend not in self.SCRAPER_BACKENDS:
+            raise ValueError(f"Unknown scraper backend: {backend}")
+        self._settings.setValue("tracker/scraper_backend", backend)
+        LOGGER.info(f"Scraper backend set to: {backend}")
+
+    @property
+    def storage_backend(self) -> str:
+        """Get the backend storing the catalog and check history.
+
+        Changes apply on the next start of the application.
+
+        Returns:
+            str: storage backend, one of STORAGE_BACKENDS
+        """
+        backend = self._settings.value(
+            "tracker/storage_backend",
+            defaultValue=self.STORAGE_BACKEND_JSON,
+            type=str,
+        )
+        if backend not in self.STORAGE_BACKENDS:
+            return self.STORAGE_BACKEND_JSON
+        return backend
+
+    @storage_backend.setter
+    def storage_backend(self, backend: str):
+        if backend not in self.STORAGE_BACKENDS:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        self._settings.setValue("tracker/storage_backend", backend)
+        LOGGER.info(f"Storage backend set to: {backend}")
+
+    @property
+    def snapshot_codec(self) -> str:
+        """Get the encoding of catalog snapshots written by the JSON storage.
+
+        Existing snapshots are read whatever their encoding. Changes apply on
+        the next start of the application.
+
+        Returns:
+            str: snapshot codec, one of SNAPSHOT_CODECS
+        """
+        codec = self._settings.value(
+            "tracker/snapshot_codec",
+            defaultValue=self.SNAPSHOT_CODEC_JSON,
+            type=str,
+        )
+        if codec not in self.SNAPSHOT_CODECS:
+            return self.SNAPSHOT_CODEC_JSON
+        return codec
+
+    @snapshot_codec.setter
+    def snapshot_codec(self, codec: str):
+        if codec not in self.SNAPSHOT_CODECS:
+            raise ValueError(f"Unknown snapshot codec: {codec}")
+        self._settings.setValue("tracker/snapshot_codec", codec)
+        LOGGER.info(f"Snapshot codec set to: {codec}")
+
+    @property
+    def check_deadline(self) -> int:
+        """Get the overall time budget of a check crawl.
+
+        Returns:
+            int: deadline in seconds, 0 if checks have no deadline
+        """
+        return self._settings.value(
+            "tracker/check_deadline",
+            defaultValue=self.CHECK_DEADLINE_DEFAULT,
+            type=int,
+        )
+
+    @check_deadline.setter
+    def check_deadline(self, value: int):
+        value = max(self.CHECK_DEADLINE_MINIMUM, value)
+        self._settings.setValue("tracker/check_deadline", value)
+        LOGGER.info(f"Check deadline set to: {value}s")
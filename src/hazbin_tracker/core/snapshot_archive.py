@@ -0,0 +1,284 @@
+import os
+import json
+import bisect
+import logging
+import pathlib
+import datetime
+
+from .card import Card
+from .diff import CheckResult
+from .scrapper import sort_cards
+from .constants import SNAPSHOT_ARCHIVE_DIR
+from .snapshot_store import SnapshotStore, atomic_write
+from .snapshot_codec import (
+    DECODE_ERRORS,
+    SNAPSHOT_CODEC_JSON,
+    SnapshotCodec,
+    detect_codec,
+    get_codec,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ArchiveNotFoundError(Exception):
+    """Raised when the archive holds no catalog at or before a requested time."""
+
+
+class SnapshotArchive:
+    """Point-in-time history of the catalog.
+
+    The archive holds periodic full keyframes of the catalog and, after each
+    keyframe, a JSON-lines file of per-check deltas with the ``upserted`` card
+    dictionaries and the ``removed`` card ids. Checks which changed nothing
+    aren't recorded, so the archive grows with the amount of change rather
+    than with the number of checks.
+
+    The catalog at any recorded time is rebuilt from the newest keyframe at or
+    before that time by replaying its deltas up to that time. A check whose
+    record failed breaks that chain, so the next record writes a keyframe.
+    """
+
+    KEYFRAME_PREFIX = "keyframe-"
+    KEYFRAME_SUFFIX = ".snapshot"
+    DELTAS_PREFIX = "deltas-"
+    DELTAS_SUFFIX = ".jsonl"
+    KEYFRAME_INTERVAL = 100
+
+    def __init__(
+        self,
+        directory: pathlib.Path = SNAPSHOT_ARCHIVE_DIR,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        codec: SnapshotCodec = None,
+    ):
+        """Instance constructor.
+
+        The directory is created and scanned on first use.
+
+        Args:
+            directory (pathlib.Path, optional): archive directory.
+                Defaults to SNAPSHOT_ARCHIVE_DIR.
+            keyframe_interval (int, optional): number of deltas before the next
+                keyframe. Defaults to KEYFRAME_INTERVAL.
+            codec (SnapshotCodec, optional): codec of written keyframes.
+                Defaults to None, which writes JSON lines.
+        """
+        self.directory = pathlib.Path(directory)
+        self.keyframe_interval = keyframe_interval
+        self.codec = codec or get_codec(SNAPSHOT_CODEC_JSON)
+        self._keyframe_times: list[datetime.datetime] | None = None
+        self._keyframe_sequences: list[int] = []
+        self._delta_count = 0
+        self._keyframe_due = False
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        keyframes = len(self._keyframe_sequences)
+        return f"<SnapshotArchive {self.directory}, keyframes={keyframes}>"
+
+    def keyframe_path(self, sequence: int) -> pathlib.Path:
+        """Get the file of a keyframe.
+
+        Args:
+            sequence (int): keyframe sequence number
+
+        Returns:
+            pathlib.Path: keyframe file path
+        """
+        return (
+            self.directory
+            / f"{self.KEYFRAME_PREFIX}{sequence:06d}{self.KEYFRAME_SUFFIX}"
+        )
+
+    def deltas_path(self, sequence: int) -> pathlib.Path:
+        """Get the delta file following a keyframe.
+
+        Args:
+            sequence (int): keyframe sequence number
+
+        Returns:
+            pathlib.Path: delta file path
+        """
+        return self.directory / f"{self.DELTAS_PREFIX}{sequence:06d}{self.DELTAS_SUFFIX}"
+
+    def _read_keyframe(self, sequence: int, with_cards: bool = False):
+        """Read a keyframe header and optionally its cards.
+
+        Args:
+            sequence (int): keyframe sequence number
+            with_cards (bool, optional): decode the cards too. Defaults to False.
+
+        Returns:
+            tuple[dict, list[dict] | None]: keyframe header and card dictionaries
+        """
+        with self.keyframe_path(sequence).open("rb") as keyframe_file:
+            codec = detect_codec(keyframe_file)
+            stream = codec.wrap(keyframe_file)
+            header = codec.read_header(stream)
+            cards = list(codec.iter_cards(stream, header)) if with_cards else None
+        return header, cards
+
+    def _read_deltas(self, sequence: int) -> list[dict]:
+        """Read the deltas following a keyframe, skipping torn records.
+
+        Args:
+            sequence (int): keyframe sequence number
+
+        Returns:
+            list[dict]: deltas, oldest first
+        """
+        try:
+            lines = self.deltas_path(sequence).read_bytes().splitlines()
+        except FileNotFoundError:
+            return []
+        deltas = []
+        for line in lines:
+            try:
+                deltas.append(json.loads(line))
+            except json.JSONDecodeError:
+                LOGGER.warning(f"Skipping torn archive record in {sequence}")
+        return deltas
+
+    def _load_index(self):
+        """Index keyframes by time from their headers."""
+        if self._keyframe_times is not None:
+            return
+        self._keyframe_times = []
+        self._keyframe_sequences = []
+        pattern = f"{self.KEYFRAME_PREFIX}*{self.KEYFRAME_SUFFIX}"
+        sequences = []
+        for path in self.directory.glob(pattern):
+            sequence = path.name[len(self.KEYFRAME_PREFIX) : -len(self.KEYFRAME_SUFFIX)]
+            if sequence.isdigit():
+                sequences.append(int(sequence))
+        for sequence in sorted(sequences):
+            try:
+                header, _ = self._read_keyframe(sequence)
+                time = datetime.datetime.fromisoformat(header["time"])
+            except (*DECODE_ERRORS, KeyError) as err:
+                LOGGER.warning(f"Skipping unreadable archive keyframe {sequence}: {err}")
+                continue
+            self._keyframe_times.append(time)
+            self._keyframe_sequences.append(sequence)
+        if self._keyframe_sequences:
+            self._delta_count = len(self._read_deltas(self._keyframe_sequences[-1]))
+        LOGGER.debug(f"Indexed {self}")
+
+    @property
+    def keyframe_times(self) -> list[datetime.datetime]:
+        """Get the times of archived keyframes.
+
+        Returns:
+            list[datetime.datetime]: keyframe times, oldest first
+        """
+        self._load_index()
+        return list(self._keyframe_times)
+
+    def record(
+        self,
+        time: datetime.datetime,
+        cards: list[Card],
+        changes: CheckResult = None,
+    ):
+        """Archive the catalog state after a check.
+
+        A keyframe is written if the archive is empty, the changes are unknown,
+        the previous record failed or the keyframe interval has passed;
+        otherwise only the changes are appended. Checks without changes aren't
+        recorded.
+
+        Args:
+            time (datetime.datetime): check time
+            cards (list[Card]): catalog after the check
+            changes (CheckResult, optional): changes since the previous check.
+                Defaults to None, which writes a keyframe.
+
+        Raises:
+            OSError: if the archive can't be written
+        """
+        self._load_index()
+        try:
+            if not self._keyframe_sequences or changes is None or self._keyframe_due:
+                self.write_keyframe(time, cards)
+            elif not changes.has_changes:
+                return
+            elif self._delta_count >= self.keyframe_interval:
+                self.write_keyframe(time, cards)
+            else:
+                self.append_delta(time, changes)
+        except OSError:
+            self._keyframe_due = True
+            raise
+
+    def write_keyframe(self, time: datetime.datetime, cards: list[Card]):
+        """Write a full keyframe of the catalog.
+
+        Args:
+            time (datetime.datetime): check time
+            cards (list[Card]): catalog
+        """
+        self._load_index()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sequence = self._keyframe_sequences[-1] + 1 if self._keyframe_sequences else 1
+        data = self.codec.encode(
+            {"time": time.isoformat()}, [card.to_dict() for card in cards]
+        )
+        atomic_write(self.keyframe_path(sequence), data)
+        self._keyframe_times.append(time)
+        self._keyframe_sequences.append(sequence)
+        self._delta_count = 0
+        self._keyframe_due = False
+        LOGGER.debug(f"Archived keyframe of {len(cards)} cards: {self}")
+
+    def append_delta(self, time: datetime.datetime, changes: CheckResult):
+        """Durably append the changes of a check after the newest keyframe.
+
+        Args:
+            time (datetime.datetime): check time
+            changes (CheckResult): changes since the previous check
+        """
+        delta = {
+            "time": time.isoformat(),
+            "upserted": [
+                card.to_dict()
+                for card in changes.added + changes.republished + changes.modified
+            ],
+            "removed": [card.id for card in changes.removed],
+        }
+        line = (json.dumps(delta, separators=(",", ":")) + "\n").encode()
+        with self.deltas_path(self._keyframe_sequences[-1]).open("ab") as deltas_file:
+            deltas_file.write(line)
+            deltas_file.flush()
+            os.fsync(deltas_file.fileno())
+        self._delta_count += 1
+        LOGGER.debug(f"Archived delta of {len(delta['upserted'])} cards")
+
+    def rebuild(self, at: datetime.datetime) -> list[Card]:
+        """Rebuild the catalog as it was at a point in time.
+
+        Args:
+            at (datetime.datetime): point in time
+
+        Returns:
+            list[Card]: cards sorted by publish time, newest first
+
+        Raises:
+            ArchiveNotFoundError: if nothing was archived at or before the time
+        """
+        self._load_index()
+        index = bisect.bisect_right(self._keyframe_times, at) - 1
+        if index < 0:
+            raise ArchiveNotFoundError(f"No catalog archived before {at.isoformat()}")
+
+        sequence = self._keyframe_sequences[index]
+        _, cards = self._read_keyframe(sequence, with_cards=True)
+        for delta in self._read_deltas(sequence):
+            if datetime.datetime.fromisoformat(delta["time"]) > at:
+                break
+            cards = SnapshotStore.apply_delta(cards, delta)
+        LOGGER.debug(f"Rebuilt {len(cards)} cards at {at.isoformat()}")
+        return sort_cards(Card.from_dict(card) for card in cards)
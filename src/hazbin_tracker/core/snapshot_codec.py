@@ -0,0 +1,332 @@
+import io
+import json
+import lzma
+import gzip
+import struct
+import typing
+
+SNAPSHOT_CODEC_JSON = "json"
+SNAPSHOT_CODEC_GZIP = "gzip"
+SNAPSHOT_CODEC_LZMA = "lzma"
+SNAPSHOT_CODEC_BINARY = "binary"
+
+# Errors raised while decoding a corrupt or truncated snapshot
+DECODE_ERRORS = (OSError, ValueError, EOFError, lzma.LZMAError)
+
+
+def _dumps(value) -> bytes:
+    """Encode a value as compact JSON.
+
+    Args:
+        value (Any): JSON serializable value
+
+    Returns:
+        bytes: encoded value
+    """
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class SnapshotCodec:
+    """Encoding of a snapshot header followed by card records.
+
+    Codecs read the header without decoding the cards, and decode cards one
+    record at a time from a binary stream.
+    """
+
+    name = SNAPSHOT_CODEC_JSON
+    magic = b""
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return f"<{type(self).__name__} {self.name}>"
+
+    def encode(self, header: dict, cards: list[dict]) -> bytes:
+        """Encode a snapshot as one JSON line per record, header first.
+
+        Args:
+            header (dict): snapshot header
+            cards (list[dict]): card dictionaries
+
+        Returns:
+            bytes: encoded snapshot
+        """
+        lines = [_dumps(header)]
+        lines.extend(_dumps(card) for card in cards)
+        return b"\n".join(lines) + b"\n"
+
+    def wrap(self, stream: typing.BinaryIO) -> typing.BinaryIO:
+        """Get the stream records are read from.
+
+        Args:
+            stream (BinaryIO): snapshot file
+
+        Returns:
+            BinaryIO: decoded stream
+        """
+        return stream
+
+    def read_header(self, stream: typing.BinaryIO) -> dict:
+        """Read the header record.
+
+        Args:
+            stream (BinaryIO): stream returned by wrap
+
+        Returns:
+            dict: snapshot header
+
+        Raises:
+            ValueError: if the header can't be decoded
+        """
+        return json.loads(stream.readline())
+
+    def iter_cards(self, stream: typing.BinaryIO, header: dict) -> typing.Iterator[dict]:
+        """Decode card records following the header.
+
+        Args:
+            stream (BinaryIO): stream positioned after the header
+            header (dict): header returned by read_header
+
+        Yields:
+            dict: card dictionary
+
+        Raises:
+            ValueError: if a record can't be decoded
+        """
+        for line in stream:
+            yield json.loads(line)
+
+
+class GzipSnapshotCodec(SnapshotCodec):
+    """JSON lines snapshot compressed with gzip."""
+
+    name = SNAPSHOT_CODEC_GZIP
+    magic = b"\x1f\x8b"
+
+    def encode(self, header: dict, cards: list[dict]) -> bytes:
+        """Encode a gzip compressed snapshot.
+
+        Args:
+            header (dict): snapshot header
+            cards (list[dict]): card dictionaries
+
+        Returns:
+            bytes: encoded snapshot
+        """
+        return gzip.compress(super().encode(header, cards), compresslevel=6, mtime=0)
+
+    def wrap(self, stream: typing.BinaryIO) -> typing.BinaryIO:
+        """Decompress the stream on the fly.
+
+        Args:
+            stream (BinaryIO): snapshot file
+
+        Returns:
+            BinaryIO: decompressed stream
+        """
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+
+
+class LzmaSnapshotCodec(SnapshotCodec):
+    """JSON lines snapshot compressed with xz."""
+
+    name = SNAPSHOT_CODEC_LZMA
+    magic = b"\xfd7zXZ\x00"
+
+    def encode(self, header: dict, cards: list[dict]) -> bytes:
+        """Encode an xz compressed snapshot.
+
+        Args:
+            header (dict): snapshot header
+            cards (list[dict]): card dictionaries
+
+        Returns:
+            bytes: encoded snapshot
+        """
+        return lzma.compress(super().encode(header, cards), preset=6)
+
+    def wrap(self, stream: typing.BinaryIO) -> typing.BinaryIO:
+        """Decompress the stream on the fly.
+
+        Args:
+            stream (BinaryIO): snapshot file
+
+        Returns:
+            BinaryIO: decompressed stream
+        """
+        return lzma.LZMAFile(stream, mode="rb")
+
+
+class BinarySnapshotCodec(SnapshotCodec):
+    """Length-prefixed binary records.
+
+    After the magic and a format version byte, every record is a big-endian
+    32-bit length followed by compact JSON. Card keys are stored once in the
+    header ``fields`` list and cards with exactly those keys are stored as
+    value arrays, so repeated keys don't take space.
+    """
+
+    name = SNAPSHOT_CODEC_BINARY
+    magic = b"HZSN"
+    VERSION = 1
+    LENGTH = struct.Struct(">I")
+
+    def _record(self, payload: bytes) -> bytes:
+        """Prefix a record with its length.
+
+        Args:
+            payload (bytes): record payload
+
+        Returns:
+            bytes: length-prefixed record
+        """
+        return self.LENGTH.pack(len(payload)) + payload
+
+    def encode(self, header: dict, cards: list[dict]) -> bytes:
+        """Encode a binary snapshot.
+
+        Args:
+            header (dict): snapshot header
+            cards (list[dict]): card dictionaries
+
+        Returns:
+            bytes: encoded snapshot
+        """
+        fields = list(cards[0]) if cards else []
+        records = [self.magic, bytes([self.VERSION])]
+        records.append(self._record(_dumps({**header, "fields": fields})))
+        for card in cards:
+            if list(card) == fields:
+                records.append(self._record(_dumps(list(card.values()))))
+            else:
+                records.append(self._record(_dumps(card)))
+        return b"".join(records)
+
+    def _read_record(self, stream: typing.BinaryIO) -> bytes | None:
+        """Read the next length-prefixed record.
+
+        Args:
+            stream (BinaryIO): snapshot stream
+
+        Returns:
+            bytes | None: record payload, None at the end of the stream
+
+        Raises:
+            ValueError: if the record is truncated
+        """
+        prefix = stream.read(self.LENGTH.size)
+        if not prefix:
+            return None
+        if len(prefix) < self.LENGTH.size:
+            raise ValueError("Truncated record length")
+        (length,) = self.LENGTH.unpack(prefix)
+        payload = stream.read(length)
+        if len(payload) < length:
+            raise ValueError("Truncated record")
+        return payload
+
+    def read_header(self, stream: typing.BinaryIO) -> dict:
+        """Check the magic and version, then read the header record.
+
+        Args:
+            stream (BinaryIO): snapshot file
+
+        Returns:
+            dict: snapshot header
+
+        Raises:
+            ValueError: if the file isn't a supported binary snapshot
+        """
+        if stream.read(len(self.magic)) != self.magic:
+            raise ValueError("Not a binary snapshot")
+        version = stream.read(1)
+        if version != bytes([self.VERSION]):
+            raise ValueError(f"Unsupported binary snapshot version: {version!r}")
+        payload = self._read_record(stream)
+        if payload is None:
+            raise ValueError("Missing snapshot header")
+        return json.loads(payload)
+
+    def iter_cards(self, stream: typing.BinaryIO, header: dict) -> typing.Iterator[dict]:
+        """Decode card records following the header.
+
+        Args:
+            stream (BinaryIO): stream positioned after the header
+            header (dict): header returned by read_header, holding card fields
+
+        Yields:
+            dict: card dictionary
+        """
+        fields = header.get("fields", [])
+        while (payload := self._read_record(stream)) is not None:
+            card = json.loads(payload)
+            yield dict(zip(fields, card)) if isinstance(card, list) else card
+
+
+SNAPSHOT_CODECS: dict[str, SnapshotCodec] = {
+    codec.name: codec
+    for codec in (
+        SnapshotCodec(),
+        GzipSnapshotCodec(),
+        LzmaSnapshotCodec(),
+        BinarySnapshotCodec(),
+    )
+}
+
+
+def get_codec(name: str) -> SnapshotCodec:
+    """Get a codec by name.
+
+    Args:
+        name (str): one of SNAPSHOT_CODECS
+
+    Returns:
+        SnapshotCodec: codec
+
+    Raises:
+        ValueError: if the codec is unknown
+    """
+    try:
+        return SNAPSHOT_CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown snapshot codec: {name}") from None
+
+
+def detect_codec(stream: typing.BinaryIO) -> SnapshotCodec:
+    """Detect the codec of a snapshot file from its leading magic bytes.
+
+    Files without a known magic, including legacy JSON documents, are read
+    as JSON lines. The stream position is left unchanged.
+
+    Args:
+        stream (BinaryIO): snapshot file
+
+    Returns:
+        SnapshotCodec: detected codec
+    """
+    position = stream.tell()
+    lead = stream.read(8)
+    stream.seek(position)
+    for codec in SNAPSHOT_CODECS.values():
+        if codec.magic and lead.startswith(codec.magic):
+            return codec
+    return SNAPSHOT_CODECS[SNAPSHOT_CODEC_JSON]
+
+
+def decode(data: bytes) -> tuple[dict, list[dict]]:
+    """Decode a whole snapshot with the detected codec.
+
+    Args:
+        data (bytes): encoded snapshot
+
+    Returns:
+        tuple[dict, list[dict]]: snapshot header and card dictionaries
+    """
+    stream = io.BytesIO(data)
+    codec = detect_codec(stream)
+    stream = codec.wrap(stream)
+    header = codec.read_header(stream)
+    return header, list(codec.iter_cards(stream, header))
@@ -0,0 +1,324 @@
+import os
+import json
+import uuid
+import logging
+import pathlib
+
+from .snapshot_codec import (
+    DECODE_ERRORS,
+    SNAPSHOT_CODEC_JSON,
+    SnapshotCodec,
+    detect_codec,
+    get_codec,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotNotFoundError(Exception):
+    """Raised when neither the snapshot nor its previous generation can be read."""
+
+
+def fsync_directory(directory: pathlib.Path):
+    """Flush a directory entry change, such as a rename, to disk.
+
+    Args:
+        directory (pathlib.Path): directory to flush
+    """
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: pathlib.Path, data: bytes, keep_previous: bool = False):
+    """Replace a file with new content without ever exposing a partial write.
+
+    The content is written and fsynced to a temporary file next to the target,
+    which is then renamed over it.
+
+    Args:
+        path (pathlib.Path): file to write
+        data (bytes): new content
+        keep_previous (bool, optional): keep the replaced file with a ``.prev``
+            suffix. Defaults to False.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as tmp_file:
+        tmp_file.write(data)
+        tmp_file.flush()
+        os.fsync(tmp_file.fileno())
+    if keep_previous and path.exists():
+        os.replace(path, path.with_name(f"{path.name}.prev"))
+    os.replace(tmp_path, path)
+    fsync_directory(path.parent)
+
+
+class SnapshotStore:
+    """Crash-safe catalog snapshot with a journal of deltas between snapshots.
+
+    A snapshot file starts with a header record summarizing the catalog,
+    followed by one record per card, so the header is read without touching
+    the cards. Records are encoded with the configured SnapshotCodec; the codec
+    of an existing file is detected from its leading bytes.
+
+    Each snapshot has a random generation id. Deltas are appended to the
+    journal tagged with the generation they apply to, and replayed on load.
+    After ``compact_after`` deltas a full snapshot of a new generation is due,
+    which makes the journaled deltas obsolete.
+
+    A delta holds the updated ``header`` fields, the ``upserted`` card
+    dictionaries and the ``removed`` card ids.
+
+    A full snapshot keeps the replaced file as the previous generation, unless
+    that file is known to be unreadable, so a corrupt snapshot never replaces
+    the readable generation it was recovered from.
+    """
+
+    FORMAT_VERSION = 2
+    COMPACT_AFTER = 20
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        journal_path: pathlib.Path = None,
+        compact_after: int = COMPACT_AFTER,
+        codec: SnapshotCodec = None,
+    ):
+        """Instance constructor.
+
+        Args:
+            path (pathlib.Path): snapshot file
+            journal_path (pathlib.Path, optional): delta journal file.
+                Defaults to None, which uses the snapshot path with a
+                ``.journal`` suffix.
+            compact_after (int, optional): number of deltas before the next full
+                snapshot. Defaults to COMPACT_AFTER.
+            codec (SnapshotCodec, optional): codec of written snapshots.
+                Defaults to None, which writes JSON lines.
+        """
+        self.path = pathlib.Path(path)
+        self.previous_path = self.path.with_name(f"{self.path.name}.prev")
+        self.journal_path = (
+            pathlib.Path(journal_path)
+            if journal_path
+            else self.path.with_name(f"{self.path.name}.journal")
+        )
+        self.compact_after = compact_after
+        self.codec = codec or get_codec(SNAPSHOT_CODEC_JSON)
+        self._generation: str | None = None
+        self._delta_count = 0
+        self._snapshot_path: pathlib.Path | None = None
+        self._legacy_cards: list[dict] | None = None
+        self._current_unreadable = False
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return (
+            f"<SnapshotStore {self.path}, codec={self.codec.name},"
+            f" generation={self._generation}, deltas={self._delta_count}>"
+        )
+
+    def _read_header(self, path: pathlib.Path) -> dict:
+        """Read the header line of a snapshot file.
+
+        Files written before the header format are parsed in full once, their
+        cards are kept until the next load_cards call.
+
+        Args:
+            path (pathlib.Path): snapshot file
+
+        Returns:
+            dict: snapshot header
+
+        Raises:
+            OSError: if the file can't be read
+            ValueError: if the file isn't a snapshot
+        """
+        with path.open("rb") as snapshot_file:
+            codec = detect_codec(snapshot_file)
+            try:
+                header = codec.read_header(codec.wrap(snapshot_file))
+            except json.JSONDecodeError:
+                header = None
+            if isinstance(header, dict) and header.get("format") == self.FORMAT_VERSION:
+                return header
+            if codec.name != SNAPSHOT_CODEC_JSON:
+                raise ValueError(f"Unsupported snapshot header in {path}")
+            snapshot_file.seek(0)
+            state = json.loads(snapshot_file.read())
+        if not isinstance(state, dict) or "last_check_time" not in state:
+            raise ValueError(f"Not a snapshot: {path}")
+        LOGGER.info(f"Read snapshot {path} written in the legacy format")
+        self._legacy_cards = state.pop("cards", [])
+        state.pop("generation", None)
+        return state
+
+    def _read_deltas(self, generation: str) -> list[dict]:
+        """Read journaled deltas of a snapshot generation.
+
+        A torn last record left by an interrupted append is truncated away, so
+        later appends start on a fresh line.
+
+        Args:
+            generation (str): snapshot generation id
+
+        Returns:
+            list[dict]: deltas in journal order
+        """
+        if generation is None:
+            return []
+        try:
+            content = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return []
+        if content and not content.endswith(b"\n"):
+            LOGGER.warning(f"Truncating torn record in {self.journal_path}")
+            content = content[: content.rfind(b"\n") + 1]
+            with self.journal_path.open("rb+") as journal_file:
+                journal_file.truncate(len(content))
+        deltas = []
+        for line in content.splitlines():
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                LOGGER.warning(f"Skipping torn record in {self.journal_path}")
+                continue
+            if delta.get("generation") == generation:
+                deltas.append(delta)
+        return deltas
+
+    @staticmethod
+    def apply_delta(cards: list[dict], delta: dict) -> list[dict]:
+        """Apply the card changes of a delta.
+
+        Args:
+            cards (list[dict]): card dictionaries
+            delta (dict): delta to apply
+
+        Returns:
+            list[dict]: updated card dictionaries
+        """
+        removed = set(delta.get("removed", ()))
+        upserted = {card["id"]: card for card in delta.get("upserted", ())}
+        cards = [
+            upserted.pop(card["id"], card) for card in cards if card["id"] not in removed
+        ]
+        cards.extend(upserted.values())
+        return cards
+
+    def load_header(self) -> dict:
+        """Load the snapshot header updated by its journaled deltas.
+
+        Falls back to the previous generation if the snapshot can't be read.
+
+        Returns:
+            dict: snapshot header
+
+        Raises:
+            SnapshotNotFoundError: if no snapshot generation can be read
+        """
+        for path in (self.path, self.previous_path):
+            try:
+                header = self._read_header(path)
+            except DECODE_ERRORS as err:
+                LOGGER.warning(f"Failed to read snapshot {path}: {err}")
+                continue
+            if path == self.previous_path:
+                LOGGER.warning(f"Recovered previous snapshot generation from {path}")
+                self._current_unreadable = True
+            break
+        else:
+            raise SnapshotNotFoundError(f"No readable snapshot at {self.path}")
+
+        self._snapshot_path = path
+        self._generation = header.get("generation")
+        deltas = self._read_deltas(self._generation)
+        for delta in deltas:
+            header.update(delta.get("header", {}))
+        self._delta_count = len(deltas)
+        LOGGER.debug(f"Loaded header of {self}")
+        return header
+
+    def load_cards(self) -> list[dict]:
+        """Parse the cards of the loaded snapshot and replay their deltas.
+
+        Returns:
+            list[dict]: card dictionaries
+
+        Raises:
+            SnapshotNotFoundError: if no snapshot generation can be read
+            ValueError: if the snapshot records can't be decoded
+        """
+        if self._snapshot_path is None:
+            self.load_header()
+        if self._legacy_cards is not None:
+            cards, self._legacy_cards = self._legacy_cards, None
+            return cards
+
+        try:
+            with self._snapshot_path.open("rb") as snapshot_file:
+                codec = detect_codec(snapshot_file)
+                stream = codec.wrap(snapshot_file)
+                header = codec.read_header(stream)
+                cards = list(codec.iter_cards(stream, header))
+        except DECODE_ERRORS:
+            if self._snapshot_path == self.path:
+                self._current_unreadable = True
+            raise
+        for delta in self._read_deltas(header.get("generation")):
+            cards = self.apply_delta(cards, delta)
+        LOGGER.debug(f"Loaded {len(cards)} cards from {self}")
+        return cards
+
+    @property
+    def accepts_delta(self) -> bool:
+        """Get whether the next change can be journaled as a delta.
+
+        Returns:
+            bool: False if a full snapshot is due
+        """
+        return self._generation is not None and self._delta_count < self.compact_after
+
+    def write_snapshot(self, header: dict, cards: list[dict]):
+        """Atomically write a full snapshot of a new generation.
+
+        Args:
+            header (dict): catalog summary
+            cards (list[dict]): card dictionaries
+        """
+        generation = uuid.uuid4().hex
+        header = {"format": self.FORMAT_VERSION, "generation": generation, **header}
+        atomic_write(
+            self.path,
+            self.codec.encode(header, cards),
+            keep_previous=not self._current_unreadable,
+        )
+        self._current_unreadable = False
+        self._generation = generation
+        self._snapshot_path = self.path
+        self._legacy_cards = None
+        self._delta_count = 0
+        self.journal_path.unlink(missing_ok=True)
+        LOGGER.debug(f"Wrote full snapshot {self}")
+
+    def append_delta(self, delta: dict):
+        """Durably append a delta of the current generation to the journal.
+
+        Args:
+            delta (dict): changes since the stored state
+        """
+        line = json.dumps({"generation": self._generation, **delta}) + "\n"
+        with self.journal_path.open("ab") as journal_file:
+            journal_file.write(line.encode())
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        self._delta_count += 1
+        LOGGER.debug(f"Journaled delta of {len(delta.get('upserted', ()))} cards")
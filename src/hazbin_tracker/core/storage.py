@@ -0,0 +1,600 @@
+import json
+import typing
+import logging
+import pathlib
+import sqlite3
+import datetime
+import threading
+import dataclasses
+
+from .card import Card, catalog_digest
+from .diff import CheckResult
+from .scrapper import sort_cards
+from .history_journal import HistoryJournal
+from .snapshot_store import SnapshotNotFoundError, SnapshotStore
+from .snapshot_codec import DECODE_ERRORS, SNAPSHOT_CODEC_JSON, get_codec
+from .constants import (
+    CATALOG_DB_PATH,
+    CHECK_HISTORY_DIR,
+    CHECK_HISTORY_FILE_PATH,
+    TRACK_FILE_PATH,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+STORAGE_BACKENDS = (STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE)
+CATALOG_SUMMARY_SIZE = 10
+
+
+class CatalogNotFoundError(Exception):
+    """Raised when the storage holds no usable catalog snapshot."""
+
+
+@dataclasses.dataclass
+class CatalogSnapshot:
+    """Tracked catalog together with the state of the check that produced it.
+
+    Snapshots loaded from a storage may only carry a summary of the catalog:
+    its size, digest and newest cards. The cards themselves are then loaded on
+    the first call to load_cards.
+    """
+
+    last_check_time: datetime.datetime
+    cards: list[Card] | None = None
+    resume_page: int | None = None
+    card_count: int | None = None
+    latest_cards: list[Card] | None = None
+    digest: str | None = None
+    cards_loader: typing.Callable[[], list[Card]] | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Fill in the summary of a loaded catalog."""
+        if self.cards is None:
+            return
+        if self.card_count is None:
+            self.card_count = len(self.cards)
+        if self.latest_cards is None:
+            self.latest_cards = self.cards[:CATALOG_SUMMARY_SIZE]
+
+    @property
+    def is_loaded(self) -> bool:
+        """Get whether the cards are loaded.
+
+        Returns:
+            bool: True if loaded
+        """
+        return self.cards is not None
+
+    def load_cards(self) -> list[Card]:
+        """Get the cards, loading them on first call.
+
+        Returns:
+            list[Card]: catalog sorted by publish time, newest first
+        """
+        if self.cards is None:
+            self.cards = self.cards_loader() if self.cards_loader else []
+        return self.cards
+
+    def summary_header(self) -> dict:
+        """Get the summary of the catalog as stored in snapshot headers.
+
+        Returns:
+            dict: snapshot header fields
+        """
+        cards = self.load_cards()
+        return {
+            "last_check_time": self.last_check_time.isoformat(),
+            "resume_page": self.resume_page,
+            "card_count": len(cards),
+            "digest": self.digest if self.digest else catalog_digest(cards),
+            "latest_cards": [card.to_dict() for card in cards[:CATALOG_SUMMARY_SIZE]],
+        }
+
+
+class Storage:
+    """Persistence of the tracked catalog and the check history."""
+
+    def __repr__(self):
+        """Repr override.
+
+        Returns:
+            str: string representation
+        """
+        return f"<{type(self).__name__} path={self.path}>"
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Get the main file of the storage.
+
+        Returns:
+            pathlib.Path: storage file path
+        """
+        raise NotImplementedError
+
+    def load_catalog(self) -> CatalogSnapshot:
+        """Load the stored catalog snapshot.
+
+        Returns:
+            CatalogSnapshot: stored snapshot
+
+        Raises:
+            CatalogNotFoundError: if there's no usable snapshot
+        """
+        raise NotImplementedError
+
+    def save_catalog(self, snapshot: CatalogSnapshot, changes: CheckResult = None):
+        """Store a catalog snapshot.
+
+        Args:
+            snapshot (CatalogSnapshot): snapshot to store
+            changes (CheckResult, optional): changes since the stored snapshot.
+                Defaults to None, which stores the whole snapshot.
+        """
+        raise NotImplementedError
+
+    def append_check(self, record: dict, history_size: int):
+        """Add a check record to the history.
+
+        Args:
+            record (dict): check record
+            history_size (int): maximum number of kept records
+        """
+        raise NotImplementedError
+
+    def load_history(self, limit: int = None) -> list[dict]:
+        """Load check records, newest first.
+
+        Args:
+            limit (int, optional): maximum number of records.
+                Defaults to None, which loads all records.
+
+        Returns:
+            list[dict]: check records
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release resources held by the storage."""
+
+
+class JsonStorage(Storage):
+    """Storage keeping the catalog in JSON snapshots and the history in a journal.
+
+    Catalog snapshots are written atomically and checks in between only
+    journal the changed cards, see SnapshotStore.
+    """
+
+    def __init__(
+        self,
+        track_file_path: pathlib.Path = TRACK_FILE_PATH,
+        history_dir: pathlib.Path = CHECK_HISTORY_DIR,
+        legacy_history_path: pathlib.Path = CHECK_HISTORY_FILE_PATH,
+        snapshot_codec: str = SNAPSHOT_CODEC_JSON,
+    ):
+        """Instance constructor.
+
+        Args:
+            track_file_path (pathlib.Path, optional): catalog file.
+                Defaults to TRACK_FILE_PATH.
+            history_dir (pathlib.Path, optional): check history journal directory.
+                Defaults to CHECK_HISTORY_DIR.
+            legacy_history_path (pathlib.Path, optional): check history file
+                imported into an empty journal. Defaults to CHECK_HISTORY_FILE_PATH.
+            snapshot_codec (str, optional): encoding of written catalog snapshots.
+                Defaults to SNAPSHOT_CODEC_JSON.
+        """
+        self.track_file_path = pathlib.Path(track_file_path)
+        self.snapshot_store = SnapshotStore(
+            self.track_file_path, codec=get_codec(snapshot_codec)
+        )
+        self.history_journal = HistoryJournal(history_dir)
+        self.legacy_history_path = pathlib.Path(legacy_history_path)
+        self.migrate_legacy_history()
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Get the catalog file.
+
+        Returns:
+            pathlib.Path: catalog file path
+        """
+        return self.track_file_path
+
+    def load_catalog(self) -> CatalogSnapshot:
+        """Load the catalog summary from the catalog file header.
+
+        Cards are parsed on the first call to CatalogSnapshot.load_cards.
+
+        Returns:
+            CatalogSnapshot: stored snapshot
+
+        Raises:
+            CatalogNotFoundError: if the file is missing or corrupt
+        """
+        try:
+            header = self.snapshot_store.load_header()
+            last_check_time = datetime.datetime.fromisoformat(header["last_check_time"])
+        except (SnapshotNotFoundError, ValueError, KeyError, TypeError) as err:
+            raise CatalogNotFoundError(str(err)) from err
+
+        snapshot = CatalogSnapshot(
+            last_check_time=last_check_time,
+            resume_page=header.get("resume_page"),
+            card_count=header.get("card_count"),
+            latest_cards=[
+                Card.from_dict(card) for card in header.get("latest_cards", [])
+            ],
+            digest=header.get("digest"),
+            cards_loader=self.load_cards,
+        )
+        if snapshot.card_count is None:
+            # Written before catalog summaries, so it has to be loaded in full
+            cards = snapshot.load_cards()
+            snapshot.card_count = len(cards)
+            snapshot.latest_cards = cards[:CATALOG_SUMMARY_SIZE]
+        return snapshot
+
+    def load_cards(self) -> list[Card]:
+        """Parse the cards of the catalog file.
+
+        Returns:
+            list[Card]: catalog sorted by publish time, newest first
+
+        Raises:
+            CatalogNotFoundError: if the card records are corrupt
+        """
+        try:
+            cards = [Card.from_dict(card) for card in self.snapshot_store.load_cards()]
+        except (SnapshotNotFoundError, *DECODE_ERRORS, KeyError, TypeError) as err:
+            raise CatalogNotFoundError(str(err)) from err
+        return sort_cards(cards)
+
+    def save_catalog(self, snapshot: CatalogSnapshot, changes: CheckResult = None):
+        """Journal the changes of a snapshot, or write it in full.
+
+        Args:
+            snapshot (CatalogSnapshot): snapshot to store
+            changes (CheckResult, optional): changes since the stored snapshot.
+                Defaults to None, which writes the whole snapshot.
+        """
+        header = snapshot.summary_header()
+        if changes is not None and self.snapshot_store.accepts_delta:
+            self.snapshot_store.append_delta(
+                {
+                    "header": header,
+                    "upserted": [
+                        card.to_dict()
+                        for card in changes.added
+                        + changes.republished
+                        + changes.modified
+                    ],
+                    "removed": [card.id for card in changes.removed],
+                }
+            )
+            return
+        self.snapshot_store.write_snapshot(
+            header, [card.to_dict() for card in snapshot.cards]
+        )
+
+    def migrate_legacy_history(self):
+        """Import the legacy check history file into an empty journal."""
+        if not self.legacy_history_path.exists() or not self.history_journal.is_empty:
+            return
+        try:
+            history = json.loads(self.legacy_history_path.read_text())
+        except Exception:
+            LOGGER.warning("Failed to read legacy check history file, skipping.")
+            return
+        self.history_journal.extend(list(reversed(history)))
+        self.legacy_history_path.rename(
+            self.legacy_history_path.with_suffix(".json.migrated")
+        )
+        LOGGER.info(f"Migrated {len(history)} checks to {self.history_journal}")
+
+    def append_check(self, record: dict, history_size: int):
+        """Append a check record to the history journal.
+
+        Args:
+            record (dict): check record
+            history_size (int): maximum number of kept records
+        """
+        self.history_journal.append(record, retention=history_size)
+
+    def load_history(self, limit: int = None) -> list[dict]:
+        """Read the newest check records from the history journal.
+
+        Args:
+            limit (int, optional): maximum number of records.
+
+        Returns:
+            list[dict]: check records
+        """
+        return self.history_journal.tail(limit)
+
+    def close(self):
+        """Wait for a running history compaction."""
+        self.history_journal.wait_for_compaction()
+
+
+class SQLiteStorage(Storage):
+    """Storage keeping the catalog and history in an indexed SQLite database.
+
+    Products are stored one row per card, so a check only upserts and deletes
+    the rows it changed, in a single transaction.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS products (
+            id INTEGER PRIMARY KEY,
+            handle TEXT,
+            published_at TEXT,
+            content_hash TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS products_published_at ON products (published_at);
+        CREATE INDEX IF NOT EXISTS products_handle ON products (handle);
+        CREATE TABLE IF NOT EXISTS checks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TEXT NOT NULL,
+            record TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS checks_timestamp ON checks (timestamp);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_path: pathlib.Path = CATALOG_DB_PATH):
+        """Instance constructor.
+
+        Args:
+            db_path (pathlib.Path, optional): database file.
+                Defaults to CATALOG_DB_PATH.
+        """
+        self.db_path = pathlib.Path(db_path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(self.SCHEMA)
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Get the database file.
+
+        Returns:
+            pathlib.Path: database file path
+        """
+        return self.db_path
+
+    def get_meta(self, key: str) -> str | None:
+        """Get a metadata value.
+
+        Args:
+            key (str): metadata key
+
+        Returns:
+            str | None: value, None if not set
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _product_row(card: Card) -> tuple:
+        """Get the products table row of a card.
+
+        Args:
+            card (Card): card
+
+        Returns:
+            tuple: row values
+        """
+        return (
+            card.id,
+            card.handle,
+            (
+                card.published_at.astimezone(datetime.UTC).isoformat()
+                if card.published_at
+                else None
+            ),
+            card.content_hash,
+            json.dumps(card.to_dict(), separators=(",", ":")),
+        )
+
+    def load_catalog(self) -> CatalogSnapshot:
+        """Load the catalog summary from the database.
+
+        Only the newest cards are read, the rest on the first call to
+        CatalogSnapshot.load_cards.
+
+        Returns:
+            CatalogSnapshot: stored snapshot
+
+        Raises:
+            CatalogNotFoundError: if no snapshot was stored yet
+        """
+        last_check_time = self.get_meta("last_check_time")
+        if last_check_time is None:
+            raise CatalogNotFoundError(f"No catalog stored in {self.db_path}")
+        resume_page = self.get_meta("resume_page")
+        card_count = self.get_meta("card_count")
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM products ORDER BY published_at DESC LIMIT ?",
+                (CATALOG_SUMMARY_SIZE,),
+            ).fetchall()
+            if card_count is None:
+                (card_count,) = self._connection.execute(
+                    "SELECT COUNT(*) FROM products"
+                ).fetchone()
+        return CatalogSnapshot(
+            last_check_time=datetime.datetime.fromisoformat(last_check_time),
+            resume_page=int(resume_page) if resume_page else None,
+            card_count=int(card_count),
+            latest_cards=sort_cards(
+                Card.from_dict(json.loads(data)) for (data,) in rows
+            ),
+            digest=self.get_meta("digest"),
+            cards_loader=self.load_cards,
+        )
+
+    def load_cards(self) -> list[Card]:
+        """Load all cards from the database.
+
+        Returns:
+            list[Card]: catalog sorted by publish time, newest first
+
+        Raises:
+            CatalogNotFoundError: if the card rows are corrupt
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT data FROM products").fetchall()
+        try:
+            cards = [Card.from_dict(json.loads(data)) for (data,) in rows]
+        except (ValueError, KeyError, TypeError) as err:
+            raise CatalogNotFoundError(str(err)) from err
+        return sort_cards(cards)
+
+    def save_catalog(self, snapshot: CatalogSnapshot, changes: CheckResult = None):
+        """Store a snapshot, writing only the changed rows when changes are known.
+
+        Args:
+            snapshot (CatalogSnapshot): snapshot to store
+            changes (CheckResult, optional): changes since the stored snapshot.
+                Defaults to None, which replaces all products. Ignored while
+                no products are stored.
+        """
+        with self._lock, self._connection:
+            if (
+                changes is not None
+                and not self._connection.execute(
+                    "SELECT 1 FROM products LIMIT 1"
+                ).fetchone()
+            ):
+                changes = None
+            if changes is None:
+                self._connection.execute("DELETE FROM products")
+                upserted = snapshot.load_cards()
+            else:
+                upserted = changes.added + changes.republished + changes.modified
+                self._connection.executemany(
+                    "DELETE FROM products WHERE id = ?",
+                    [(card.id,) for card in changes.removed],
+                )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO products"
+                " (id, handle, published_at, content_hash, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [self._product_row(card) for card in upserted],
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("last_check_time", snapshot.last_check_time.isoformat()),
+                    (
+                        "resume_page",
+                        str(snapshot.resume_page) if snapshot.resume_page else None,
+                    ),
+                    ("card_count", str(len(snapshot.load_cards()))),
+                    ("digest", snapshot.digest),
+                ],
+            )
+        LOGGER.debug(f"Stored {len(upserted)} changed products in {self.db_path}")
+
+    def append_check(self, record: dict, history_size: int):
+        """Insert a check record and drop records past the history size.
+
+        Args:
+            record (dict): check record
+            history_size (int): maximum number of kept records
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO checks (timestamp, record) VALUES (?, ?)",
+                (record.get("timestamp", ""), json.dumps(record)),
+            )
+            self._connection.execute(
+                "DELETE FROM checks WHERE id <= ("
+                " SELECT id FROM checks ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (history_size,),
+            )
+
+    def load_history(self, limit: int = None) -> list[dict]:
+        """Load check records, newest first.
+
+        Args:
+            limit (int, optional): maximum number of records.
+
+        Returns:
+            list[dict]: check records
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT record FROM checks ORDER BY id DESC LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        return [json.loads(record) for (record,) in rows]
+
+    def migrate_from(self, source: Storage):
+        """Import the catalog and history of another storage once.
+
+        Args:
+            source (Storage): storage to import from
+        """
+        if self.get_meta("migrated_from") is not None:
+            return
+        try:
+            self.save_catalog(source.load_catalog())
+        except CatalogNotFoundError:
+            LOGGER.debug(f"No catalog to migrate from {source}")
+        history = source.load_history()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO checks (timestamp, record) VALUES (?, ?)",
+                [
+                    (record.get("timestamp", ""), json.dumps(record))
+                    for record in reversed(history)
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                ("migrated_from", str(source.path)),
+            )
+        LOGGER.info(f"Migrated catalog and {len(history)} checks from {source}")
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+def create_storage(
+    backend: str = STORAGE_BACKEND_JSON, snapshot_codec: str = SNAPSHOT_CODEC_JSON
+) -> Storage:
+    """Create the storage for the given backend.
+
+    The SQLite storage imports the JSON files on first use.
+
+    Args:
+        backend (str, optional): one of STORAGE_BACKENDS.
+            Defaults to STORAGE_BACKEND_JSON.
+        snapshot_codec (str, optional): encoding of catalog snapshots written by
+            the JSON storage. Defaults to SNAPSHOT_CODEC_JSON.
+
+    Returns:
+        Storage: storage instance
+    """
+    if backend == STORAGE_BACKEND_SQLITE:
+        storage = SQLiteStorage()
+        storage.migrate_from(JsonStorage())
+        return storage
+    return JsonStorage(snapshot_codec=snapshot_codec)
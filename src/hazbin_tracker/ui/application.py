@@ -15,6 +15,7 @@ from hazbin_tracker.core.constants import (
 
 from ..version import __version__
 from ..core.cards_tracker import CardsTracker
+from ..core.http_client import get_http_client
 from .tray import HazbinTrackerSystemTrayIcon
 from ..core.settings import HazbinSettings
 from ..ui.settings_dialog import SettingsDialog
@@ -53,6 +54,8 @@ class HazbinTrackerApplication(QtWidgets.QApplication):
         self.tray_icon = HazbinTrackerSystemTrayIcon(QtGui.QIcon(":/icons/cards.png"))
 
         self.tray_icon.show()
+        self.aboutToQuit.connect(get_http_client().close)
+        self.aboutToQuit.connect(self.cards_tracker.storage.close)
         self.cards_tracker.start_periodic_check_timer()
 
     def _setup_pushover(self):
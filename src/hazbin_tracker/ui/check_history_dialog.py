@@ -1,11 +1,13 @@
 import typing
 import logging
+import datetime
 from PySide6 import QtCore, QtWidgets
 
 from .models.check_history import CheckHistoryModel
 
 if typing.TYPE_CHECKING:
     from hazbin_tracker.ui.application import HazbinTrackerApplication
+    from hazbin_tracker.core.crawl import CrawlProgress
 
 
 LOGGER = logging.getLogger(__name__)
@@ -14,6 +16,14 @@ LOGGER = logging.getLogger(__name__)
 class CheckHistoryDialog(QtWidgets.QDialog):
     """Dialog to display the check history."""
 
+    # Filter label, how far back to show checks and whether only changes
+    HISTORY_FILTERS = (
+        ("All checks", None, False),
+        ("Checks with changes", None, True),
+        ("Last 24 hours", datetime.timedelta(days=1), False),
+        ("Last 7 days", datetime.timedelta(days=7), False),
+    )
+
     refresh_requested = QtCore.Signal()
 
     def __init__(self, parent=None):
@@ -24,9 +34,16 @@ class CheckHistoryDialog(QtWidgets.QDialog):
         """
         super().__init__(parent)
         self.setWindowTitle("Check History")
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.resize(800, 400)
 
-        self._history_model = CheckHistoryModel()
+        tracker = self.application().cards_tracker
+        self._history_model = CheckHistoryModel(
+            tracker.storage,
+            history_size=self.application().settings.check_history_size,
+            card_resolver=tracker.find_card,
+            parent=self,
+        )
 
         self._create_widgets()
         self._create_layouts()
@@ -37,6 +54,19 @@ class CheckHistoryDialog(QtWidgets.QDialog):
     def _create_widgets(self) -> None:
         """Create and arrange widgets in the dialog."""
         self._latest_publish_label = QtWidgets.QLabel(self)
+        self._last_change_label = QtWidgets.QLabel(self)
+
+        # History filter
+        self._filter_combo = QtWidgets.QComboBox(self)
+        for label, _, _ in self.HISTORY_FILTERS:
+            self._filter_combo.addItem(label)
+
+        # Check progress
+        self._progress_label = QtWidgets.QLabel(self)
+        self._cancel_check_button = QtWidgets.QPushButton("Cancel Check", self)
+        self.set_check_running(
+            self.application().cards_tracker.check_scheduler.is_running
+        )
 
         # Table view
         self.table_view = QtWidgets.QTableView(self)
@@ -54,7 +84,19 @@ class CheckHistoryDialog(QtWidgets.QDialog):
         """Create and set the layout for the dialog."""
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.setContentsMargins(5, 5, 5, 5)
-        main_layout.addWidget(self._latest_publish_label)
+        progress_layout = QtWidgets.QHBoxLayout()
+        progress_layout.addWidget(self._progress_label)
+        progress_layout.addStretch()
+        progress_layout.addWidget(self._cancel_check_button)
+
+        info_layout = QtWidgets.QHBoxLayout()
+        info_layout.addWidget(self._latest_publish_label)
+        info_layout.addWidget(self._last_change_label)
+        info_layout.addStretch()
+        info_layout.addWidget(self._filter_combo)
+
+        main_layout.addLayout(info_layout)
+        main_layout.addLayout(progress_layout)
         main_layout.addWidget(self.table_view)
         self.setLayout(main_layout)
 
@@ -62,6 +104,13 @@ class CheckHistoryDialog(QtWidgets.QDialog):
         """Create signal-slot connections."""
         self.refresh_requested.connect(self.on_refresh_requested)
         self._history_model.layoutChanged.connect(self.adjust_size_to_contents)
+        self._filter_combo.currentIndexChanged.connect(self.apply_history_filter)
+
+        tracker = self.application().cards_tracker
+        self._cancel_check_button.clicked.connect(tracker.cancel_check)
+        tracker.check_scheduler.progress.connect(self.show_check_progress)
+        tracker.check_scheduler.running_changed.connect(self.set_check_running)
+        tracker.check_completed.connect(self.on_refresh_requested)
 
     def application(self) -> "HazbinTrackerApplication":
         """Get the HazbinTrackerApplication instance."""
@@ -86,6 +135,26 @@ class CheckHistoryDialog(QtWidgets.QDialog):
             QtWidgets.QHeaderView.ResizeToContents
         )
 
+    @QtCore.Slot(bool)
+    def set_check_running(self, running: bool) -> None:
+        """Show or hide the check progress widgets.
+
+        Args:
+            running (bool): Whether a check is running
+        """
+        self._progress_label.setText("Checking..." if running else "")
+        self._progress_label.setVisible(running)
+        self._cancel_check_button.setVisible(running)
+
+    @QtCore.Slot(object)
+    def show_check_progress(self, progress: "CrawlProgress") -> None:
+        """Show the progress of the running check.
+
+        Args:
+            progress (CrawlProgress): Progress of the running crawl
+        """
+        self._progress_label.setText(f"Checking: {progress.summary}")
+
     @QtCore.Slot()
     def on_refresh_requested(self) -> None:
         """Handle refresh request."""
@@ -105,9 +174,7 @@ class CheckHistoryDialog(QtWidgets.QDialog):
         publish_details_tooltip = "No new cards published."
         latest_cards = self.application().cards_tracker.latest_published_cards
         if latest_cards:
-            publish_details_tooltip = "<br>".join(
-                [card["title"] for card in latest_cards]
-            )
+            publish_details_tooltip = "<br>".join([card.title for card in latest_cards])
         self._latest_publish_label.setToolTip(publish_details_tooltip)
 
     @QtCore.Slot()
@@ -115,6 +182,16 @@ class CheckHistoryDialog(QtWidgets.QDialog):
         """Refresh the check history data."""
         LOGGER.debug("Refreshing check history...")
         self._history_model.load()
+        self.apply_history_filter()
+        last_change_time = self._history_model.last_change_time() or "N/A"
+        self._last_change_label.setText(f"Last Change: <b>{last_change_time}</b>")
+
+    @QtCore.Slot()
+    def apply_history_filter(self):
+        """Show the checks selected by the history filter."""
+        _, period, changes_only = self.HISTORY_FILTERS[self._filter_combo.currentIndex()]
+        start = datetime.datetime.now(datetime.UTC) - period if period else None
+        self._history_model.set_filter(start, changes_only=changes_only)
 
     @QtCore.Slot(QtCore.QPoint)
     def show_context_menu(self, position: QtCore.QPoint):
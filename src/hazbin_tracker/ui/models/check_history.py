@@ -1,9 +1,11 @@
-import json
 import typing
 import logging
+import datetime
 from PySide6 import QtCore
 
-from ...core.constants import CHECK_HISTORY_FILE_PATH
+from ...core.card import CARD_SUMMARY_FIELDS, Card
+from ...core.history_index import CheckHistoryIndex, format_record_time
+from ...core.storage import Storage
 
 
 LOGGER = logging.getLogger(__name__)
@@ -12,29 +14,101 @@ LOGGER = logging.getLogger(__name__)
 class CheckHistoryModel(QtCore.QAbstractTableModel):
     """Model for the check history table view."""
 
-    def __init__(self, parent=None):
+    def __init__(
+        self,
+        storage: Storage,
+        history_size: int = None,
+        card_resolver: typing.Callable[[int], Card | None] = None,
+        parent=None,
+    ):
         """Instance constructor.
 
         Args:
+            storage (Storage): storage holding the check history.
+            history_size (int, optional): number of newest records to load.
+                Defaults to None, which loads all records.
+            card_resolver (Callable[[int], Card | None], optional): resolves card
+                details shown in tooltips by product id. Defaults to None.
             parent (QtCore.QObject, optional): Parent object. Defaults to None.
         """
         super().__init__(parent)
+        self.storage = storage
+        self.history_size = history_size
+        self.card_resolver = card_resolver
         self._records: list[dict] = []
+        self._loaded_records: list[dict] = []
+        self.history_index = CheckHistoryIndex([])
+        self.filter_start: datetime.datetime | None = None
+        self.changes_only = False
+
+    @staticmethod
+    def summarize_record(record: dict) -> dict:
+        """Reduce new cards of a record to their summaries.
+
+        Records written before summaries were introduced embed full product
+        dictionaries, which aren't kept in memory.
+
+        Args:
+            record (dict): check record
+
+        Returns:
+            dict: check record with summarized new cards
+        """
+        new_cards = record.get("new_cards")
+        if not new_cards or new_cards[0].keys() <= set(CARD_SUMMARY_FIELDS):
+            return record
+        summaries = [
+            {field: card.get(field) for field in CARD_SUMMARY_FIELDS}
+            for card in new_cards
+        ]
+        return {**record, "new_cards": summaries}
 
     def load(self):
-        """Load check history from the JSON file."""
-        LOGGER.debug("Loading check history from file: %s", CHECK_HISTORY_FILE_PATH)
-        if CHECK_HISTORY_FILE_PATH.exists():
-            try:
-                self._records = json.loads(CHECK_HISTORY_FILE_PATH.read_text())
-            except Exception:
-                LOGGER.exception("Failed to load check history, initializing new one.")
-                self._records = []
-        else:
-            self._records = []
+        """Load check history from the storage."""
+        LOGGER.debug("Loading check history from: %s", self.storage)
+        try:
+            records = self.storage.load_history(limit=self.history_size)
+            self._loaded_records = [self.summarize_record(record) for record in records]
+        except Exception:
+            LOGGER.exception("Failed to load check history, initializing new one.")
+            self._loaded_records = []
+        self.history_index = CheckHistoryIndex(self._loaded_records)
+        self.apply_filter()
+
+    def set_filter(self, start: datetime.datetime = None, changes_only: bool = False):
+        """Show only checks made since a time, optionally only those with changes.
 
+        Args:
+            start (datetime.datetime, optional): oldest check time to show.
+                Defaults to None, which shows all checks.
+            changes_only (bool, optional): show only checks which found any
+                change. Defaults to False.
+        """
+        self.filter_start = start
+        self.changes_only = changes_only
+        self.apply_filter()
+
+    def apply_filter(self):
+        """Select the shown records with the time index, newest first."""
+        if self.changes_only:
+            records = self.history_index.changes_between(self.filter_start)
+            self._records = records[::-1]
+        elif self.filter_start is not None:
+            records = self.history_index.between(self.filter_start)
+            self._records = records[::-1]
+        else:
+            self._records = self._loaded_records
         self.layoutChanged.emit()
 
+    def last_change_time(self) -> str | None:
+        """Get the time of the newest loaded check which found any change.
+
+        Returns:
+            str | None: formatted check time, None if no check found a change
+        """
+        record = self.history_index.last_with_changes()
+        return format_record_time(record) if record is not None else None
+
     def rowCount(self, parent=QtCore.QModelIndex()) -> int:
         """Get the number of rows in the model.
 
@@ -74,13 +148,38 @@ class CheckHistoryModel(QtCore.QAbstractTableModel):
 
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
             if index.column() == 0:
-                return record.get("timestamp", "")
+                return format_record_time(record)
 
             if index.column() == 1:
                 return self.format_record_new_cards(record)
 
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole and index.column() == 1:
+            return self.format_new_card_details(record)
+
         return None
 
+    def format_new_card_details(self, record: dict) -> str | None:
+        """Format details of the new cards, resolved from the current catalog.
+
+        Args:
+            record (dict): A record containing check info.
+
+        Returns:
+            str | None: Formatted card details, None if there's nothing to show.
+        """
+        new_cards = record.get("new_cards", [])
+        if not new_cards or self.card_resolver is None:
+            return None
+        lines = []
+        for card_info in new_cards:
+            card = self.card_resolver(card_info.get("id"))
+            if card is None:
+                lines.append(f"{card_info.get('title')} (no longer listed)")
+                continue
+            availability = "available" if card.available else "sold out"
+            lines.append(f"{card.title}: {card.price or 'N/A'}, {availability}")
+        return "\n".join(lines)
+
     def format_record_new_cards(self, record: dict) -> str:
         """Format the new cards list for display.
 
@@ -91,12 +190,18 @@ class CheckHistoryModel(QtCore.QAbstractTableModel):
             str: Formatted string of new cards.
         """
         new_cards = record.get("new_cards", [])
-        if not new_cards:
+        removed_count = record.get("removed_count", 0)
+        deadline_exceeded = record.get("deadline_exceeded", False)
+        if not new_cards and not removed_count and not deadline_exceeded:
             return "No new cards"
-        result_string = ""
+        result_string = "" if new_cards or removed_count else "No new cards\n"
         for card_info in new_cards:
             card_title = card_info.get("title")
             result_string += f"- {card_title}\n"
+        if removed_count:
+            result_string += f"({removed_count} cards removed)\n"
+        if deadline_exceeded:
+            result_string += "(deadline exceeded, partial results)"
         return result_string.strip()
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
@@ -52,6 +52,127 @@ class SettingsDialog(QtWidgets.QDialog):
         self.check_history_size.setToolTip("Number of check history entries to keep.")
         tracker_group_layout.addRow("Check History Size:", self.check_history_size)
 
+        self.scrape_concurrency = QtWidgets.QSpinBox()
+        self.scrape_concurrency.setButtonSymbols(
+            QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons
+        )
+        self.scrape_concurrency.setRange(
+            self.settings.SCRAPE_CONCURRENCY_MINIMUM,
+            self.settings.SCRAPE_CONCURRENCY_MAXIMUM,
+        )
+        self.scrape_concurrency.setValue(self.settings.scrape_concurrency)
+        self.scrape_concurrency.setMinimumWidth(50)
+        self.scrape_concurrency.setToolTip(
+            "Maximum number of product pages requested at the same time."
+        )
+        tracker_group_layout.addRow("Concurrent Requests:", self.scrape_concurrency)
+
+        self.incremental_crawl_checkbox = QtWidgets.QCheckBox()
+        self.incremental_crawl_checkbox.setChecked(self.settings.incremental_crawl)
+        self.incremental_crawl_checkbox.setToolTip(
+            "Only fetch products published since the last check. Products"
+            " created earlier but published later are only found by the next"
+            " full resync."
+        )
+        tracker_group_layout.addRow(
+            "Incremental Crawl:", self.incremental_crawl_checkbox
+        )
+
+        self.head_probe_checkbox = QtWidgets.QCheckBox()
+        self.head_probe_checkbox.setChecked(self.settings.head_probe)
+        self.head_probe_checkbox.setToolTip(
+            "Request only the newest product and skip the crawl if it is known."
+            " Products created earlier but published later are only found by the"
+            " next full resync."
+        )
+        tracker_group_layout.addRow("Head Probe:", self.head_probe_checkbox)
+
+        self.project_products_checkbox = QtWidgets.QCheckBox()
+        self.project_products_checkbox.setChecked(self.settings.project_products)
+        self.project_products_checkbox.setToolTip(
+            "Keep only the product fields used by the tracker."
+        )
+        tracker_group_layout.addRow(
+            "Compact Product Data:", self.project_products_checkbox
+        )
+
+        self.full_resync_interval = QtWidgets.QSpinBox()
+        self.full_resync_interval.setButtonSymbols(
+            QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons
+        )
+        self.full_resync_interval.setMinimum(self.settings.FULL_RESYNC_INTERVAL_MINIMUM)
+        self.full_resync_interval.setValue(self.settings.full_resync_interval)
+        self.full_resync_interval.setMinimumWidth(50)
+        self.full_resync_interval.setToolTip(
+            "Number of checks after which a full crawl is forced. Bounds how long"
+            " head probes and incremental crawls can miss a product published"
+            " after it was created."
+        )
+        tracker_group_layout.addRow(
+            "Full Resync Every (checks):", self.full_resync_interval
+        )
+
+        self.check_deadline = QtWidgets.QSpinBox()
+        self.check_deadline.setButtonSymbols(
+            QtWidgets.QAbstractSpinBox.ButtonSymbols.NoButtons
+        )
+        self.check_deadline.setMinimum(self.settings.CHECK_DEADLINE_MINIMUM)
+        self.check_deadline.setMaximum(3600)
+        self.check_deadline.setSpecialValueText("None")
+        self.check_deadline.setValue(self.settings.check_deadline)
+        self.check_deadline.setMinimumWidth(50)
+        self.check_deadline.setToolTip(
+            "Time budget of a check. Slower crawls stop with partial results"
+            " and resume on the next check."
+        )
+        tracker_group_layout.addRow("Check Deadline (s):", self.check_deadline)
+
+        self.scraper_backend_combo = QtWidgets.QComboBox()
+        self.scraper_backend_combo.addItem(
+            "Requests", self.settings.SCRAPER_BACKEND_REQUESTS
+        )
+        self.scraper_backend_combo.addItem(
+            "Qt Network", self.settings.SCRAPER_BACKEND_QT
+        )
+        self.scraper_backend_combo.setCurrentIndex(
+            self.scraper_backend_combo.findData(self.settings.scraper_backend)
+        )
+        self.scraper_backend_combo.setToolTip(
+            "Fetch product pages on a worker thread with requests,"
+            " or on the Qt event loop over HTTP/2."
+        )
+        tracker_group_layout.addRow("Scraper Backend:", self.scraper_backend_combo)
+
+        self.storage_backend_combo = QtWidgets.QComboBox()
+        self.storage_backend_combo.addItem("JSON", self.settings.STORAGE_BACKEND_JSON)
+        self.storage_backend_combo.addItem(
+            "SQLite", self.settings.STORAGE_BACKEND_SQLITE
+        )
+        self.storage_backend_combo.setCurrentIndex(
+            self.storage_backend_combo.findData(self.settings.storage_backend)
+        )
+        self.storage_backend_combo.setToolTip(
+            "Store the catalog and check history in JSON files, or in a SQLite"
+            " database updated with only the changed cards. Applies on restart."
+        )
+        tracker_group_layout.addRow("Storage Backend:", self.storage_backend_combo)
+
+        self.snapshot_codec_combo = QtWidgets.QComboBox()
+        self.snapshot_codec_combo.addItem("JSON", self.settings.SNAPSHOT_CODEC_JSON)
+        self.snapshot_codec_combo.addItem(
+            "JSON + gzip", self.settings.SNAPSHOT_CODEC_GZIP
+        )
+        self.snapshot_codec_combo.addItem("JSON + xz", self.settings.SNAPSHOT_CODEC_LZMA)
+        self.snapshot_codec_combo.addItem("Binary", self.settings.SNAPSHOT_CODEC_BINARY)
+        self.snapshot_codec_combo.setCurrentIndex(
+            self.snapshot_codec_combo.findData(self.settings.snapshot_codec)
+        )
+        self.snapshot_codec_combo.setToolTip(
+            "Encoding of the cards cache of the JSON storage backend."
+            " Compressed formats are smaller on disk. Applies on restart."
+        )
+        tracker_group_layout.addRow("Cache Format:", self.snapshot_codec_combo)
+
         self.tracker_group.setLayout(tracker_group_layout)
 
         # --- Pushover Section ---
@@ -97,6 +218,15 @@ class SettingsDialog(QtWidgets.QDialog):
             self.tracker_check_frequency_spinbox.value()
         )
         self.settings.check_history_size = self.check_history_size.value()
+        self.settings.scrape_concurrency = self.scrape_concurrency.value()
+        self.settings.incremental_crawl = self.incremental_crawl_checkbox.isChecked()
+        self.settings.head_probe = self.head_probe_checkbox.isChecked()
+        self.settings.project_products = self.project_products_checkbox.isChecked()
+        self.settings.full_resync_interval = self.full_resync_interval.value()
+        self.settings.check_deadline = self.check_deadline.value()
+        self.settings.scraper_backend = self.scraper_backend_combo.currentData()
+        self.settings.storage_backend = self.storage_backend_combo.currentData()
+        self.settings.snapshot_codec = self.snapshot_codec_combo.currentData()
 
         self.settings.sync()  # write to disk
         super().accept()
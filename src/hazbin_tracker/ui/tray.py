@@ -6,10 +6,13 @@ from PySide6 import QtWidgets
 from .about_dialog import AboutDialog
 from .check_history_dialog import CheckHistoryDialog
 from ..core.constants import APPLICATION_TITLE, HAZBIN_WEBSITE_URL
+from ..core.crawl import CrawlCancelled
 
 if typing.TYPE_CHECKING:
     from hazbin_tracker.ui.application import HazbinTrackerApplication
     from hazbin_tracker.core.cards_tracker import CardsTracker
+    from hazbin_tracker.core.crawl import CrawlProgress
+    from hazbin_tracker.core.diff import CheckResult
 
 
 class SystemTrayContextMenu(QtWidgets.QMenu):
@@ -25,6 +28,8 @@ class SystemTrayContextMenu(QtWidgets.QMenu):
         self.last_check_info_action = self.addAction("Last checked: Never")
         self.last_check_info_action.setEnabled(False)
         self.check_for_updates_action = self.addAction("Check for New Cards")
+        self.cancel_check_action = self.addAction("Cancel Check")
+        self.cancel_check_action.setEnabled(False)
         self.history_action = self.addAction("History...")
         self.settings_action = self.addAction("Settings...")
         self.about_action = self.addAction("About...")
@@ -36,6 +41,10 @@ class SystemTrayContextMenu(QtWidgets.QMenu):
 
         # Signals
         self.history_action.triggered.connect(self.show_history_dialog)
+        self.cancel_check_action.triggered.connect(self.tracker.cancel_check)
+        self.tracker.check_scheduler.running_changed.connect(
+            self.cancel_check_action.setEnabled
+        )
         self.tracker.check_time_updated.connect(self.update_last_checked_action)
         self.settings_action.triggered.connect(
             self.tracker.application.show_settings_dialog
@@ -93,6 +102,10 @@ class HazbinTrackerSystemTrayIcon(QtWidgets.QSystemTrayIcon):
             self.onCheckRequested
         )
         self.tracker.new_cards_found.connect(self.show_new_cards_message)
+        self.tracker.check_scheduler.progress.connect(self.show_check_progress)
+        self.tracker.check_scheduler.running_changed.connect(
+            self.on_check_running_changed
+        )
         self.messageClicked.connect(self.open_hazbin_website)
 
     @property
@@ -104,8 +117,18 @@ class HazbinTrackerSystemTrayIcon(QtWidgets.QSystemTrayIcon):
     @QtCore.Slot()
     def onCheckRequested(self):
         """Handle user request to check for new cards."""
-        new_cards = self.tracker.run_check()
-        if not new_cards:
+        scheduled = self.tracker.request_check(manual=True)
+        scheduled.finished.connect(self.on_manual_check_finished)
+        scheduled.failed.connect(self.on_manual_check_failed)
+
+    @QtCore.Slot(object)
+    def on_manual_check_finished(self, result: "CheckResult"):
+        """Notify the user when a manual check didn't find new cards.
+
+        Args:
+            result (CheckResult): Result of the manual check.
+        """
+        if not result.new_cards:
             self.showMessage(
                 "Hazbin Tracker",
                 "No new Hazbin cards found.",
@@ -113,16 +136,56 @@ class HazbinTrackerSystemTrayIcon(QtWidgets.QSystemTrayIcon):
                 5000,
             )
 
-    @QtCore.Slot(list)
-    def show_new_cards_message(self, new_cards: list):
+    @QtCore.Slot(object)
+    def on_manual_check_failed(self, error: Exception):
+        """Notify the user when a manual check failed.
+
+        Args:
+            error (Exception): Error the check failed with.
+        """
+        if isinstance(error, CrawlCancelled):
+            self.showMessage(
+                "Hazbin Tracker",
+                "Cards check cancelled.",
+                QtWidgets.QSystemTrayIcon.NoIcon,
+                5000,
+            )
+            return
+        self.showMessage(
+            "Hazbin Tracker",
+            f"Cards check failed: {error}",
+            QtWidgets.QSystemTrayIcon.Warning,
+            5000,
+        )
+
+    @QtCore.Slot(object)
+    def show_check_progress(self, progress: "CrawlProgress"):
+        """Show the progress of the running check in the tooltip.
+
+        Args:
+            progress (CrawlProgress): Progress of the running crawl.
+        """
+        self.setToolTip(f"Hazbin Tracker - Checking: {progress.summary}")
+
+    @QtCore.Slot(bool)
+    def on_check_running_changed(self, running: bool):
+        """Reset the tooltip when checks start or stop.
+
+        Args:
+            running (bool): Whether a check is running.
+        """
+        self.setToolTip("Hazbin Tracker - Checking..." if running else "Hazbin Tracker")
+
+    @QtCore.Slot(object)
+    def show_new_cards_message(self, result: "CheckResult"):
         """Show a system tray message for new cards found.
 
         Args:
-            new_cards (list): List of new cards found.
+            result (CheckResult): Result of the check which found new cards.
         """
         self.showMessage(
             "Hazbin Tracker",
-            self.tracker.generate_new_cards_message(new_cards),
+            self.tracker.generate_new_cards_message(result.new_cards),
             QtWidgets.QSystemTrayIcon.NoIcon,
             0,
         )
@@ -0,0 +1,67 @@
+import sys
+import datetime
+
+from hazbin_tracker.core.card import Card, PublishTimeIndex
+
+
+PROJECTED_PRODUCT = {
+    "id": 42,
+    "handle": "alastor",
+    "title": "Alastor",
+    "published_at": "2025-10-01T10:00:03-04:00",
+    "updated_at": "2025-10-02T08:00:00-04:00",
+    "images": [{"src": "https://cdn.shopify.com/alastor.png"}],
+    "variants": [{"id": 7, "available": True, "price": "4.99"}],
+}
+
+
+def test_card_round_trip_projected():
+    card = Card.from_dict(PROJECTED_PRODUCT)
+    assert card.to_dict() == PROJECTED_PRODUCT
+    assert card.extra is None
+    assert card.published_at == datetime.datetime.fromisoformat(
+        PROJECTED_PRODUCT["published_at"]
+    )
+    assert card.image_url == "https://cdn.shopify.com/alastor.png"
+    assert card.available is True
+    assert card.price == "4.99"
+
+
+def test_card_round_trip_full_payload():
+    product = {
+        **PROJECTED_PRODUCT,
+        "body_html": "<p>Radio demon</p>",
+        "images": [{"src": "a.png", "width": 10}, {"src": "b.png", "width": 20}],
+        "variants": [{"id": 7, "available": False, "price": "4.99", "sku": "AL"}],
+    }
+    card = Card.from_dict(product)
+    assert card.to_dict() == product
+    assert card.image_url == "a.png"
+    assert card.available is False
+
+
+def test_card_interns_repeated_strings():
+    first = Card.from_dict(PROJECTED_PRODUCT)
+    second = Card.from_dict({**PROJECTED_PRODUCT, "title": "".join(["Ala", "stor"])})
+    assert first.title is second.title
+    assert first.price is sys.intern("4.99")
+    assert not hasattr(first, "__dict__")
+
+
+def test_publish_time_index():
+    base = datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC)
+    cards = [
+        Card(id=index, published_at=base + datetime.timedelta(days=index % 4))
+        for index in range(8)
+    ]
+    index = PublishTimeIndex(cards)
+
+    assert index.latest_time == base + datetime.timedelta(days=3)
+    assert sorted(card.id for card in index.latest_cards()) == [3, 7]
+    between = index.published_between(
+        base + datetime.timedelta(days=1), base + datetime.timedelta(days=3)
+    )
+    assert sorted(card.id for card in between) == [1, 2, 5, 6]
+    assert index.get(5) is cards[5]
+    assert index.get(99) is None
+    assert PublishTimeIndex([]).latest_cards() == []
@@ -0,0 +1,50 @@
+import datetime
+
+from hazbin_tracker.core.storage import JsonStorage
+from hazbin_tracker.ui.models.check_history import CheckHistoryModel
+
+
+def test_model_loads_only_newest_records(qtbot, tmp_path):
+    storage = JsonStorage(
+        tmp_path / "track.json", tmp_path / "history", tmp_path / "history.json"
+    )
+    storage.history_journal.segment_max_records = 2
+    for index in range(7):
+        storage.append_check({"timestamp": str(index)}, history_size=100)
+
+    model = CheckHistoryModel(storage, history_size=3)
+    model.load()
+
+    assert model.rowCount() == 3
+    assert [model.index(row, 0).data() for row in range(3)] == ["6", "5", "4"]
+    storage.close()
+
+
+def test_model_filters_with_time_index(qtbot, tmp_path):
+    storage = JsonStorage(
+        tmp_path / "track.json", tmp_path / "history", tmp_path / "history.json"
+    )
+    now = datetime.datetime.now(datetime.UTC)
+    for hours in (50, 30, 2, 1):
+        storage.append_check(
+            {
+                "timestamp": (now - datetime.timedelta(hours=hours)).isoformat(),
+                "new_cards": [{"id": hours, "title": "Card"}] if hours != 1 else [],
+            },
+            history_size=100,
+        )
+    model = CheckHistoryModel(storage)
+    model.load()
+    assert model.rowCount() == 4
+
+    model.set_filter(now - datetime.timedelta(days=1))
+    assert [record["new_cards"] for record in model._records] == [
+        [],
+        [{"id": 2, "title": "Card"}],
+    ]
+    model.set_filter(now - datetime.timedelta(hours=40), changes_only=True)
+    assert [record["new_cards"][0]["id"] for record in model._records] == [2, 30]
+    assert model.last_change_time() == (now - datetime.timedelta(hours=2)).strftime(
+        "%d-%m-%Y at %H:%M:%S"
+    )
+    storage.close()
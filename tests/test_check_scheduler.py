@@ -0,0 +1,77 @@
+import pytest
+
+from hazbin_tracker.core.check_scheduler import CheckScheduler
+from hazbin_tracker.core.check_worker import CheckHandle
+from hazbin_tracker.core.diff import CheckResult
+
+
+@pytest.fixture
+def handles():
+    """Collect the handles of the checks started by the scheduler.
+
+    Returns:
+        list[CheckHandle]: started handles
+    """
+    return []
+
+
+@pytest.fixture
+def scheduler(qtbot, handles):
+    """Scheduler starting checks which finish on demand.
+
+    Returns:
+        CheckScheduler: check scheduler
+    """
+
+    def start_check():
+        handle = CheckHandle(lambda result: result)
+        handles.append(handle)
+        return handle
+
+    return CheckScheduler(start_check)
+
+
+def test_single_check_in_flight(scheduler, handles):
+    first = scheduler.request_check()
+    follow_up = scheduler.request_check()
+    dropped = scheduler.request_check()
+
+    assert len(handles) == 1
+    assert follow_up is dropped
+    assert scheduler.dropped_count == 1
+
+    handles[0].on_worker_finished(CheckResult())
+    assert len(handles) == 2
+    assert scheduler.pending_check is None
+
+    handles[1].on_worker_finished(CheckResult())
+    assert not scheduler.is_running
+    assert first is not follow_up
+    assert scheduler.started_count == 2
+
+
+def test_manual_request_merges_into_follow_up(qtbot, scheduler, handles):
+    scheduler.request_check()
+    follow_up = scheduler.request_check()
+    manual = scheduler.request_check(manual=True)
+
+    assert manual is follow_up
+    assert manual.manual
+    assert manual.request_count == 2
+    assert scheduler.coalesced_count == 1
+
+    result = CheckResult()
+    handles[0].on_worker_finished(CheckResult())
+    with qtbot.waitSignal(manual.finished) as blocker:
+        handles[1].on_worker_finished(result)
+    assert blocker.args[0] is result
+
+
+def test_failed_check_starts_follow_up(scheduler, handles):
+    scheduler.request_check()
+    scheduler.request_check(manual=True)
+
+    handles[0].on_worker_failed(ConnectionError())
+
+    assert len(handles) == 2
+    assert scheduler.is_running
@@ -0,0 +1,68 @@
+import datetime
+
+from hazbin_tracker.core.card import Card
+from hazbin_tracker.core.diff import diff_cards
+from hazbin_tracker.core.scrapper import sort_cards
+
+BASE_TIME = datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC)
+
+
+def make_card(card_id: int, days: int = 0, title: str = "Card") -> Card:
+    return Card(
+        id=card_id,
+        title=title,
+        published_at=BASE_TIME + datetime.timedelta(days=days),
+    )
+
+
+def test_diff_cards_classifies_changes():
+    previous = [make_card(1), make_card(2), make_card(3), make_card(4)]
+    current = [
+        make_card(1),
+        make_card(2, days=5),
+        make_card(3, title="Renamed"),
+        make_card(5, days=-30),
+    ]
+    result = diff_cards(previous, current)
+
+    assert [card.id for card in result.added] == [5]
+    assert [card.id for card in result.removed] == [4]
+    assert [card.id for card in result.republished] == [2]
+    assert [card.id for card in result.modified] == [3]
+    assert [card.id for card in result.new_cards] == [5, 2]
+    assert result.has_changes
+
+
+def test_diff_cards_without_previous_snapshot_uses_watermark():
+    current = [make_card(1, days=2), make_card(2, days=-2)]
+    result = diff_cards(None, current, since=BASE_TIME)
+    assert [card.id for card in result.added] == [1]
+    assert not result.removed
+
+    assert not diff_cards(None, current).has_changes
+
+
+def test_diff_cards_handles_cards_without_publish_time():
+    unpublished = Card(id=3, title="Draft")
+    previous = [make_card(1), make_card(2)]
+    current = [make_card(1), Card(id=2, title="Card"), unpublished]
+
+    result = diff_cards(previous, current)
+    assert [card.id for card in result.added] == [3]
+    assert [card.id for card in result.modified] == [2]
+    assert not result.republished
+    assert diff_cards(
+        None, current, since=BASE_TIME - datetime.timedelta(days=1)
+    ).added == [current[0]]
+    assert [card.id for card in sort_cards([unpublished, *previous])] == [1, 2, 3]
+
+
+def test_diff_cards_without_content_hash_compares_fields():
+    previous = [make_card(1), make_card(2)]
+    current = [make_card(1), make_card(2, title="Renamed")]
+    for card in current:
+        card.content_hash = f"hash-{card.id}"
+        card.extra = {"body_html": "<p>Unprojected</p>"}
+
+    result = diff_cards(previous, current)
+    assert [card.id for card in result.modified] == [2]
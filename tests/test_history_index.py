@@ -0,0 +1,41 @@
+import datetime
+
+from hazbin_tracker.core.history_index import (
+    CheckHistoryIndex,
+    format_record_time,
+    parse_record_time,
+)
+
+BASE_TIME = datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC)
+
+
+def make_record(hour: int, new_cards: int = 0) -> dict:
+    time = BASE_TIME + datetime.timedelta(hours=hour)
+    return {
+        "timestamp": time.isoformat(),
+        "new_cards": [{"id": index} for index in range(new_cards)],
+        "removed_count": 0,
+    }
+
+
+def test_parse_record_time_reads_iso_and_legacy_formats():
+    assert parse_record_time({"timestamp": BASE_TIME.isoformat()}) == BASE_TIME
+    legacy = {"timestamp": "01-10-2025 at 00:00:00"}
+    assert parse_record_time(legacy) == BASE_TIME
+    assert format_record_time(make_record(0)) == legacy["timestamp"]
+    assert parse_record_time({"timestamp": "never"}) is None
+
+
+def test_history_index_range_queries():
+    records = [make_record(hour, new_cards=hour % 3 == 0) for hour in range(10)]
+    index = CheckHistoryIndex(list(reversed(records)) + [{"timestamp": "broken"}])
+
+    assert len(index) == 10
+    start = BASE_TIME + datetime.timedelta(hours=2)
+    end = BASE_TIME + datetime.timedelta(hours=4, minutes=30)
+    assert index.between(start, end) == records[2:5]
+    assert index.between(end=start) == records[:3]
+    assert index.changes_between(start) == [records[3], records[6], records[9]]
+    assert index.last_with_changes() == records[9]
+    assert index.last_with_changes(before=end) == records[3]
+    assert CheckHistoryIndex([]).last_with_changes() is None
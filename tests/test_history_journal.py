@@ -0,0 +1,51 @@
+import json
+
+from hazbin_tracker.core.history_journal import HistoryJournal
+from hazbin_tracker.core.storage import JsonStorage
+
+
+def test_journal_rotates_and_tails(tmp_path):
+    journal = HistoryJournal(tmp_path, segment_max_records=3)
+    for index in range(8):
+        journal.append({"index": index})
+
+    assert len(list(tmp_path.glob("*.jsonl"))) == 3
+    assert [record["index"] for record in journal.tail(4)] == [7, 6, 5, 4]
+    assert len(journal.tail()) == 8
+
+    reopened = HistoryJournal(tmp_path, segment_max_records=3)
+    reopened.append({"index": 8})
+    assert [record["index"] for record in reopened.tail(2)] == [8, 7]
+
+
+def test_journal_compaction_drops_expired_segments(tmp_path):
+    journal = HistoryJournal(tmp_path, segment_max_records=2)
+    for index in range(10):
+        journal.append({"index": index}, retention=3)
+        journal.wait_for_compaction()
+
+    segments = sorted(tmp_path.glob("*.jsonl"))
+    assert segments[0].name == "history-000004.jsonl"
+    assert [record["index"] for record in journal.tail()] == [9, 8, 7, 6]
+
+
+def test_journal_recovers_from_interrupted_append(tmp_path):
+    journal = HistoryJournal(tmp_path)
+    journal.append({"index": 0})
+    with journal.segment_path(1).open("ab") as segment_file:
+        segment_file.write(b'{"index": ')
+
+    reopened = HistoryJournal(tmp_path)
+    reopened.append({"index": 1})
+    assert [record["index"] for record in reopened.tail()] == [1, 0]
+
+
+def test_json_storage_migrates_legacy_history(tmp_path):
+    legacy_path = tmp_path / "check_history.json"
+    legacy_path.write_text(json.dumps([{"timestamp": "new"}, {"timestamp": "old"}]))
+
+    storage = JsonStorage(tmp_path / "track.json", tmp_path / "history", legacy_path)
+    storage.append_check({"timestamp": "newest"}, history_size=10)
+
+    assert [r["timestamp"] for r in storage.load_history()] == ["newest", "new", "old"]
+    assert not legacy_path.exists()
@@ -0,0 +1,63 @@
+import threading
+import http.server
+
+import pytest
+
+from hazbin_tracker.core.http_client import HttpClient
+
+
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """Minimal keep-alive handler answering every GET with a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Answer with an empty products page."""
+        body = b'{"products": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+        pass
+
+
+@pytest.fixture
+def local_server_url():
+    """Local keep-alive HTTP server.
+
+    Returns:
+        str: base URL of the server
+    """
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_reused_between_requests(local_server_url):
+    client = HttpClient()
+    for page in range(5):
+        response = client.get(f"{local_server_url}/products.json?page={page}")
+        assert response.json() == {"products": []}
+
+    assert client.stats.requests == 5
+    assert client.stats.new_connections == 1
+    assert client.stats.reused_connections == 4
+    assert client.stats.handshake_time > 0
+    client.close()
+
+
+def test_session_per_host():
+    client = HttpClient()
+    first = client.session_for("https://hazbinhotel.com/products.json")
+    second = client.session_for("https://hazbinhotel.com/collections/x")
+    other = client.session_for("https://api.pushover.net/1/messages.json")
+    assert first is second
+    assert first is not other
+    client.close()
@@ -0,0 +1,189 @@
+import json
+import threading
+import http.server
+import urllib.parse
+
+import pytest
+from PySide6 import QtNetwork
+
+from hazbin_tracker.core.crawl import CrawlCancelled
+from hazbin_tracker.core.http_cache import HttpCache
+from hazbin_tracker.core.http_client import HttpClient
+from hazbin_tracker.core.qt_scrapper import QtCardsFetcher
+
+PAGES_COUNT = 3
+
+
+class PagesHandler(http.server.BaseHTTPRequestHandler):
+    """Handler serving a few products pages followed by empty ones.
+
+    Pages carry an ETag, and the first request for page 2 is throttled.
+    """
+
+    protocol_version = "HTTP/1.1"
+    hits: dict[int, int] = {}
+
+    def do_GET(self):
+        """Answer with the requested products page."""
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        page = int(query["page"][0])
+        hits = self.hits[page] = self.hits.get(page, 0) + 1
+        if page == 2 and hits == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"page-{page}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        products = (
+            [
+                {
+                    "id": page,
+                    "title": f"Card {page}",
+                    "published_at": f"2024-01-0{page}T00:00:00+00:00",
+                }
+            ]
+            if page <= PAGES_COUNT
+            else []
+        )
+        body = json.dumps({"products": products}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+        pass
+
+
+@pytest.fixture
+def products_url():
+    """Local HTTP server serving products pages.
+
+    Returns:
+        str: products.json URL of the server
+    """
+    PagesHandler.hits = {}
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), PagesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/products.json"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def manager(qtbot):
+    """Network access manager released through the event loop.
+
+    Returns:
+        QtNetwork.QNetworkAccessManager: network access manager
+    """
+    manager = QtNetwork.QNetworkAccessManager()
+    yield manager
+    manager.deleteLater()
+    qtbot.wait(10)
+
+
+@pytest.fixture
+def client():
+    """HTTP client whose request policy applies to the fetchers.
+
+    Returns:
+        HttpClient: HTTP client retrying without backoff
+    """
+    client = HttpClient()
+    client.RETRY_BACKOFF_FACTOR = 0
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty HTTP cache.
+
+    Returns:
+        HttpCache: HTTP cache in a temporary directory
+    """
+    return HttpCache(tmp_path / "http_cache")
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_qt_cards_fetcher(qtbot, manager, products_url, client, cache, concurrency):
+    fetcher = QtCardsFetcher(
+        manager, concurrency=concurrency, url=products_url, client=client, cache=cache
+    )
+
+    with qtbot.waitSignal(fetcher.finished, timeout=5000) as blocker:
+        fetcher.start()
+
+    cards = blocker.args[0]
+    assert [card.id for card in cards] == [3, 2, 1]
+    assert all(card.content_hash for card in cards)
+    assert client.stats.retries == 1
+
+
+def test_qt_cards_fetcher_revalidates_cached_pages(
+    qtbot, manager, products_url, client, cache
+):
+    # One page at a time, so no page past the empty one gets cached
+    for _ in range(2):
+        fetcher = QtCardsFetcher(
+            manager, concurrency=1, url=products_url, client=client, cache=cache
+        )
+        with qtbot.waitSignal(fetcher.finished, timeout=5000) as blocker:
+            fetcher.start()
+
+    assert [card.id for card in blocker.args[0]] == [3, 2, 1]
+    assert cache.hits == PAGES_COUNT + 1
+
+
+def test_qt_cards_fetcher_failure(qtbot, manager, client, cache):
+    client.RETRY_TOTAL = 1
+    fetcher = QtCardsFetcher(
+        manager,
+        concurrency=1,
+        url="http://127.0.0.1:1/products.json",
+        client=client,
+        cache=cache,
+    )
+
+    with qtbot.waitSignal(fetcher.failed, timeout=5000) as blocker:
+        fetcher.start()
+
+    assert isinstance(blocker.args[0], ConnectionError)
+    assert client.stats.retries == 1
+
+
+def test_qt_cards_fetcher_build_failure(mocker, manager, client, cache):
+    error = ValueError("boom")
+    mocker.patch("hazbin_tracker.core.qt_scrapper.build_cards", side_effect=error)
+    fetcher = QtCardsFetcher(manager, client=client, cache=cache)
+    failures = []
+    fetcher.failed.connect(failures.append)
+
+    fetcher._on_products_fetched([{"id": 1}])
+
+    assert failures == [error]
+
+
+def test_qt_cards_fetcher_cancel_interrupts_retry_wait(manager, client, cache):
+    fetcher = QtCardsFetcher(manager, client=client, cache=cache)
+    products_fetcher = fetcher._products_fetcher
+    failures = []
+    fetcher.failed.connect(failures.append)
+    products_fetcher._send_later(1, delay=30)
+
+    fetcher.cancel()
+
+    assert isinstance(failures[0], CrawlCancelled)
+    assert not products_fetcher._waiting
@@ -0,0 +1,183 @@
+import time
+import threading
+import http.server
+
+import pytest
+
+from hazbin_tracker.core.crawl import CancellationToken, CrawlCancelled
+from hazbin_tracker.core.http_client import HttpClient
+from hazbin_tracker.core.rate_limit import (
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        """Instance constructor."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time.
+
+        Returns:
+            float: current time in seconds
+        """
+        return self.now
+
+    def sleep(self, seconds: float):
+        """Advance the clock instead of sleeping.
+
+        Args:
+            seconds (float): time to advance by
+        """
+        self.now += seconds
+
+
+class FlakyHandler(http.server.BaseHTTPRequestHandler):
+    """Handler throttling or failing requests depending on the path."""
+
+    protocol_version = "HTTP/1.1"
+    hits: dict[str, int] = {}
+
+    def do_GET(self):
+        """Answer 429 on the first /throttled request and 503 on /down."""
+        hits = self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path == "/down" or (self.path == "/throttled" and hits == 1):
+            status = 503 if self.path == "/down" else 429
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"products": []}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+        pass
+
+
+@pytest.fixture
+def flaky_server_url():
+    """Local HTTP server with throttled and failing paths.
+
+    Returns:
+        str: base URL of the server
+    """
+    FlakyHandler.hits = {}
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_circuit_breaker_opens_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock.sleep(10)
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.release_trial()
+    assert breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.open_count == 1
+
+
+def test_backoff_delay_and_retry_after():
+    assert backoff_delay(3, base=0.5, cap=30, rng=lambda low, high: high) == 4.0
+    assert backoff_delay(10, base=0.5, cap=30, rng=lambda low, high: high) == 30
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_client_retries_throttled_request(flaky_server_url):
+    client = HttpClient()
+    response = client.get(f"{flaky_server_url}/throttled")
+
+    assert response.status_code == 200
+    assert client.stats.retries == 1
+    assert client.circuit_breaker_for(flaky_server_url).state == CircuitBreaker.CLOSED
+    client.close()
+
+
+def test_client_opens_circuit_for_failing_host(flaky_server_url):
+    client = HttpClient()
+    client.CIRCUIT_FAILURE_THRESHOLD = 2
+    client._sleep = lambda seconds: None
+
+    for _ in range(2):
+        with pytest.raises(CircuitOpenError):
+            client.get(f"{flaky_server_url}/down")
+    assert FlakyHandler.hits["/down"] == 2
+    assert client.stats.retries == 1
+    client.close()
+
+
+def test_client_releases_circuit_trial(mocker, flaky_server_url):
+    client = HttpClient()
+    client._sleep = lambda seconds: None
+    clock = FakeClock()
+    breaker = client.circuit_breaker_for(flaky_server_url)
+    breaker._clock = clock
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    clock.sleep(breaker.reset_timeout)
+
+    session = client.session_for(flaky_server_url)
+    mocker.patch.object(session, "request", side_effect=ValueError("boom"))
+    with pytest.raises(ValueError):
+        client.get(f"{flaky_server_url}/throttled")
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    mocker.stopall()
+
+    response = client.get(f"{flaky_server_url}/throttled")
+    assert response.status_code == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+    client.close()
+
+
+def test_client_retry_wait_interrupted_by_cancel(mocker, flaky_server_url):
+    client = HttpClient()
+    mocker.patch.object(client, "retry_delay", return_value=30)
+    token = CancellationToken()
+    threading.Timer(0.1, token.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(CrawlCancelled):
+        client.get(f"{flaky_server_url}/down", cancel_token=token)
+    assert time.monotonic() - start < 5
+    assert FlakyHandler.hits["/down"] == 1
+    client.close()
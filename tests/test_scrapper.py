@@ -1,13 +1,27 @@
+import pytest
 import requests
 import logging
 import json
+import time
 import pathlib
+import datetime
+from urllib.parse import parse_qs, urlsplit
 
 from hazbin_tracker.core.constants import (
     HAZBIN_CARDS_PRODUCTS_JSON_URL,
     DEFAULT_SORT_KEY,
 )
-from hazbin_tracker.core.scrapper import get_all_cards
+from hazbin_tracker.core.card import Card, catalog_digest
+from hazbin_tracker.core.crawl import CancellationToken, CrawlCancelled, CrawlDeadline
+from hazbin_tracker.core.http_cache import HttpCache
+from hazbin_tracker.core.scrapper import (
+    build_cards,
+    get_all_cards,
+    get_all_products,
+    get_latest_product,
+    get_new_products,
+    project_product,
+)
 
 logging.basicConfig(level=logging.DEBUG)
 LOGGER = logging.getLogger(__name__)
@@ -21,11 +35,294 @@ def test_hazbin_cards_page_accessible():
 
 def test_get_cards_products(output_dir: pathlib.Path):
     data = get_all_cards()
-    json.dump(data, open(output_dir / "cards.json", "w"), indent=4)
+    json.dump(
+        [card.to_dict() for card in data],
+        open(output_dir / "cards.json", "w"),
+        indent=4,
+    )
     assert len(data) > 0
 
-    first_card: dict = data[0]
-    assert first_card.get("id") is not None
-    assert first_card.get("title") is not None
-    assert first_card.get(DEFAULT_SORT_KEY) is not None
-    assert first_card.get("images") is not None
+    first_card: Card = data[0]
+    assert first_card.id is not None
+    assert first_card.title is not None
+    assert getattr(first_card, DEFAULT_SORT_KEY) is not None
+    assert first_card.image_url is not None
+
+
+@pytest.fixture
+def http_cache(mocker, tmp_path):
+    """HTTP cache writing its entries to a temporary directory.
+
+    Returns:
+        HttpCache: cache used by the scrapper
+    """
+    cache = HttpCache(tmp_path / "http_cache")
+    mocker.patch("hazbin_tracker.core.scrapper.get_http_cache", return_value=cache)
+    return cache
+
+
+@pytest.fixture
+def fake_pages(mocker, http_cache):
+    """Mock products.json pages: three full pages followed by empty ones.
+
+    Pages carry an ETag and answer matching conditional requests with 304.
+
+    Returns:
+        list[tuple[int, int]]: requested page numbers and response status codes
+    """
+    requests_log = []
+
+    def fake_get(url, headers=None, timeout=None, cancel_token=None):
+        page = int(parse_qs(urlsplit(url).query)["page"][0])
+        etag = f'"page-{page}"'
+        response = mocker.Mock()
+        response.headers = {"ETag": etag}
+        if (headers or {}).get("If-None-Match") == etag:
+            response.status_code = 304
+        else:
+            response.status_code = 200
+            products = (
+                [{"id": page * 10 + i, "title": f"Card {page}-{i}"} for i in range(2)]
+                if page <= 3
+                else []
+            )
+            response.json.return_value = {"products": products}
+            response.content = json.dumps({"products": products}).encode()
+        requests_log.append((page, response.status_code))
+        return response
+
+    client = mocker.Mock()
+    client.get.side_effect = fake_get
+    mocker.patch("hazbin_tracker.core.scrapper.get_http_client", return_value=client)
+    return requests_log
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 8])
+def test_get_all_products_page_order(fake_pages, concurrency):
+    products = get_all_products(concurrency=concurrency)
+    assert [product["id"] for product in products] == [10, 11, 20, 21, 30, 31]
+    assert (4, 200) in fake_pages
+
+
+def test_get_all_products_reports_progress(fake_pages):
+    progress = []
+    get_all_products(concurrency=2, progress_callback=progress.append)
+
+    assert [item.pages for item in progress] == [1, 2, 3]
+    assert [item.products for item in progress] == [2, 4, 6]
+    assert progress[-1].bytes > progress[0].bytes > 0
+
+
+def test_resumed_crawl_reports_completed_pages(fake_pages):
+    progress = []
+    get_all_products(concurrency=2, progress_callback=progress.append, start_page=2)
+
+    assert [item.pages for item in progress] == [1, 2]
+
+
+def test_get_all_products_cancelled_between_pages(fake_pages):
+    token = CancellationToken()
+    progress = []
+
+    def cancel_after_first_page(item):
+        progress.append(item)
+        token.cancel()
+
+    with pytest.raises(CrawlCancelled):
+        get_all_products(
+            concurrency=1,
+            progress_callback=cancel_after_first_page,
+            cancel_token=token,
+        )
+    assert len(progress) == 1
+
+
+def test_get_all_products_stops_at_deadline(mocker):
+    def slow_page(page, **kwargs):
+        if page > 1:
+            time.sleep(0.5)
+        return [{"id": page}], 10
+
+    mocker.patch(
+        "hazbin_tracker.core.scrapper.fetch_products_page", side_effect=slow_page
+    )
+    deadline = CrawlDeadline(0.2)
+
+    products = get_all_products(concurrency=1, deadline=deadline)
+
+    assert products == [{"id": 1}]
+    assert deadline.exceeded
+    assert deadline.resume_page == 2
+
+
+def test_get_all_products_fails_on_connection_error_mid_crawl(mocker):
+    def failing_page(page, **kwargs):
+        if page == 2:
+            raise requests.exceptions.ConnectionError()
+        return [{"id": page}], 10
+
+    mocker.patch(
+        "hazbin_tracker.core.scrapper.fetch_products_page", side_effect=failing_page
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        get_all_products(concurrency=2)
+
+
+def test_get_all_products_revalidates_cached_pages(fake_pages, http_cache):
+    first = get_all_products(concurrency=1)
+    fake_pages.clear()
+    second = get_all_products(concurrency=1)
+
+    assert second == first
+    assert {status for _, status in fake_pages} == {304}
+    assert http_cache.hits == len(fake_pages)
+
+
+def test_revalidated_pages_are_not_parsed_again(mocker, fake_pages):
+    first = get_all_products(concurrency=1)
+    loads = mocker.spy(json, "loads")
+    second = get_all_products(concurrency=1)
+
+    loads.assert_not_called()
+    assert second[0] is first[0]
+
+
+def test_build_cards_leaves_products_untouched():
+    product = {"id": 1, "title": "Hazbin Hotel Trading Cards - Alastor"}
+
+    first = build_cards([product], project=False)
+    second = build_cards([product], project=False)
+
+    assert product["title"] == "Hazbin Hotel Trading Cards - Alastor"
+    assert first[0].title == "- Alastor"
+    assert first[0].content_hash == second[0].content_hash
+
+
+@pytest.fixture
+def newest_first_pages(mocker):
+    """Mock get_products_page with hourly products, newest first, two per page.
+
+    Returns:
+        Mock: patched get_products_page
+    """
+    now = datetime.datetime.now(datetime.UTC)
+    products = [
+        {
+            "id": index,
+            "published_at": (now - datetime.timedelta(hours=index)).isoformat(),
+        }
+        for index in range(10)
+    ]
+
+    def fake_page(page, sort_by=None, cancel_token=None):
+        return products[(page - 1) * 2 : page * 2]
+
+    return mocker.patch(
+        "hazbin_tracker.core.scrapper.get_products_page", side_effect=fake_page
+    )
+
+
+def test_get_new_products_stops_at_watermark(newest_first_pages):
+    since = datetime.datetime.now(datetime.UTC) - datetime.timedelta(hours=2.5)
+    products = get_new_products(since)
+    assert [product["id"] for product in products] == [0, 1, 2]
+    assert newest_first_pages.call_count == 2
+
+
+def test_get_new_products_detects_unsorted_pages(mocker):
+    now = datetime.datetime.now(datetime.UTC)
+    mocker.patch(
+        "hazbin_tracker.core.scrapper.get_products_page",
+        return_value=[
+            {"id": 1, "published_at": (now - datetime.timedelta(hours=2)).isoformat()},
+            {"id": 2, "published_at": now.isoformat()},
+        ],
+    )
+    assert get_new_products(now - datetime.timedelta(hours=5)) is None
+
+
+def test_get_new_products_cancelled(newest_first_pages):
+    token = CancellationToken()
+    token.cancel()
+
+    with pytest.raises(CrawlCancelled):
+        get_new_products(datetime.datetime.now(datetime.UTC), cancel_token=token)
+    newest_first_pages.assert_not_called()
+
+
+def test_get_new_products_skips_unpublished_products(mocker):
+    now = datetime.datetime.now(datetime.UTC)
+    mocker.patch(
+        "hazbin_tracker.core.scrapper.get_products_page",
+        side_effect=[
+            [
+                {"id": 1, "published_at": None},
+                {"id": 2, "published_at": now.isoformat()},
+                {"id": 3, "published_at": None},
+            ],
+            [],
+        ],
+    )
+    since = now - datetime.timedelta(hours=1)
+    assert [product["id"] for product in get_new_products(since)] == [2]
+
+
+def test_get_latest_product_detects_unsorted_pages(mocker):
+    now = datetime.datetime.now(datetime.UTC)
+    older = {"id": 1, "published_at": (now - datetime.timedelta(hours=2)).isoformat()}
+    newer = {"id": 2, "published_at": now.isoformat()}
+    get_products_page = mocker.patch("hazbin_tracker.core.scrapper.get_products_page")
+
+    get_products_page.return_value = [newer, older]
+    assert get_latest_product() == newer
+    get_products_page.return_value = [older, newer]
+    assert get_latest_product() is None
+
+
+def test_project_product():
+    product = {
+        "id": 1,
+        "handle": "card",
+        "title": "Hazbin Hotel Trading Cards - Alastor",
+        "body_html": "<p>" + "x" * 1000 + "</p>",
+        "published_at": "2025-10-01T10:00:00-04:00",
+        "updated_at": "2025-10-02T10:00:00-04:00",
+        "images": [{"src": "first.png", "width": 10}, {"src": "second.png"}],
+        "variants": [{"id": 5, "available": True, "price": "9.99", "sku": "A"}],
+        "options": [{"name": "Title"}],
+    }
+    projected = project_product(product)
+    assert projected == {
+        "id": 1,
+        "handle": "card",
+        "title": "Hazbin Hotel Trading Cards - Alastor",
+        "published_at": "2025-10-01T10:00:00-04:00",
+        "updated_at": "2025-10-02T10:00:00-04:00",
+        "images": [{"src": "first.png"}],
+        "variants": [{"id": 5, "available": True, "price": "9.99"}],
+    }
+
+
+def test_build_cards_reuses_unchanged_cards():
+    products = [
+        {
+            "id": index,
+            "title": f"Hazbin Hotel Trading Cards Card {index}",
+            "published_at": f"2025-10-0{index}T10:00:00-04:00",
+        }
+        for index in (1, 2)
+    ]
+    first = build_cards(products)
+    known_cards = {card.id: card for card in first}
+    assert [card.title for card in first] == ["Card 2", "Card 1"]
+
+    second = build_cards(
+        [products[0], {**products[1], "title": "Renamed"}], known_cards=known_cards
+    )
+    second_by_id = {card.id: card for card in second}
+    assert second_by_id[1] is known_cards[1]
+    assert second_by_id[2] is not known_cards[2]
+    assert second_by_id[2].content_hash != known_cards[2].content_hash
+    assert catalog_digest(build_cards(products)) == catalog_digest(first)
+    assert catalog_digest(second) != catalog_digest(first)
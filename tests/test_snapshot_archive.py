@@ -0,0 +1,80 @@
+import datetime
+
+import pytest
+
+from hazbin_tracker.core.card import Card
+from hazbin_tracker.core.diff import diff_cards
+from hazbin_tracker.core.snapshot_archive import ArchiveNotFoundError, SnapshotArchive
+
+BASE_TIME = datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC)
+
+
+def make_card(card_id: int, title: str = "Card") -> Card:
+    return Card(
+        id=card_id,
+        handle=f"card-{card_id}",
+        title=title,
+        published_at=BASE_TIME - datetime.timedelta(days=card_id),
+    )
+
+
+def at_hour(hour: int) -> datetime.datetime:
+    return BASE_TIME + datetime.timedelta(hours=hour)
+
+
+def test_archive_rebuilds_past_catalogs(tmp_path):
+    archive = SnapshotArchive(tmp_path / "archive", keyframe_interval=2)
+    states = [
+        [make_card(1), make_card(2)],
+        [make_card(1), make_card(2), make_card(3)],
+        [make_card(1, title="Renamed"), make_card(3)],
+        [make_card(1, title="Renamed"), make_card(3)],
+        [make_card(3), make_card(4)],
+    ]
+    previous = None
+    for hour, cards in enumerate(states):
+        changes = diff_cards(previous, cards) if previous is not None else None
+        archive.record(at_hour(hour), cards, changes)
+        previous = cards
+
+    # Unchanged check isn't recorded, the last state starts a new keyframe
+    assert archive.keyframe_times == [at_hour(0), at_hour(4)]
+    assert not archive.deltas_path(2).exists()
+
+    reopened = SnapshotArchive(tmp_path / "archive", keyframe_interval=2)
+    for hour, cards in enumerate(states):
+        assert reopened.rebuild(at_hour(hour)) == cards
+    assert reopened.rebuild(at_hour(3) + datetime.timedelta(minutes=30)) == states[3]
+    with pytest.raises(ArchiveNotFoundError):
+        reopened.rebuild(at_hour(-1))
+
+
+def test_archive_skips_torn_delta(tmp_path):
+    archive = SnapshotArchive(tmp_path)
+    previous = [make_card(1)]
+    current = [make_card(1), make_card(2)]
+    archive.record(at_hour(0), previous)
+    archive.record(at_hour(1), current, diff_cards(previous, current))
+    with archive.deltas_path(1).open("ab") as deltas_file:
+        deltas_file.write(b'{"time": "2025')
+
+    assert SnapshotArchive(tmp_path).rebuild(at_hour(2)) == current
+
+
+def test_archive_writes_keyframe_after_failed_record(mocker, tmp_path):
+    archive = SnapshotArchive(tmp_path)
+    states = [
+        [make_card(1)],
+        [make_card(1), make_card(2)],
+        [make_card(1), make_card(2), make_card(3)],
+    ]
+    archive.record(at_hour(0), states[0])
+    mocker.patch.object(archive, "append_delta", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        archive.record(at_hour(1), states[1], diff_cards(states[0], states[1]))
+    mocker.stopall()
+
+    archive.record(at_hour(2), states[2], diff_cards(states[1], states[2]))
+
+    assert archive.keyframe_times == [at_hour(0), at_hour(2)]
+    assert SnapshotArchive(tmp_path).rebuild(at_hour(2)) == states[2]
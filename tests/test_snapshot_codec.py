@@ -0,0 +1,37 @@
+import io
+
+import pytest
+
+from hazbin_tracker.core.snapshot_codec import SNAPSHOT_CODECS, decode, detect_codec
+from hazbin_tracker.core.snapshot_store import SnapshotStore
+
+HEADER = {"format": 2, "last_check_time": "t0"}
+CARDS = [
+    {"id": 1, "title": "Card", "variants": [{"id": 10, "available": True}]},
+    {"id": 2, "title": "Other", "variants": []},
+    {"id": 3, "title": "Extra", "variants": [], "tags": ["promo"]},
+]
+
+
+@pytest.mark.parametrize("name", SNAPSHOT_CODECS)
+def test_codec_round_trip_and_detection(name):
+    codec = SNAPSHOT_CODECS[name]
+    data = codec.encode(HEADER, CARDS)
+
+    assert detect_codec(io.BytesIO(data)) is codec
+    header, cards = decode(data)
+    assert header.items() >= HEADER.items()
+    assert cards == CARDS
+
+
+def test_snapshot_store_reads_snapshots_of_any_codec(tmp_path):
+    path = tmp_path / "track.json"
+    SnapshotStore(path, codec=SNAPSHOT_CODECS["lzma"]).write_snapshot(HEADER, CARDS)
+
+    store = SnapshotStore(path, codec=SNAPSHOT_CODECS["binary"])
+    assert store.load_header()["last_check_time"] == "t0"
+    assert store.load_cards() == CARDS
+
+    store.write_snapshot(HEADER, CARDS[:1])
+    assert path.read_bytes().startswith(SNAPSHOT_CODECS["binary"].magic)
+    assert SnapshotStore(path).load_cards() == CARDS[:1]
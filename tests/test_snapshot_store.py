@@ -0,0 +1,99 @@
+import json
+
+from hazbin_tracker.core.snapshot_store import SnapshotStore
+
+
+def make_cards(card_ids: list[int]) -> list[dict]:
+    return [{"id": card_id, "title": "Card"} for card_id in card_ids]
+
+
+def test_snapshot_store_replays_deltas(tmp_path):
+    store = SnapshotStore(tmp_path / "track.json", compact_after=2)
+    store.write_snapshot({"last_check_time": "t0"}, make_cards([1, 2]))
+    assert store.accepts_delta
+    store.append_delta(
+        {
+            "header": {"last_check_time": "t1", "resume_page": 2},
+            "upserted": [{"id": 2, "title": "Renamed"}, {"id": 3, "title": "New"}],
+            "removed": [1],
+        }
+    )
+
+    reloaded = SnapshotStore(tmp_path / "track.json", compact_after=2)
+    header = reloaded.load_header()
+    assert header["last_check_time"] == "t1"
+    assert header["resume_page"] == 2
+    assert reloaded.load_cards() == [
+        {"id": 2, "title": "Renamed"},
+        {"id": 3, "title": "New"},
+    ]
+
+    store.append_delta({"header": {"last_check_time": "t2"}})
+    assert not store.accepts_delta
+    store.write_snapshot({"last_check_time": "t3"}, make_cards([4]))
+    assert not store.journal_path.exists()
+    assert (
+        SnapshotStore(tmp_path / "track.json").load_header()["last_check_time"] == "t3"
+    )
+
+
+def test_snapshot_store_reads_header_without_cards(tmp_path, mocker):
+    store = SnapshotStore(tmp_path / "track.json")
+    store.write_snapshot({"last_check_time": "t0"}, make_cards(range(1000)))
+
+    loads = mocker.spy(json, "loads")
+    reloaded = SnapshotStore(tmp_path / "track.json")
+    assert reloaded.load_header()["last_check_time"] == "t0"
+    assert loads.call_count == 1
+    assert len(reloaded.load_cards()) == 1000
+
+
+def test_snapshot_store_reads_legacy_snapshot(tmp_path):
+    path = tmp_path / "track.json"
+    path.write_text(
+        json.dumps({"last_check_time": "t0", "cards": make_cards([1])}, indent=4)
+    )
+
+    store = SnapshotStore(path)
+    assert store.load_header() == {"last_check_time": "t0"}
+    assert not store.accepts_delta
+    assert store.load_cards() == make_cards([1])
+
+
+def test_snapshot_store_survives_torn_writes(tmp_path):
+    store = SnapshotStore(tmp_path / "track.json")
+    store.write_snapshot({"last_check_time": "t0"}, make_cards([1]))
+    store.write_snapshot({"last_check_time": "t1"}, make_cards([1, 2]))
+    store.append_delta({"header": {"last_check_time": "t2"}, "removed": [2]})
+
+    # Torn journal record: ignored and truncated so later appends stay readable
+    with store.journal_path.open("ab") as journal_file:
+        journal_file.write(b'{"generation": ')
+    reloaded = SnapshotStore(tmp_path / "track.json")
+    assert reloaded.load_header()["last_check_time"] == "t2"
+    reloaded.append_delta({"header": {"last_check_time": "t3"}})
+    assert (
+        SnapshotStore(tmp_path / "track.json").load_header()["last_check_time"] == "t3"
+    )
+
+    # Truncated snapshot: falls back to the previous generation
+    store.path.write_bytes(store.path.read_bytes()[:20])
+    reloaded = SnapshotStore(tmp_path / "track.json")
+    assert reloaded.load_header()["last_check_time"] == "t0"
+    assert [card["id"] for card in reloaded.load_cards()] == [1]
+
+
+def test_snapshot_store_keeps_recovered_generation(tmp_path):
+    store = SnapshotStore(tmp_path / "track.json")
+    store.write_snapshot({"last_check_time": "t0"}, make_cards([1]))
+    store.write_snapshot({"last_check_time": "t1"}, make_cards([1, 2]))
+    store.path.write_bytes(store.path.read_bytes()[:20])
+
+    reloaded = SnapshotStore(tmp_path / "track.json")
+    assert reloaded.load_header()["last_check_time"] == "t0"
+    reloaded.write_snapshot({"last_check_time": "t2"}, make_cards([1, 3]))
+
+    previous = SnapshotStore(store.previous_path)
+    assert previous.load_header()["last_check_time"] == "t0"
+    assert [card["id"] for card in previous.load_cards()] == [1]
+    assert SnapshotStore(tmp_path / "track.json").load_header()["generation"]
@@ -0,0 +1,88 @@
+import datetime
+
+import pytest
+
+from hazbin_tracker.core.card import Card
+from hazbin_tracker.core.diff import diff_cards
+from hazbin_tracker.core.storage import (
+    CatalogNotFoundError,
+    CatalogSnapshot,
+    JsonStorage,
+    SQLiteStorage,
+)
+
+BASE_TIME = datetime.datetime(2025, 10, 1, tzinfo=datetime.UTC)
+
+
+def make_card(card_id: int, days: int = 0, title: str = "Card") -> Card:
+    return Card(
+        id=card_id,
+        handle=f"card-{card_id}",
+        title=title,
+        published_at=BASE_TIME + datetime.timedelta(days=days),
+    )
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    """Create a SQLite storage in a temporary directory.
+
+    Returns:
+        SQLiteStorage: storage instance
+    """
+    storage = SQLiteStorage(tmp_path / "catalog.sqlite3")
+    yield storage
+    storage.close()
+
+
+def test_sqlite_storage_writes_changed_rows(sqlite_storage):
+    with pytest.raises(CatalogNotFoundError):
+        sqlite_storage.load_catalog()
+
+    previous = [make_card(1, days=1), make_card(2), make_card(3)]
+    sqlite_storage.save_catalog(CatalogSnapshot(BASE_TIME, previous))
+    current = [make_card(4, days=2), make_card(1, days=1), make_card(2, title="New")]
+    changes = diff_cards(previous, current)
+    check_time = BASE_TIME + datetime.timedelta(hours=1)
+
+    statements = []
+    sqlite_storage._connection.set_trace_callback(statements.append)
+    sqlite_storage.save_catalog(CatalogSnapshot(check_time, current, 3), changes)
+    sqlite_storage._connection.set_trace_callback(None)
+
+    snapshot = sqlite_storage.load_catalog()
+    assert not snapshot.is_loaded
+    assert snapshot.card_count == 3
+    assert snapshot.latest_cards == current
+    assert snapshot.load_cards() == current
+    assert snapshot.last_check_time == check_time
+    assert snapshot.resume_page == 3
+    assert not any(
+        statement.startswith("DELETE FROM products;") for statement in statements
+    )
+    assert sum("INSERT OR REPLACE INTO products" in s for s in statements) == 2
+
+
+def test_sqlite_storage_trims_history(sqlite_storage):
+    for index in range(5):
+        sqlite_storage.append_check({"timestamp": str(index)}, history_size=3)
+
+    assert [r["timestamp"] for r in sqlite_storage.load_history()] == ["4", "3", "2"]
+    assert len(sqlite_storage.load_history(limit=1)) == 1
+
+
+def test_sqlite_storage_migrates_json_once(tmp_path, sqlite_storage):
+    json_storage = JsonStorage(
+        tmp_path / "track.json", tmp_path / "history", tmp_path / "history.json"
+    )
+    json_storage.save_catalog(
+        CatalogSnapshot(BASE_TIME, [make_card(1, days=1), make_card(2)])
+    )
+    json_storage.append_check({"timestamp": "old"}, history_size=10)
+    json_storage.append_check({"timestamp": "new"}, history_size=10)
+
+    sqlite_storage.migrate_from(json_storage)
+    sqlite_storage.migrate_from(json_storage)
+
+    assert [card.id for card in sqlite_storage.load_catalog().load_cards()] == [1, 2]
+    assert sqlite_storage.load_history() == json_storage.load_history()
@@ -1,13 +1,22 @@
 import pytest
 import datetime
+import requests
+import threading
 from datetime import timedelta
 
+from src.hazbin_tracker.core.card import Card, catalog_digest
 from src.hazbin_tracker.core.cards_tracker import CardsTracker
+from src.hazbin_tracker.core.check_worker import CheckHandle
+from src.hazbin_tracker.core.crawl import CrawlCancelled
+from src.hazbin_tracker.core.diff import CheckResult
+from src.hazbin_tracker.core.storage import CatalogSnapshot, JsonStorage
 
 
 TIME_ONE_HOUR_AGO = datetime.datetime.now(datetime.UTC) - timedelta(hours=1)
 TIME_ONE_HOUR_LATER = datetime.datetime.now(datetime.UTC) + timedelta(hours=1)
 GET_ALL_CARDS_FUNC_SIGNATURE = "src.hazbin_tracker.core.cards_tracker.get_all_cards"
+POPULATE_CARDS_DATA = CardsTracker.populate_cards_data
+CREATE_CACHE = CardsTracker.create_cache
 
 
 @pytest.fixture
@@ -17,13 +26,15 @@ def fake_no_new_cards_data():
     This data is expected to not trigger new card check.
 
     Returns:
-        list[dict]: mock old card data
+        list[Card]: mock old card data
     """
     return [
-        {
-            "title": "Old Hazbin Card",
-            "published_at": TIME_ONE_HOUR_AGO.isoformat(),
-        }
+        Card.from_dict(
+            {
+                "title": "Old Hazbin Card",
+                "published_at": TIME_ONE_HOUR_AGO.isoformat(),
+            }
+        )
     ]
 
 
@@ -34,13 +45,15 @@ def fake_new_cards_data():
     This data is expected to trigger new card check.
 
     Returns:
-        list[dict]: mock new card data
+        list[Card]: mock new card data
     """
     return [
-        {
-            "title": "New Hazbin Card",
-            "published_at": TIME_ONE_HOUR_LATER.isoformat(),
-        }
+        Card.from_dict(
+            {
+                "title": "New Hazbin Card",
+                "published_at": TIME_ONE_HOUR_LATER.isoformat(),
+            }
+        )
     ]
 
 
@@ -68,8 +81,40 @@ def mock_get_all_cards(
 
 
 @pytest.fixture
-def tracker_instance(mocker):
+def fake_application(mocker):
+    """Application stand-in exposing default tracker settings."""
+    settings = mocker.Mock()
+    settings.scrape_concurrency = 1
+    settings.incremental_crawl = False
+    settings.head_probe = False
+    settings.full_resync_interval = 12
+    settings.project_products = True
+    settings.scraper_backend = "requests"
+    settings.check_deadline = 0
+    settings.storage_backend = "json"
+    settings.snapshot_codec = "json"
+    application = mocker.Mock()
+    application.settings = settings
+    return application
+
+
+@pytest.fixture
+def tracker_instance(mocker, fake_application, tmp_path):
     """Tracker instance with mocked properties and methods."""
+    mocker.patch(
+        "src.hazbin_tracker.core.cards_tracker.create_storage",
+        return_value=JsonStorage(
+            tmp_path / "track_data.json",
+            tmp_path / "check_history",
+            tmp_path / "check_history.json",
+        ),
+    )
+    mocker.patch.object(
+        CardsTracker,
+        "application",
+        new_callable=mocker.PropertyMock,
+        return_value=fake_application,
+    )
     mocker.patch.object(CardsTracker, "on_new_cards_found", return_value=None)
     mocker.patch.object(CardsTracker, "start_periodic_check_timer", return_value=None)
     mocker.patch.object(CardsTracker, "create_cache", return_value=None)
@@ -102,11 +147,364 @@ def test_run_check(
 ):
     """Test run_check method with fake cards data."""
     if mock_get_all_cards == "no_new":
-        new_cards = tracker_instance.run_check()
+        result = tracker_instance.run_check()
         assert tracker_instance._cards_data == fake_no_new_cards_data
-        assert len(new_cards) == 0
+        assert len(result.new_cards) == 0
 
     elif mock_get_all_cards == "new":
-        new_cards = tracker_instance.run_check()
+        result = tracker_instance.run_check()
         assert tracker_instance._cards_data == fake_new_cards_data
-        assert len(new_cards) == len(fake_new_cards_data)
+        assert len(result.new_cards) == len(fake_new_cards_data)
+
+
+@pytest.mark.parametrize("probe_result", ["known", "older_known", "new"])
+def test_run_check_head_probe(mocker, tracker_instance, fake_application, probe_result):
+    """Test that a head probe only escalates to a crawl when something changed."""
+    products = {
+        "older_known": {
+            "id": 1,
+            "title": "Older",
+            "published_at": (TIME_ONE_HOUR_AGO - timedelta(hours=1)).isoformat(),
+        },
+        "known": {
+            "id": 3,
+            "title": "Old",
+            "published_at": TIME_ONE_HOUR_AGO.isoformat(),
+        },
+        "new": {
+            "id": 2,
+            "title": "New",
+            "published_at": TIME_ONE_HOUR_LATER.isoformat(),
+        },
+    }
+    older_card, known_card, new_card = (
+        Card.from_dict(products[key]) for key in ("older_known", "known", "new")
+    )
+    fake_application.settings.head_probe = True
+    tracker_instance._cards_data = [known_card, older_card]
+    # An older known card is what a shop ignoring the requested order returns
+    mocker.patch(
+        "src.hazbin_tracker.core.cards_tracker.get_latest_product",
+        return_value=products[probe_result],
+    )
+    get_all_cards = mocker.patch(
+        GET_ALL_CARDS_FUNC_SIGNATURE, return_value=[new_card, known_card, older_card]
+    )
+
+    new_cards = tracker_instance.run_check().new_cards
+
+    assert tracker_instance.probe_count == 1
+    if probe_result == "known":
+        get_all_cards.assert_not_called()
+        assert tracker_instance.probe_escalation_count == 0
+        assert new_cards == []
+    else:
+        get_all_cards.assert_called_once()
+        assert tracker_instance.probe_escalation_rate == 1.0
+        assert new_cards == [new_card]
+
+
+def test_run_check_skips_unchanged_catalog(mocker, tracker_instance):
+    """Test that a check with an unchanged catalog digest skips cache writes."""
+    cards = [
+        Card.from_dict(
+            {
+                "id": 1,
+                "title": "Old",
+                "published_at": TIME_ONE_HOUR_AGO.isoformat(),
+                "content_hash": "abc",
+            }
+        )
+    ]
+    tracker_instance._cards_data = cards
+    tracker_instance._catalog_digest = catalog_digest(cards)
+    mocker.patch(GET_ALL_CARDS_FUNC_SIGNATURE, return_value=list(cards))
+    create_cache = mocker.patch.object(tracker_instance, "create_cache")
+
+    result = tracker_instance.run_check()
+
+    assert not result.has_changes
+    assert tracker_instance._cards_data is cards
+    assert tracker_instance.unchanged_check_count == 1
+    create_cache.assert_not_called()
+
+
+def test_run_check_connection_error_keeps_catalog(mocker, tracker_instance):
+    """Test that a crawl failing mid-way neither removes nor replaces cards."""
+    cards = [Card(id=1, published_at=TIME_ONE_HOUR_AGO)]
+    tracker_instance._cards_data = cards
+    mocker.patch(
+        "src.hazbin_tracker.core.scrapper.fetch_products_page",
+        side_effect=requests.exceptions.ConnectionError(),
+    )
+    create_cache = mocker.patch.object(tracker_instance, "create_cache")
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        tracker_instance.run_check()
+
+    assert tracker_instance._cards_data is cards
+    create_cache.assert_not_called()
+
+
+def test_run_check_partial_crawl(mocker, tracker_instance, fake_application):
+    """Test that a crawl stopped by its deadline reports no removed cards."""
+    old_card, other_card, new_card = (
+        Card.from_dict(
+            {
+                "id": index,
+                "title": f"Card {index}",
+                "published_at": published_at.isoformat(),
+            }
+        )
+        for index, published_at in (
+            (1, TIME_ONE_HOUR_AGO),
+            (2, TIME_ONE_HOUR_AGO),
+            (3, TIME_ONE_HOUR_LATER),
+        )
+    )
+    tracker_instance._cards_data = [old_card, other_card]
+    fake_application.settings.check_deadline = 30
+
+    def fake_get_all_cards(start_page=1, deadline=None, **kwargs):
+        if start_page == 1:
+            deadline.stop_at(2)
+            return [new_card, old_card]
+        return [other_card]
+
+    get_all_cards = mocker.patch(
+        GET_ALL_CARDS_FUNC_SIGNATURE, side_effect=fake_get_all_cards
+    )
+
+    result = tracker_instance.run_check()
+    assert result.partial
+    assert result.removed == []
+    assert result.new_cards == [new_card]
+    assert tracker_instance._resume_page == 2
+    assert {card.id for card in tracker_instance._cards_data} == {1, 2, 3}
+
+    result = tracker_instance.run_check()
+    assert get_all_cards.call_args.kwargs["start_page"] == 2
+    assert not result.partial
+    assert not result.removed
+    assert tracker_instance._resume_page is None
+
+
+def test_probe_check_keeps_resume_page(mocker, tracker_instance, fake_application):
+    """Test that checks which don't crawl keep the pending resume page."""
+    cards = [
+        Card.from_dict(
+            {"id": index, "title": f"Card {index}", "published_at": time.isoformat()}
+        )
+        for index, time in ((2, TIME_ONE_HOUR_LATER), (1, TIME_ONE_HOUR_AGO))
+    ]
+    tracker_instance._cards_data = cards[:1]
+    fake_application.settings.check_deadline = 30
+    fake_application.settings.head_probe = True
+
+    def fake_get_all_cards(start_page=1, deadline=None, **kwargs):
+        if start_page == 1:
+            deadline.stop_at(2)
+            return cards[:1]
+        return cards[1:]
+
+    get_all_cards = mocker.patch(
+        GET_ALL_CARDS_FUNC_SIGNATURE, side_effect=fake_get_all_cards
+    )
+    get_latest_product = mocker.patch(
+        "src.hazbin_tracker.core.cards_tracker.get_latest_product"
+    )
+    fake_application.settings.full_resync_interval = 0
+    tracker_instance.run_check()
+    assert tracker_instance._resume_page == 2
+
+    outcome = tracker_instance.compare_cards(tracker_instance.cards_data, False)
+    outcome.probe_unchanged = True
+    tracker_instance.apply_check(outcome)
+    assert tracker_instance._resume_page == 2
+
+    fake_application.settings.full_resync_interval = 12
+    tracker_instance.run_check()
+    get_latest_product.assert_not_called()
+    assert get_all_cards.call_args.kwargs["start_page"] == 2
+    assert tracker_instance._resume_page is None
+    assert {card.id for card in tracker_instance._cards_data} == {1, 2}
+
+
+def test_run_check_async(qtbot, mocker, tracker_instance, fake_new_cards_data):
+    """Test that a background check crawls off the main thread."""
+    threads = {}
+
+    def fake_get_all_cards(**kwargs):
+        threads["crawl"] = threading.get_ident()
+        return fake_new_cards_data
+
+    mocker.patch(GET_ALL_CARDS_FUNC_SIGNATURE, side_effect=fake_get_all_cards)
+    tracker_instance.check_completed.connect(
+        lambda _: threads.setdefault("apply", threading.get_ident())
+    )
+
+    handle = tracker_instance.run_check_async()
+    with qtbot.waitSignal(handle.finished, timeout=5000) as blocker:
+        pass
+
+    result = blocker.args[0]
+    assert handle.is_done()
+    assert handle.result() is result
+    assert result.new_cards == fake_new_cards_data
+    assert threads["crawl"] != threading.get_ident()
+    assert threads["apply"] == threading.get_ident()
+    assert tracker_instance._cards_data == fake_new_cards_data
+
+
+def test_qt_check_failing_to_diff_fails_handle(mocker, tracker_instance):
+    """Test that an error diffing a Qt backend crawl fails the check."""
+    handle = CheckHandle(tracker_instance.apply_check)
+    error = ValueError("boom")
+    mocker.patch.object(tracker_instance, "finish_crawl", side_effect=error)
+
+    tracker_instance._finish_qt_check(handle, [], 1, None)
+
+    assert handle.error() is error
+    assert handle.is_done()
+
+
+def test_run_check_async_cancelled(qtbot, mocker, tracker_instance, fake_new_cards_data):
+    """Test that a cancelled check leaves cards data and cache untouched."""
+    progress = []
+
+    def fake_get_all_cards(progress_callback=None, cancel_token=None, **kwargs):
+        progress_callback("first page")
+        cancel_token.cancel()
+        cancel_token.raise_if_cancelled()
+
+    mocker.patch(GET_ALL_CARDS_FUNC_SIGNATURE, side_effect=fake_get_all_cards)
+    create_cache = mocker.patch.object(tracker_instance, "create_cache")
+    tracker_instance._cards_data = []
+
+    handle = tracker_instance.run_check_async()
+    handle.progress.connect(progress.append)
+    with qtbot.waitSignal(handle.failed, timeout=5000) as blocker:
+        pass
+
+    assert isinstance(blocker.args[0], CrawlCancelled)
+    assert progress == ["first page"]
+    assert tracker_instance._cards_data == []
+    create_cache.assert_not_called()
+
+
+def test_populate_without_cache_revalidates_in_background(
+    qtbot, mocker, tracker_instance, fake_new_cards_data
+):
+    """Test that a cold start doesn't block on the network or notify."""
+    get_all_cards = mocker.patch(
+        GET_ALL_CARDS_FUNC_SIGNATURE, return_value=fake_new_cards_data
+    )
+    tracker_instance._last_check_time = None
+
+    POPULATE_CARDS_DATA(tracker_instance)
+    get_all_cards.assert_not_called()
+    assert tracker_instance.cards_data is None
+
+    with qtbot.waitSignal(tracker_instance.check_completed, timeout=5000) as blocker:
+        pass
+
+    assert not blocker.args[0].new_cards
+    assert tracker_instance.cards_data == fake_new_cards_data
+
+
+def test_cached_cards_are_parsed_on_first_access(tracker_instance):
+    """Test that startup only reads the cache summary."""
+    cards = [
+        Card(id=index, published_at=TIME_ONE_HOUR_LATER - timedelta(days=index))
+        for index in range(30)
+    ]
+    tracker_instance.storage.save_catalog(
+        CatalogSnapshot(datetime.datetime.now(datetime.UTC), cards)
+    )
+
+    tracker_instance.fetch_cards_data_from_cache()
+    assert tracker_instance._cards_data is None
+    assert tracker_instance.card_count == 30
+    assert tracker_instance.latest_publish_time == TIME_ONE_HOUR_LATER
+    assert tracker_instance.latest_published_cards == cards[:1]
+    assert tracker_instance._cards_data is None
+
+    assert tracker_instance.cards_data == cards
+
+
+def test_check_history_references_cards_by_id(tracker_instance, fake_application):
+    """Test that history records hold card summaries resolved from the catalog."""
+    fake_application.settings.check_history_size = 10
+    card = Card.from_dict(
+        {
+            "id": 7,
+            "title": "New Hazbin Card",
+            "published_at": TIME_ONE_HOUR_LATER.isoformat(),
+            "body_html": "<p>Long description</p>",
+        }
+    )
+    tracker_instance.cards_data = [card]
+
+    tracker_instance.record_check_result(CheckResult(added=[card]))
+
+    record = tracker_instance.storage.load_history()[0]
+    assert record["new_cards"] == [
+        {
+            "id": 7,
+            "title": "New Hazbin Card",
+            "published_at": TIME_ONE_HOUR_LATER.isoformat(),
+        }
+    ]
+    assert tracker_instance.find_card(7) is card
+    assert record["timestamp"] == tracker_instance.last_check_time.isoformat()
+
+
+def test_corrupt_cached_cards_are_revalidated(mocker, tracker_instance):
+    """Test that corrupt card records behind a valid header don't break checks."""
+    cards = [Card(id=index, published_at=TIME_ONE_HOUR_AGO) for index in range(3)]
+    tracker_instance.storage.save_catalog(CatalogSnapshot(TIME_ONE_HOUR_AGO, cards))
+    track_file = tracker_instance.storage.path
+    lines = track_file.read_bytes().splitlines(keepends=True)
+    track_file.write_bytes(b"".join(lines[:2]) + b"{corrupt\n")
+    single_shot = mocker.patch(
+        "src.hazbin_tracker.core.cards_tracker.QtCore.QTimer.singleShot"
+    )
+
+    tracker_instance.fetch_cards_data_from_cache()
+    assert tracker_instance.card_count == 3
+
+    assert tracker_instance.cards_data == []
+    assert tracker_instance.cards_data == []
+    single_shot.assert_called_once_with(0, tracker_instance.revalidate_cards_data)
+    assert tracker_instance._full_cache_write_due
+
+    save_catalog = mocker.patch.object(tracker_instance.storage, "save_catalog")
+    tracker_instance.archive = mocker.Mock()
+    CREATE_CACHE(tracker_instance, CheckResult(added=cards))
+    assert save_catalog.call_args.kwargs["changes"] is None
+    assert not tracker_instance._full_cache_write_due
+
+
+def test_collect_check_only_reads_tracker_state(
+    mocker, tracker_instance, fake_application
+):
+    """Test that probe counters and the publish index change on the main thread."""
+    product = {"id": 1, "title": "Old", "published_at": TIME_ONE_HOUR_AGO.isoformat()}
+    tracker_instance._cards_data = [Card.from_dict(product)]
+    fake_application.settings.head_probe = True
+    mocker.patch(
+        "src.hazbin_tracker.core.cards_tracker.get_latest_product",
+        return_value=product,
+    )
+
+    tracker_instance.prepare_check()
+    publish_index = tracker_instance._publish_index
+    outcome = tracker_instance.collect_check(tracker_instance.check_options())
+
+    assert outcome.probe_unchanged is True
+    assert tracker_instance.probe_count == 0
+    assert tracker_instance._publish_index is publish_index
+
+    tracker_instance.apply_check(outcome)
+    assert tracker_instance.probe_count == 1
+    assert tracker_instance.probe_escalation_count == 0